@@ -612,53 +612,53 @@ class AuthenticationManager:
             if not user_info:
                 raise AuthenticationError("Current password is incorrect")
 
-            # Get all password entries for the user
-            password_entries = self.db_manager.get_password_entries(session.user_id)
-
-            # Re-encrypt all password entries with new master password
+            # Get only the encrypted passwords of the user's entries
+            ciphertexts = self.db_manager.get_password_ciphertexts(session.user_id)
+
+            # Re-encrypt all password entries with new master password. Old keys are
+            # derived once per distinct salt and the new key once for the whole batch.
+            encryption = session.encryption_system
+            new_salt = encryption.generate_salt()
+            new_key = encryption.derive_key(new_password, new_salt)
+            old_keys: Dict[bytes, bytes] = {}
             updated_entries = []
 
-            for entry in password_entries:
+            for entry_id, encrypted_password in ciphertexts:
                 try:
+                    old_salt = encryption.get_salt(encrypted_password)
+                    old_key = old_keys.get(old_salt)
+                    if old_key is None:
+                        old_key = encryption.derive_key(current_password, old_salt)
+                        old_keys[old_salt] = old_key
+
                     # Decrypt with current master password
-                    decrypted_password = session.encryption_system.decrypt_password(
-                        entry["password_encrypted"], current_password
+                    decrypted_password = encryption.decrypt_password_with_key(
+                        encrypted_password, old_key
                     )
 
                     # Re-encrypt with new master password
-                    new_encrypted_password = session.encryption_system.encrypt_password(
-                        decrypted_password, new_password
+                    new_encrypted_password = encryption.encrypt_password_with_key(
+                        decrypted_password, new_key, new_salt
                     )
 
-                    updated_entries.append(
-                        {
-                            "entry_id": entry["entry_id"],
-                            "new_encrypted_password": new_encrypted_password,
-                        }
-                    )
+                    updated_entries.append((new_encrypted_password, entry_id))
 
                     # Clear decrypted password from memory
                     decrypted_password = "\x00" * len(decrypted_password)
 
                 except (DecryptionError, EncryptionError) as e:
-                    logger.error(f"Failed to re-encrypt entry {entry['entry_id']}: {e}")
+                    logger.error(f"Failed to re-encrypt entry {entry_id}: {e}")
                     raise AuthenticationError(f"Failed to re-encrypt password entry: {e}")
 
             # Update user's master password hash in database
             # Note: This would require a new method in DatabaseManager
             # For now, we'll create a new user account approach or add the method
 
-            # Update all password entries in database
-            for entry_update in updated_entries:
-                success = self.db_manager.update_password_entry(
-                    entry_update["entry_id"],
-                    session.user_id,
-                    encrypted_password=entry_update["new_encrypted_password"],
-                )
-
-                if not success:
-                    logger.error(f"Failed to update password entry {entry_update['entry_id']}")
-                    raise AuthenticationError("Failed to update password entries")
+            # Update all password entries in database in one transaction
+            updated = self.db_manager.update_password_ciphertexts(session.user_id, updated_entries)
+            if updated != len(updated_entries):
+                logger.error(f"Updated {updated} of {len(updated_entries)} password entries")
+                raise AuthenticationError("Failed to update password entries")
 
             # Update session's cached master password hash
             session.master_password_hash = self._hash_password_for_session(new_password)
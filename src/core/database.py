@@ -39,6 +39,15 @@ from typing import Any, Dict, List, Optional, Tuple
 
 import bcrypt
 
+# orjson is an optional, much faster JSON encoder used for audit log details
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 from .error_handlers import audit_action, handle_db_errors
 
 # Import new error handling system
@@ -61,6 +70,53 @@ UserAlreadyExistsError = DatabaseIntegrityError
 AccountLockedError = NewAccountLockedError
 
 
+def _convert_entry_timestamp(value: bytes) -> datetime:
+    """
+    Convert a stored CURRENT_TIMESTAMP value into a datetime
+
+    Registered as the "entry_timestamp" column converter so password entry
+    queries get datetimes straight from sqlite3 via "... [entry_timestamp]"
+    column aliases. Other queries keep returning timestamp strings.
+    """
+    return datetime.fromisoformat(value.decode("utf-8"))
+
+
+sqlite3.register_converter("entry_timestamp", _convert_entry_timestamp)
+
+
+def _encode_action_details(action_details: Optional[Dict]) -> Optional[str]:
+    """
+    Serialize security audit action details for the action_details column
+
+    Uses orjson when it is installed; both encoders produce JSON that
+    json.loads reads back identically, and both raise TypeError for values
+    that are not JSON serializable.
+    """
+    if not action_details:
+        return None
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(action_details, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(action_details)
+
+
+def _like_contains_pattern(text: str) -> str:
+    """
+    Build a LIKE pattern matching text anywhere in a column
+
+    LIKE wildcards and the escape character in text are escaped, so the pattern
+    must be used with ESCAPE '\\' and matches text literally.
+    """
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+# Password entry timestamp columns, returned as datetime objects
+ENTRY_TIMESTAMP_COLUMNS = (
+    'created_at AS "created_at [entry_timestamp]", '
+    'modified_at AS "modified_at [entry_timestamp]"'
+)
+
+
 class DatabaseManager:
     """
     Main database manager class for the Personal Password Manager
@@ -80,6 +136,23 @@ class DatabaseManager:
     # Database schema version for migrations
     SCHEMA_VERSION = 3  # Updated for entry_name field in passwords table
 
+    # Password entry inserts; the second variant skips case-insensitive duplicates
+    # of (user_id, website, username) and takes those three values again at the end
+    _INSERT_ENTRY_SQL = """
+        INSERT INTO passwords (user_id, entry_name, website, username,
+                               password_encrypted, remarks, is_favorite)
+        VALUES (?, ?, ?, ?, ?, ?, ?)
+    """
+    _INSERT_ENTRY_UNLESS_DUPLICATE_SQL = """
+        INSERT INTO passwords (user_id, entry_name, website, username,
+                               password_encrypted, remarks, is_favorite)
+        SELECT ?, ?, ?, ?, ?, ?, ?
+        WHERE NOT EXISTS (
+            SELECT 1 FROM passwords
+            WHERE user_id = ? AND LOWER(website) = LOWER(?) AND LOWER(username) = LOWER(?)
+        )
+    """
+
     # Security settings
     MAX_FAILED_ATTEMPTS = 5  # Lock account after 5 failed attempts
     LOCKOUT_DURATION_MINUTES = 30  # Lock for 30 minutes
@@ -235,7 +308,10 @@ class DatabaseManager:
             with self._lock:
                 # Create connection with timeout and row factory
                 connection = sqlite3.connect(
-                    str(self.db_path), timeout=self.connection_timeout, check_same_thread=False
+                    str(self.db_path),
+                    timeout=self.connection_timeout,
+                    check_same_thread=False,
+                    detect_types=sqlite3.PARSE_COLNAMES,
                 )
 
                 # Set row factory for dictionary-like access
@@ -378,6 +454,14 @@ class DatabaseManager:
                 """
                 )
 
+                # Case-insensitive website/username lookups (duplicate detection)
+                cursor.execute(
+                    """
+                    CREATE INDEX IF NOT EXISTS idx_passwords_user_site_user_lower
+                    ON passwords (user_id, LOWER(website), LOWER(username))
+                """
+                )
+
                 cursor.execute(
                     """
                     CREATE INDEX IF NOT EXISTS idx_users_username
@@ -682,7 +766,9 @@ class DatabaseManager:
         encrypted_password: bytes,
         remarks: str = "",
         entry_name: str = None,
-    ) -> int:
+        is_favorite: bool = False,
+        reject_duplicates: bool = False,
+    ) -> Optional[int]:
         """
         Add a new password entry for a user
 
@@ -693,19 +779,26 @@ class DatabaseManager:
             encrypted_password (bytes): AES-256 encrypted password
             remarks (str): Optional remarks/notes
             entry_name (str): Optional custom name/label for the entry
+            is_favorite (bool): Whether to mark the entry as a favorite
+            reject_duplicates (bool): Refuse the insert if the user already has an entry
+                for the same website and username (case-insensitive), checked in the
+                same statement as the insert
 
         Returns:
-            int: Entry ID of the created password entry
+            Optional[int]: Entry ID of the created password entry, or None if
+            reject_duplicates is set and the entry already exists
 
         Raises:
             DatabaseError: If entry creation fails
             ValueError: If required parameters are invalid
         """
-        # Validate input parameters
-        if not website or not website.strip():
+        # Validate input parameters (each value is stripped once)
+        website = website.strip() if website else ""
+        if not website:
             raise ValueError("Website cannot be empty")
 
-        if not username or not username.strip():
+        username = username.strip() if username else ""
+        if not username:
             raise ValueError("Username cannot be empty")
 
         if not encrypted_password:
@@ -721,25 +814,30 @@ class DatabaseManager:
                     raise ValueError(f"User ID {user_id} does not exist")
 
                 # Prepare entry_name (strip if provided, otherwise NULL)
-                prepared_entry_name = (
-                    entry_name.strip() if entry_name and entry_name.strip() else None
+                prepared_entry_name = (entry_name.strip() if entry_name else "") or None
+
+                values = (
+                    user_id,
+                    prepared_entry_name,
+                    website,
+                    username,
+                    encrypted_password,
+                    remarks.strip(),
+                    bool(is_favorite),
                 )
 
                 # Insert password entry
-                cursor.execute(
-                    """
-                    INSERT INTO passwords (user_id, entry_name, website, username, password_encrypted, remarks)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        user_id,
-                        prepared_entry_name,
-                        website.strip(),
-                        username.strip(),
-                        encrypted_password,
-                        remarks.strip(),
-                    ),
-                )
+                if reject_duplicates:
+                    cursor.execute(
+                        self._INSERT_ENTRY_UNLESS_DUPLICATE_SQL,
+                        values + (user_id, website, username),
+                    )
+                    if cursor.rowcount == 0:
+                        # A duplicate is an expected outcome, not a database error
+                        logger.debug(f"Password entry already exists for user {user_id}")
+                        return None
+                else:
+                    cursor.execute(self._INSERT_ENTRY_SQL, values)
 
                 entry_id = cursor.lastrowid
                 conn.commit()
@@ -758,6 +856,90 @@ class DatabaseManager:
                 user_message="Could not save password entry. Please try again.",
             )
 
+    @handle_db_errors("Failed to add password entries")
+    def add_password_entries(
+        self,
+        user_id: int,
+        entries: List[Tuple[Optional[str], str, str, bytes, str, bool]],
+        reject_duplicates: bool = False,
+    ) -> int:
+        """
+        Add many password entries for a user in a single transaction
+
+        Args:
+            user_id (int): ID of the user owning the passwords
+            entries (List[Tuple]): (entry_name, website, username, encrypted_password,
+                remarks, is_favorite) per entry
+            reject_duplicates (bool): Skip entries whose website and username
+                (case-insensitive) already exist, including earlier rows of this batch
+
+        Returns:
+            int: Number of entries inserted
+
+        Raises:
+            DatabaseError: If the batch insert fails (nothing is inserted)
+            ValueError: If required parameters are invalid
+        """
+        rows = []
+        for entry_name, website, username, encrypted_password, remarks, is_favorite in entries:
+            website = website.strip() if website else ""
+            if not website:
+                raise ValueError("Website cannot be empty")
+            username = username.strip() if username else ""
+            if not username:
+                raise ValueError("Username cannot be empty")
+            if not encrypted_password:
+                raise ValueError("Encrypted password cannot be empty")
+
+            row = (
+                user_id,
+                (entry_name.strip() if entry_name else "") or None,
+                website,
+                username,
+                encrypted_password,
+                (remarks or "").strip(),
+                bool(is_favorite),
+            )
+            if reject_duplicates:
+                row += (user_id, website, username)
+            rows.append(row)
+
+        if not rows:
+            return 0
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                # Verify user exists
+                cursor.execute("SELECT user_id FROM users WHERE user_id = ?", (user_id,))
+                if not cursor.fetchone():
+                    raise ValueError(f"User ID {user_id} does not exist")
+
+                sql = (
+                    self._INSERT_ENTRY_UNLESS_DUPLICATE_SQL
+                    if reject_duplicates
+                    else self._INSERT_ENTRY_SQL
+                )
+                cursor.executemany(sql, rows)
+                inserted = cursor.rowcount
+                conn.commit()
+
+                logger.info(
+                    f"Bulk created {inserted} of {len(rows)} password entries for user {user_id}"
+                )
+                return inserted
+
+        except ValueError:
+            raise
+        except Exception as e:
+            log_exception(logger, e, "Failed to add password entries")
+            raise DatabaseException(
+                f"Bulk password entry creation failed: {e}",
+                error_code="DB001",
+                user_message="Could not save password entries. Please try again.",
+            )
+
     @handle_db_errors("Failed to retrieve password entries")
     def get_password_entries(self, user_id: int, website: str = None) -> List[Dict[str, Any]]:
         """
@@ -821,6 +1003,136 @@ class DatabaseManager:
                 user_message="Could not load password entries. Please try again.",
             )
 
+    @handle_db_errors("Failed to retrieve password entry")
+    def get_password_entry_by_id(self, user_id: int, entry_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a single password entry owned by a user
+
+        Args:
+            user_id (int): ID of the user
+            entry_id (int): ID of the password entry
+
+        Returns:
+            Optional[Dict[str, Any]]: Password entry, or None if not found for this user
+
+        Raises:
+            DatabaseError: If retrieval fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    f"""
+                    SELECT entry_id, entry_name, website, username, password_encrypted, remarks,
+                           {ENTRY_TIMESTAMP_COLUMNS}, is_favorite
+                    FROM passwords
+                    WHERE entry_id = ? AND user_id = ?
+                    LIMIT 1
+                """,
+                    (entry_id, user_id),
+                )
+
+                row = cursor.fetchone()
+                return dict(row) if row else None
+
+        except Exception as e:
+            log_exception(logger, e, f"Failed to retrieve password entry {entry_id}")
+            raise DatabaseException(
+                f"Password entry retrieval failed: {e}",
+                error_code="DB001",
+                user_message="Could not load password entry. Please try again.",
+            )
+
+    @handle_db_errors("Failed to check for existing password entry")
+    def exists_password_entry(self, user_id: int, website: str, username: str) -> bool:
+        """
+        Check whether a user already has an entry for a website and username
+
+        Args:
+            user_id (int): ID of the user
+            website (str): Website to look for (case-insensitive)
+            username (str): Username to look for (case-insensitive)
+
+        Returns:
+            bool: True if a matching entry exists
+
+        Raises:
+            DatabaseError: If the lookup fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT 1 FROM passwords
+                    WHERE user_id = ? AND LOWER(website) = LOWER(?) AND LOWER(username) = LOWER(?)
+                    LIMIT 1
+                """,
+                    (user_id, website.strip(), username.strip()),
+                )
+                return cursor.fetchone() is not None
+
+        except Exception as e:
+            log_exception(logger, e, "Failed to check for existing password entry")
+            raise DatabaseException(
+                f"Password entry lookup failed: {e}",
+                error_code="DB001",
+                user_message="Could not check for existing entries. Please try again.",
+            )
+
+    @handle_db_errors("Failed to retrieve password entries")
+    def get_password_entries_by_ids(
+        self, user_id: int, entry_ids: List[int]
+    ) -> List[Dict[str, Any]]:
+        """
+        Retrieve specific password entries owned by a user
+
+        Args:
+            user_id (int): ID of the user
+            entry_ids (List[int]): IDs of the entries to retrieve
+
+        Returns:
+            List[Dict[str, Any]]: Matching password entries (entries of other users are skipped)
+
+        Raises:
+            DatabaseError: If retrieval fails
+        """
+        unique_ids = list(dict.fromkeys(entry_ids))
+        if not unique_ids:
+            return []
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                entries = []
+
+                # Stay under SQLite's default bound-parameter limit
+                chunk_size = 500
+                for start in range(0, len(unique_ids), chunk_size):
+                    chunk = unique_ids[start : start + chunk_size]
+                    placeholders = ", ".join("?" * len(chunk))
+                    cursor.execute(
+                        f"""
+                        SELECT entry_id, entry_name, website, username, password_encrypted,
+                               remarks, {ENTRY_TIMESTAMP_COLUMNS}, is_favorite
+                        FROM passwords
+                        WHERE user_id = ? AND entry_id IN ({placeholders})
+                    """,
+                        (user_id, *chunk),
+                    )
+                    entries.extend(dict(row) for row in cursor.fetchall())
+
+                return entries
+
+        except Exception as e:
+            log_exception(logger, e, "Failed to retrieve password entries by ID")
+            raise DatabaseException(
+                f"Password entry retrieval failed: {e}",
+                error_code="DB001",
+                user_message="Could not load password entries. Please try again.",
+            )
+
     def get_password_entries_advanced(
         self,
         user_id: int,
@@ -833,6 +1145,9 @@ class DatabaseManager:
         limit: int = None,
         offset: int = 0,
         order_by: str = "website",
+        sort_order: str = "asc",
+        count_total: bool = True,
+        metadata_only: bool = False,
     ) -> Tuple[List[Dict[str, Any]], int]:
         """
         Retrieve password entries with advanced SQL-based filtering and pagination
@@ -850,7 +1165,13 @@ class DatabaseManager:
             date_to (str, optional): Filter by created date (ISO format: YYYY-MM-DD)
             limit (int, optional): Maximum number of entries to return (for pagination)
             offset (int): Number of entries to skip (for pagination)
-            order_by (str): Column to sort by (default: "website")
+            order_by (str): Column to sort by (default: "website"); "favorite" sorts
+                favorites together, then by website
+            sort_order (str): "asc" or "desc" (default: "asc")
+            count_total (bool): Run a COUNT query for the total; when False the total is
+                the number of returned entries
+            metadata_only (bool): Select only (entry_id, website, username, is_favorite)
+                and return each entry as a plain tuple in that order
 
         Returns:
             Tuple[List[Dict[str, Any]], int]: (List of password entries, Total count)
@@ -868,12 +1189,25 @@ class DatabaseManager:
                 offset=0
             )
         """
-        # Validate order_by to prevent SQL injection
-        valid_order_columns = ["website", "username", "created_at", "modified_at", "entry_name"]
+        # Validate order_by to prevent SQL injection (text columns sort case-insensitively)
+        valid_order_columns = {
+            "website": "LOWER(website)",
+            "username": "LOWER(username)",
+            "created_at": "created_at",
+            "modified_at": "modified_at",
+            "entry_name": "LOWER(entry_name)",
+            "favorite": "is_favorite",
+        }
         if order_by not in valid_order_columns:
             logger.warning(f"Invalid order_by column '{order_by}', defaulting to 'website'")
             order_by = "website"
 
+        direction = "DESC" if str(sort_order).lower() == "desc" else "ASC"
+        if order_by == "favorite":
+            order_clause = f"is_favorite {direction}, LOWER(website) {direction}"
+        else:
+            order_clause = f"{valid_order_columns[order_by]} {direction}, LOWER(username)"
+
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
@@ -889,40 +1223,51 @@ class DatabaseManager:
                     website_pattern = f"%{website.strip()}%"
                     query_params.extend([website_pattern, website_pattern])
 
+                # Username and remarks are matched as plain substrings, like the
+                # in-memory filters they replaced
                 if username:
-                    where_conditions.append("LOWER(username) LIKE LOWER(?)")
-                    query_params.append(f"%{username.strip()}%")
+                    where_conditions.append("LOWER(username) LIKE LOWER(?) ESCAPE '\\'")
+                    query_params.append(_like_contains_pattern(username.strip()))
 
                 if remarks:
-                    where_conditions.append("LOWER(remarks) LIKE LOWER(?)")
-                    query_params.append(f"%{remarks.strip()}%")
+                    where_conditions.append("LOWER(remarks) LIKE LOWER(?) ESCAPE '\\'")
+                    query_params.append(_like_contains_pattern(remarks.strip()))
 
                 if is_favorite is not None:
                     where_conditions.append("is_favorite = ?")
                     query_params.append(1 if is_favorite else 0)
 
+                # datetime() normalizes "YYYY-MM-DD HH:MM:SS" and ISO "T" separated values
                 if date_from:
-                    where_conditions.append("created_at >= ?")
+                    where_conditions.append("datetime(created_at) >= datetime(?)")
                     query_params.append(date_from)
 
                 if date_to:
-                    where_conditions.append("created_at <= ?")
+                    where_conditions.append("datetime(created_at) <= datetime(?)")
                     query_params.append(date_to)
 
                 where_clause = " AND ".join(where_conditions)
 
                 # First, get total count (for pagination info)
-                count_query = f"SELECT COUNT(*) as total FROM passwords WHERE {where_clause}"
-                cursor.execute(count_query, query_params)
-                total_count = cursor.fetchone()["total"]
+                total_count = None
+                if count_total:
+                    count_query = f"SELECT COUNT(*) as total FROM passwords WHERE {where_clause}"
+                    cursor.execute(count_query, query_params)
+                    total_count = cursor.fetchone()["total"]
 
                 # Build main query with optional pagination
-                main_query = """
-                    SELECT entry_id, entry_name, website, username, password_encrypted, remarks,
-                           created_at, modified_at, is_favorite
+                if metadata_only:
+                    columns = "entry_id, website, username, is_favorite"
+                else:
+                    columns = (
+                        "entry_id, entry_name, website, username, password_encrypted, remarks, "
+                        f"{ENTRY_TIMESTAMP_COLUMNS}, is_favorite"
+                    )
+                main_query = f"""
+                    SELECT {columns}
                     FROM passwords
                     WHERE {where_clause}
-                    ORDER BY {order_by}, username
+                    ORDER BY {order_clause}
                 """
 
                 # Add pagination if limit is specified
@@ -930,12 +1275,19 @@ class DatabaseManager:
                     main_query += " LIMIT ? OFFSET ?"
                     query_params.extend([limit, offset])
 
+                if metadata_only:
+                    # Plain tuples, no per-row dict
+                    cursor.row_factory = None
+
                 cursor.execute(main_query, query_params)
 
-                entries = []
-                for row in cursor.fetchall():
-                    entry = dict(row)
-                    entries.append(entry)
+                if metadata_only:
+                    entries = cursor.fetchall()
+                else:
+                    entries = [dict(row) for row in cursor.fetchall()]
+
+                if total_count is None:
+                    total_count = len(entries)
 
                 logger.info(
                     f"Retrieved {len(entries)} of {total_count} password entries for user {user_id} "
@@ -960,6 +1312,124 @@ class DatabaseManager:
                 user_message="Could not load password entries. Please try again.",
             )
 
+    @handle_db_errors("Failed to retrieve password entry")
+    def get_one_password_entry(self, user_id: int) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve a single password entry of a user (for master password checks)
+
+        Args:
+            user_id (int): ID of the user
+
+        Returns:
+            Optional[Dict[str, Any]]: entry_id and password_encrypted, or None if
+            the user has no entries
+
+        Raises:
+            DatabaseError: If retrieval fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(
+                    """
+                    SELECT entry_id, password_encrypted FROM passwords
+                    WHERE user_id = ?
+                    LIMIT 1
+                """,
+                    (user_id,),
+                )
+                row = cursor.fetchone()
+                return dict(row) if row else None
+
+        except Exception as e:
+            log_exception(logger, e, "Failed to retrieve password entry")
+            raise DatabaseException(
+                f"Password entry retrieval failed: {e}",
+                error_code="DB001",
+                user_message="Could not load password entries. Please try again.",
+            )
+
+    @handle_db_errors("Failed to retrieve password entries")
+    def get_password_ciphertexts(self, user_id: int) -> List[Tuple[int, bytes]]:
+        """
+        Retrieve only the entry IDs and encrypted passwords of a user's entries
+
+        Args:
+            user_id (int): ID of the user
+
+        Returns:
+            List[Tuple[int, bytes]]: (entry_id, password_encrypted) per entry
+
+        Raises:
+            DatabaseError: If retrieval fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.arraysize = 500
+                cursor.execute(
+                    "SELECT entry_id, password_encrypted FROM passwords WHERE user_id = ?",
+                    (user_id,),
+                )
+
+                ciphertexts = []
+                rows = cursor.fetchmany()
+                while rows:
+                    ciphertexts.extend((row[0], row[1]) for row in rows)
+                    rows = cursor.fetchmany()
+
+                return ciphertexts
+
+        except Exception as e:
+            log_exception(logger, e, "Failed to retrieve encrypted passwords")
+            raise DatabaseException(
+                f"Password entry retrieval failed: {e}",
+                error_code="DB001",
+                user_message="Could not load password entries. Please try again.",
+            )
+
+    @handle_db_errors("Failed to update password entries")
+    def update_password_ciphertexts(self, user_id: int, updates: List[Tuple[bytes, int]]) -> int:
+        """
+        Replace the encrypted passwords of many entries in a single transaction
+
+        Args:
+            user_id (int): ID of the user owning the entries
+            updates (List[Tuple[bytes, int]]): (new password_encrypted, entry_id) per entry
+
+        Returns:
+            int: Number of entries updated (entries of other users are not touched)
+
+        Raises:
+            DatabaseError: If the update fails (no entry is changed)
+        """
+        if not updates:
+            return 0
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    UPDATE passwords SET password_encrypted = ?
+                    WHERE entry_id = ? AND user_id = ?
+                """,
+                    [(encrypted, entry_id, user_id) for encrypted, entry_id in updates],
+                )
+                updated = cursor.rowcount
+                conn.commit()
+
+                logger.info(f"Re-encrypted {updated} password entries for user {user_id}")
+                return updated
+
+        except Exception as e:
+            log_exception(logger, e, "Failed to update encrypted passwords")
+            raise DatabaseException(
+                f"Password entry update failed: {e}",
+                error_code="DB001",
+                user_message="Could not update password entries. Please try again.",
+            )
+
     @handle_db_errors("Failed to update password entry")
     @audit_action(
         "UPDATE_PASSWORD", lambda args, kwargs: args[2] if len(args) > 2 else kwargs.get("user_id")
@@ -1210,6 +1680,91 @@ class DatabaseManager:
                 user_message="Could not load statistics. Please try again.",
             )
 
+    def get_password_entry_aggregates(self, user_id: int, recent_days: int = 30) -> Dict[str, Any]:
+        """
+        Aggregate website/username usage for a user's password entries in SQL
+
+        Args:
+            user_id (int): ID of the user
+            recent_days (int): Window for counting recently created entries
+
+        Returns:
+            Dict[str, Any]: Aggregates with keys:
+                - website_counts: [(website, count)] for every lowercased website,
+                  ordered by website
+                - top_usernames: [(username, count)] for the 5 most used lowercased usernames
+                - duplicate_usernames: Number of usernames used by more than one entry
+                - recent_entries: Entries created within recent_days
+
+        Raises:
+            DatabaseError: If aggregation fails
+        """
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+
+                cursor.execute(
+                    """
+                    SELECT LOWER(website) AS website, COUNT(*) AS count FROM passwords
+                    WHERE user_id = ?
+                    GROUP BY LOWER(website)
+                    ORDER BY website
+                """,
+                    (user_id,),
+                )
+                website_counts = [(row["website"], row["count"]) for row in cursor.fetchall()]
+
+                cursor.execute(
+                    """
+                    SELECT LOWER(username) AS username, COUNT(*) AS count FROM passwords
+                    WHERE user_id = ?
+                    GROUP BY LOWER(username)
+                    ORDER BY count DESC, username
+                    LIMIT 5
+                """,
+                    (user_id,),
+                )
+                top_usernames = [(row["username"], row["count"]) for row in cursor.fetchall()]
+
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) AS duplicates FROM (
+                        SELECT 1 FROM passwords
+                        WHERE user_id = ?
+                        GROUP BY LOWER(username)
+                        HAVING COUNT(*) > 1
+                    )
+                """,
+                    (user_id,),
+                )
+                duplicate_usernames = cursor.fetchone()["duplicates"]
+
+                # created_at holds CURRENT_TIMESTAMP text, which sorts chronologically,
+                # so compare it against one cutoff string instead of parsing every row
+                cursor.execute(
+                    """
+                    SELECT COUNT(*) AS recent FROM passwords
+                    WHERE user_id = ? AND created_at >= datetime('now', ?)
+                """,
+                    (user_id, f"-{int(recent_days)} days"),
+                )
+                recent_entries = cursor.fetchone()["recent"]
+
+                return {
+                    "website_counts": website_counts,
+                    "top_usernames": top_usernames,
+                    "duplicate_usernames": duplicate_usernames,
+                    "recent_entries": recent_entries,
+                }
+
+        except Exception as e:
+            log_exception(logger, e, "Failed to aggregate password entries")
+            raise DatabaseException(
+                f"Statistics retrieval failed: {e}",
+                error_code="DB001",
+                user_message="Could not load statistics. Please try again.",
+            )
+
     # ========================================================================
     # Two-Factor Authentication (2FA) Methods
     # ========================================================================
@@ -1737,7 +2292,7 @@ class DatabaseManager:
                 cursor = conn.cursor()
 
                 # Convert action_details dict to JSON string
-                details_json = json.dumps(action_details) if action_details else None
+                details_json = _encode_action_details(action_details)
 
                 cursor.execute(
                     """
@@ -1769,6 +2324,71 @@ class DatabaseManager:
             logger.error(f"Failed to log security event: {e}")
             return False
 
+    def log_security_events(self, events: List[Tuple]) -> int:
+        """
+        Log a batch of security events to the audit log in one transaction
+
+        Args:
+            events (List[Tuple]): One (user_id, session_id, action_type, action_result,
+                target_entry_id, error_message, action_details, security_level,
+                risk_score, execution_time_ms) tuple per event, in the order and with
+                the meaning of log_security_event's parameters
+
+        Returns:
+            int: Number of events logged (0 if the batch failed)
+        """
+        if not events:
+            return 0
+
+        rows = [
+            (
+                user_id,
+                session_id,
+                action_type,
+                action_result,
+                target_entry_id,
+                error_message,
+                _encode_action_details(action_details),
+                security_level,
+                risk_score,
+                execution_time_ms,
+            )
+            for (
+                user_id,
+                session_id,
+                action_type,
+                action_result,
+                target_entry_id,
+                error_message,
+                action_details,
+                security_level,
+                risk_score,
+                execution_time_ms,
+            ) in events
+        ]
+
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.executemany(
+                    """
+                    INSERT INTO security_audit_log
+                    (user_id, session_id, action_type, action_result, target_entry_id,
+                     error_message, action_details, security_level, risk_score,
+                     execution_time_ms, client_version)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, '2.2.0')
+                """,
+                    rows,
+                )
+
+                conn.commit()
+                logger.debug(f"Logged {len(rows)} security events")
+                return len(rows)
+
+        except sqlite3.Error as e:
+            logger.error(f"Failed to log security events: {e}")
+            return 0
+
     def get_security_audit_log(
         self,
         user_id: Optional[int] = None,
@@ -29,7 +29,7 @@ Version: 2.2.0
 
 import secrets
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from cryptography.hazmat.backends import default_backend
 from cryptography.hazmat.primitives import hashes, padding
@@ -57,6 +57,9 @@ InvalidKeyError = InvalidMasterPasswordError
 # For corrupted data, we'll use DecryptionError as it's close enough
 CorruptedDataError = NewDecryptionError
 
+# OpenSSL backend (AES-NI accelerated), resolved once instead of per operation
+_BACKEND = default_backend()
+
 
 class PasswordEncryption:
     """
@@ -89,6 +92,9 @@ class PasswordEncryption:
     # AES block size
     BLOCK_SIZE = 16  # 128 bits
 
+    # PKCS7 padding for AES blocks; padder()/unpadder() contexts are per call
+    _PKCS7 = padding.PKCS7(BLOCK_SIZE * 8)  # bits not bytes
+
     def __init__(self, pbkdf2_iterations: OptionalInt = None) -> None:
         """
         Initialize the encryption system
@@ -188,7 +194,7 @@ class PasswordEncryption:
                 length=self.KEY_LENGTH,
                 salt=salt,
                 iterations=iterations,
-                backend=default_backend(),
+                backend=_BACKEND,
             )
 
             # Derive key (this is computationally expensive by design)
@@ -237,40 +243,16 @@ class PasswordEncryption:
             raise EncryptionError("Master password cannot be empty")
 
         try:
-            # Generate unique salt and IV for this encryption
+            # Generate unique salt for this encryption
             salt = self.generate_salt()
-            iv = self.generate_iv()
 
             # Derive encryption key from master password
             encryption_key = self.derive_key(master_password, salt)
 
-            # Convert plaintext to bytes
-            plaintext_bytes = plaintext_password.encode("utf-8")
-
-            # Apply PKCS7 padding to ensure proper block size
-            padder = padding.PKCS7(self.BLOCK_SIZE * 8).padder()  # bits not bytes
-            padded_data = padder.update(plaintext_bytes)
-            padded_data += padder.finalize()
-
-            # Create AES cipher in CBC mode
-            cipher = Cipher(
-                algorithm=algorithms.AES(encryption_key),
-                mode=modes.CBC(iv),
-                backend=default_backend(),
-            )
-            encryptor = cipher.encryptor()
-
-            # Perform encryption
-            ciphertext = encryptor.update(padded_data) + encryptor.finalize()
-
-            # Combine version, salt, IV, and ciphertext for storage
-            # Format: VERSION(1) + SALT(32) + IV(16) + CIPHERTEXT(variable)
-            encrypted_blob = self.VERSION + salt + iv + ciphertext
+            encrypted_blob = self._encrypt_plaintext(plaintext_password, salt, encryption_key)
 
             # Clear sensitive data from memory
             encryption_key = b"\x00" * len(encryption_key)
-            plaintext_bytes = b"\x00" * len(plaintext_bytes)
-            padded_data = b"\x00" * len(padded_data)
 
             logger.debug(f"Password encrypted successfully, blob size: {len(encrypted_blob)} bytes")
             return encrypted_blob
@@ -281,6 +263,85 @@ class PasswordEncryption:
             logger.error(f"Encryption failed: {e}")
             raise EncryptionError(f"Encryption failed: {e}")
 
+    @handle_security_errors("Password encryption failed")
+    def encrypt_password_with_key(
+        self, plaintext_password: str, encryption_key: bytes, salt: bytes
+    ) -> bytes:
+        """
+        Encrypt a password with a key that was already derived for a salt
+
+        Lets bulk operations run PBKDF2 once for a batch: every blob of the batch
+        records the same salt but gets its own random IV, and stays readable by
+        decrypt_password().
+
+        Args:
+            plaintext_password (str): Password to encrypt
+            encryption_key (bytes): Key from derive_key() for the salt
+            salt (bytes): Salt the key was derived with
+
+        Returns:
+            bytes: Encrypted data blob containing version, salt, IV, and ciphertext
+
+        Raises:
+            EncryptionError: If encryption fails
+        """
+        if not plaintext_password:
+            raise EncryptionError("Plaintext password cannot be empty")
+
+        if len(salt) != self.SALT_LENGTH:
+            raise InvalidKeyError(f"Salt must be {self.SALT_LENGTH} bytes")
+
+        try:
+            return self._encrypt_plaintext(plaintext_password, salt, encryption_key)
+
+        except (EncryptionError, InvalidKeyError):
+            raise
+        except Exception as e:
+            logger.error(f"Encryption failed: {e}")
+            raise EncryptionError(f"Encryption failed: {e}")
+
+    def _encrypt_plaintext(
+        self, plaintext_password: str, salt: bytes, encryption_key: bytes
+    ) -> bytes:
+        """
+        Encrypt plaintext under a fresh IV and pack it into the storage format
+
+        Args:
+            plaintext_password (str): Password to encrypt
+            salt (bytes): Salt the key was derived with (stored in the blob)
+            encryption_key (bytes): AES-256 key
+
+        Returns:
+            bytes: VERSION(1) + SALT(32) + IV(16) + CIPHERTEXT(variable)
+        """
+        iv = self.generate_iv()
+
+        # Convert plaintext to bytes
+        plaintext_bytes = plaintext_password.encode("utf-8")
+
+        # Apply PKCS7 padding to ensure proper block size
+        padder = self._PKCS7.padder()
+        padded_data = padder.update(plaintext_bytes)
+        padded_data += padder.finalize()
+
+        # Create AES cipher in CBC mode
+        cipher = Cipher(
+            algorithm=algorithms.AES(encryption_key),
+            mode=modes.CBC(iv),
+            backend=_BACKEND,
+        )
+        encryptor = cipher.encryptor()
+
+        # Perform encryption
+        ciphertext = encryptor.update(padded_data) + encryptor.finalize()
+
+        # Clear sensitive data from memory
+        plaintext_bytes = b"\x00" * len(plaintext_bytes)
+        padded_data = b"\x00" * len(padded_data)
+
+        # Combine version, salt, IV, and ciphertext for storage
+        return self.VERSION + salt + iv + ciphertext
+
     @handle_security_errors("Password decryption failed")
     @monitor_performance(threshold_ms=2000)  # Alert if decryption takes > 2s
     def decrypt_password(self, encrypted_blob: bytes, master_password: str) -> str:
@@ -312,67 +373,53 @@ class PasswordEncryption:
             raise DecryptionError("Master password cannot be empty")
 
         try:
-            # Validate minimum blob size
-            min_size = len(self.VERSION) + self.SALT_LENGTH + self.IV_LENGTH + self.BLOCK_SIZE
-            if len(encrypted_blob) < min_size:
-                raise CorruptedDataError(
-                    f"Encrypted blob too short: {len(encrypted_blob)} < {min_size}"
-                )
-
             # Parse encrypted blob components
-            offset = 0
-
-            # Extract version
-            version = encrypted_blob[offset : offset + len(self.VERSION)]
-            offset += len(self.VERSION)
+            salt, iv, ciphertext = self._parse_encrypted_blob(encrypted_blob)
 
-            if version != self.VERSION:
-                raise CorruptedDataError(f"Unsupported version: {version.hex()}")
-
-            # Extract salt
-            salt = encrypted_blob[offset : offset + self.SALT_LENGTH]
-            offset += self.SALT_LENGTH
+            # Derive decryption key using the same parameters
+            decryption_key = self.derive_key(master_password, salt)
 
-            # Extract IV
-            iv = encrypted_blob[offset : offset + self.IV_LENGTH]
-            offset += self.IV_LENGTH
+            plaintext_password = self._decrypt_ciphertext(ciphertext, iv, decryption_key)
 
-            # Extract ciphertext
-            ciphertext = encrypted_blob[offset:]
+            # Clear sensitive data from memory
+            decryption_key = b"\x00" * len(decryption_key)
 
-            # Validate ciphertext length (must be multiple of block size)
-            if len(ciphertext) % self.BLOCK_SIZE != 0:
-                raise CorruptedDataError("Invalid ciphertext length - not multiple of block size")
+            logger.debug("Password decrypted successfully")
+            return plaintext_password
 
-            # Derive decryption key using the same parameters
-            decryption_key = self.derive_key(master_password, salt)
+        except (DecryptionError, CorruptedDataError, InvalidKeyError):
+            raise
+        except UnicodeDecodeError:
+            raise CorruptedDataError("Decrypted data is not valid UTF-8")
+        except Exception as e:
+            logger.error(f"Decryption failed: {e}")
+            raise DecryptionError(f"Decryption failed: {e}")
 
-            # Create AES cipher in CBC mode
-            cipher = Cipher(
-                algorithm=algorithms.AES(decryption_key),
-                mode=modes.CBC(iv),
-                backend=default_backend(),
-            )
-            decryptor = cipher.decryptor()
+    @handle_security_errors("Password decryption failed")
+    def decrypt_password_with_key(self, encrypted_blob: bytes, decryption_key: bytes) -> str:
+        """
+        Decrypt a password with a key that was already derived for its salt
 
-            # Perform decryption
-            padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+        Lets bulk operations run PBKDF2 once per distinct salt (see get_salt())
+        instead of once per entry.
 
-            # Remove PKCS7 padding
-            unpadder = padding.PKCS7(self.BLOCK_SIZE * 8).unpadder()
-            plaintext_bytes = unpadder.update(padded_plaintext)
-            plaintext_bytes += unpadder.finalize()
+        Args:
+            encrypted_blob (bytes): Encrypted data blob from encrypt_password()
+            decryption_key (bytes): Key from derive_key() for the blob's salt
 
-            # Convert back to string
-            plaintext_password = plaintext_bytes.decode("utf-8")
+        Returns:
+            str: Decrypted plaintext password
 
-            # Clear sensitive data from memory
-            decryption_key = b"\x00" * len(decryption_key)
-            padded_plaintext = b"\x00" * len(padded_plaintext)
-            plaintext_bytes = b"\x00" * len(plaintext_bytes)
+        Raises:
+            DecryptionError: If decryption fails
+            CorruptedDataError: If encrypted data is corrupted
+        """
+        if not encrypted_blob:
+            raise DecryptionError("Encrypted blob cannot be empty")
 
-            logger.debug("Password decrypted successfully")
-            return plaintext_password
+        try:
+            _, iv, ciphertext = self._parse_encrypted_blob(encrypted_blob)
+            return self._decrypt_ciphertext(ciphertext, iv, decryption_key)
 
         except (DecryptionError, CorruptedDataError, InvalidKeyError):
             raise
@@ -382,6 +429,105 @@ class PasswordEncryption:
             logger.error(f"Decryption failed: {e}")
             raise DecryptionError(f"Decryption failed: {e}")
 
+    def get_salt(self, encrypted_blob: bytes) -> bytes:
+        """
+        Extract the key derivation salt from an encrypted blob
+
+        Args:
+            encrypted_blob (bytes): Encrypted data blob
+
+        Returns:
+            bytes: 32-byte salt used to derive the blob's key
+
+        Raises:
+            CorruptedDataError: If blob format is invalid
+        """
+        salt, _, _ = self._parse_encrypted_blob(encrypted_blob)
+        return salt
+
+    def _parse_encrypted_blob(self, encrypted_blob: bytes) -> Tuple[bytes, bytes, bytes]:
+        """
+        Split an encrypted blob into salt, IV and ciphertext
+
+        Args:
+            encrypted_blob (bytes): Encrypted data blob
+
+        Returns:
+            Tuple[bytes, bytes, bytes]: (salt, iv, ciphertext)
+
+        Raises:
+            CorruptedDataError: If blob format is invalid
+        """
+        # Validate minimum blob size
+        min_size = len(self.VERSION) + self.SALT_LENGTH + self.IV_LENGTH + self.BLOCK_SIZE
+        if len(encrypted_blob) < min_size:
+            raise CorruptedDataError(
+                f"Encrypted blob too short: {len(encrypted_blob)} < {min_size}"
+            )
+
+        offset = 0
+
+        # Extract version
+        version = encrypted_blob[offset : offset + len(self.VERSION)]
+        offset += len(self.VERSION)
+
+        if version != self.VERSION:
+            raise CorruptedDataError(f"Unsupported version: {version.hex()}")
+
+        # Extract salt
+        salt = encrypted_blob[offset : offset + self.SALT_LENGTH]
+        offset += self.SALT_LENGTH
+
+        # Extract IV
+        iv = encrypted_blob[offset : offset + self.IV_LENGTH]
+        offset += self.IV_LENGTH
+
+        # Extract ciphertext
+        ciphertext = encrypted_blob[offset:]
+
+        # Validate ciphertext length (must be multiple of block size)
+        if len(ciphertext) % self.BLOCK_SIZE != 0:
+            raise CorruptedDataError("Invalid ciphertext length - not multiple of block size")
+
+        return salt, iv, ciphertext
+
+    def _decrypt_ciphertext(self, ciphertext: bytes, iv: bytes, decryption_key: bytes) -> str:
+        """
+        Decrypt AES-256-CBC ciphertext and remove PKCS7 padding
+
+        Args:
+            ciphertext (bytes): Ciphertext to decrypt
+            iv (bytes): Initialization vector
+            decryption_key (bytes): 32-byte AES key
+
+        Returns:
+            str: Decrypted plaintext password
+        """
+        # Create AES cipher in CBC mode
+        cipher = Cipher(
+            algorithm=algorithms.AES(decryption_key),
+            mode=modes.CBC(iv),
+            backend=_BACKEND,
+        )
+        decryptor = cipher.decryptor()
+
+        # Perform decryption
+        padded_plaintext = decryptor.update(ciphertext) + decryptor.finalize()
+
+        # Remove PKCS7 padding
+        unpadder = self._PKCS7.unpadder()
+        plaintext_bytes = unpadder.update(padded_plaintext)
+        plaintext_bytes += unpadder.finalize()
+
+        # Convert back to string
+        plaintext_password = plaintext_bytes.decode("utf-8")
+
+        # Clear sensitive data from memory
+        padded_plaintext = b"\x00" * len(padded_plaintext)
+        plaintext_bytes = b"\x00" * len(plaintext_bytes)
+
+        return plaintext_password
+
     @handle_security_errors("Master password change failed")
     @monitor_performance(threshold_ms=4000)  # Two crypto operations, allow more time
     def change_master_password(
@@ -33,10 +33,20 @@ import logging
 import logging.handlers
 import re
 import sys
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+# orjson is an optional, much faster JSON encoder used by JSONFormatter
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+
 # Import configuration
 try:
     from .config import config
@@ -140,6 +150,8 @@ class JSONFormatter(logging.Formatter):
     Formatter that outputs log records as JSON
 
     Useful for structured logging and log aggregation systems.
+    Uses orjson for encoding when it is installed, falling back to the
+    standard library json module otherwise.
     """
 
     def format(self, record: logging.LogRecord) -> str:
@@ -174,6 +186,8 @@ class JSONFormatter(logging.Formatter):
         if hasattr(record, "error_code"):
             log_data["error_code"] = record.error_code
 
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(log_data, default=str).decode("utf-8")
         return json.dumps(log_data)
 
 
@@ -199,6 +213,15 @@ class ColoredFormatter(logging.Formatter):
         "RESET": "\033[0m",  # Reset
     }
 
+    # Pre-colored level names keyed by level number, built once
+    COLORED_LEVELNAMES = {
+        logging.DEBUG: f"{COLORS['DEBUG']}DEBUG{COLORS['RESET']}",
+        logging.INFO: f"{COLORS['INFO']}INFO{COLORS['RESET']}",
+        logging.WARNING: f"{COLORS['WARNING']}WARNING{COLORS['RESET']}",
+        logging.ERROR: f"{COLORS['ERROR']}ERROR{COLORS['RESET']}",
+        logging.CRITICAL: f"{COLORS['CRITICAL']}CRITICAL{COLORS['RESET']}",
+    }
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record with colors
@@ -211,8 +234,9 @@ class ColoredFormatter(logging.Formatter):
         """
         # Add color to level name
         levelname = record.levelname
-        if levelname in self.COLORS:
-            record.levelname = f"{self.COLORS[levelname]}{levelname}{self.COLORS['RESET']}"
+        colored = self.COLORED_LEVELNAMES.get(record.levelno)
+        if colored is not None:
+            record.levelname = colored
 
         # Format the record
         result = super().format(record)
@@ -223,6 +247,65 @@ class ColoredFormatter(logging.Formatter):
         return result
 
 
+# =============================================================================
+# DEBUG RING BUFFER
+# =============================================================================
+
+# Number of DEBUG records kept in memory when running at DEBUG level
+DEBUG_RING_CAPACITY = 4096
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Handler that keeps recent DEBUG records in a bounded in-memory buffer
+
+    DEBUG records are not written to disk as they arrive. When an ERROR (or
+    worse) record is seen, or log_exception is called, the buffered records are
+    passed to the target handler by flush_all() so the context leading up to the
+    failure lands in the log file.
+
+    flush() keeps the no-op behaviour of logging.Handler: logging.shutdown()
+    calls it at exit, and a clean exit must not dump the buffer.
+    """
+
+    def __init__(self, capacity: int, flush_target: logging.Handler):
+        """
+        Initialize the ring buffer handler
+
+        Args:
+            capacity: Maximum number of DEBUG records to keep
+            flush_target: Handler that receives buffered records on flush
+        """
+        super().__init__(logging.DEBUG)
+        self.buffer: deque = deque(maxlen=capacity)
+        self.target = flush_target
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """
+        Buffer DEBUG records and flush the buffer on errors
+
+        Args:
+            record: Log record to handle
+        """
+        if record.levelno < logging.INFO:
+            self.buffer.append(record)
+        elif record.levelno >= logging.ERROR:
+            self.flush_all()
+
+    def flush_all(self) -> None:
+        """Write all buffered records to the target handler and clear the buffer"""
+        with self.lock:
+            records = list(self.buffer)
+            self.buffer.clear()
+
+        for record in records:
+            self.target.handle(record)
+
+
+# Ring buffer installed by setup_logging at DEBUG level, flushed by log_exception
+_debug_ring: Optional[RingBufferHandler] = None
+
+
 # =============================================================================
 # LOGGING SETUP
 # =============================================================================
@@ -242,11 +325,24 @@ def setup_logging(
     - error.log: Errors and exceptions only
     - audit.log: User actions and audit trail
 
+    At DEBUG level, DEBUG records are kept in a RingBufferHandler and only
+    written to app.log when an error is logged.
+
     Args:
         log_level: Override default log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         use_json: Use JSON formatting for file logs
         use_colors: Use colored output for console (if supported)
     """
+    global _debug_ring
+
+    # Read configuration once; the values are reused by every handler below
+    log_format = config.LOG_FORMAT
+    date_format = config.LOG_DATE_FORMAT
+    max_bytes = config.LOG_MAX_BYTES
+    backup_count = config.LOG_BACKUP_COUNT
+    log_to_console = config.LOG_TO_CONSOLE
+    log_to_file = config.LOG_TO_FILE
+
     # Determine log level
     level_str = log_level or config.LOG_LEVEL
     level = getattr(logging, level_str.upper(), logging.INFO)
@@ -260,17 +356,20 @@ def setup_logging(
 
     # Remove existing handlers
     root_logger.handlers.clear()
+    _debug_ring = None
+
+    # Create formatters (formatters are stateless, so one plain instance is shared)
+    plain_formatter = logging.Formatter(log_format, datefmt=date_format)
 
-    # Create formatters
     if use_json:
         file_formatter = JSONFormatter()
     else:
-        file_formatter = logging.Formatter(config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT)
+        file_formatter = plain_formatter
 
     if use_colors and sys.stdout.isatty():
-        console_formatter = ColoredFormatter(config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT)
+        console_formatter = ColoredFormatter(log_format, datefmt=date_format)
     else:
-        console_formatter = logging.Formatter(config.LOG_FORMAT, datefmt=config.LOG_DATE_FORMAT)
+        console_formatter = plain_formatter
 
     # Create sensitive data filter
     sensitive_filter = SensitiveDataFilter()
@@ -279,7 +378,7 @@ def setup_logging(
     # CONSOLE HANDLER
     # =============================================================================
 
-    if config.LOG_TO_CONSOLE:
+    if log_to_console:
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(level)
         console_handler.setFormatter(console_formatter)
@@ -290,24 +389,32 @@ def setup_logging(
     # FILE HANDLERS
     # =============================================================================
 
-    if config.LOG_TO_FILE:
+    if log_to_file:
         # APP LOG - General application logs
         app_handler = logging.handlers.RotatingFileHandler(
             config.LOG_FILE_APP,
-            maxBytes=config.LOG_MAX_BYTES,
-            backupCount=config.LOG_BACKUP_COUNT,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
             encoding="utf-8",
         )
-        app_handler.setLevel(level)
         app_handler.setFormatter(file_formatter)
         app_handler.addFilter(sensitive_filter)
+
+        if level <= logging.DEBUG:
+            # Keep DEBUG records in memory; added before app_handler so the
+            # buffered context is written ahead of the error that flushed it
+            app_handler.setLevel(logging.INFO)
+            _debug_ring = RingBufferHandler(DEBUG_RING_CAPACITY, app_handler)
+            root_logger.addHandler(_debug_ring)
+        else:
+            app_handler.setLevel(level)
         root_logger.addHandler(app_handler)
 
         # SECURITY LOG - Security events only
         security_handler = logging.handlers.RotatingFileHandler(
             config.LOG_FILE_SECURITY,
-            maxBytes=config.LOG_MAX_BYTES,
-            backupCount=config.LOG_BACKUP_COUNT,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
             encoding="utf-8",
         )
         security_handler.setLevel(logging.INFO)
@@ -319,8 +426,8 @@ def setup_logging(
         # ERROR LOG - Errors and exceptions only
         error_handler = logging.handlers.RotatingFileHandler(
             config.LOG_FILE_ERROR,
-            maxBytes=config.LOG_MAX_BYTES,
-            backupCount=config.LOG_BACKUP_COUNT,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
             encoding="utf-8",
         )
         error_handler.setLevel(logging.ERROR)
@@ -331,8 +438,8 @@ def setup_logging(
         # AUDIT LOG - User actions and audit trail
         audit_handler = logging.handlers.RotatingFileHandler(
             config.LOG_FILE_AUDIT,
-            maxBytes=config.LOG_MAX_BYTES,
-            backupCount=config.LOG_BACKUP_COUNT,
+            maxBytes=max_bytes,
+            backupCount=backup_count,
             encoding="utf-8",
         )
         audit_handler.setLevel(logging.INFO)
@@ -342,8 +449,8 @@ def setup_logging(
 
     # Log startup message
     root_logger.info(
-        f"Logging configured: level={level_str}, console={config.LOG_TO_CONSOLE}, "
-        f"file={config.LOG_TO_FILE}, json={use_json}"
+        f"Logging configured: level={level_str}, console={log_to_console}, "
+        f"file={log_to_file}, json={use_json}"
     )
 
 
@@ -433,6 +540,10 @@ def log_exception(
     extra_fields["exception_type"] = type(exception).__name__
     extra_fields["exception_message"] = str(exception)
 
+    # Write the buffered DEBUG context ahead of the exception
+    if _debug_ring is not None:
+        _debug_ring.flush_all()
+
     # Log with full stack trace
     logger.error(message, exc_info=True, extra=extra_fields)
 
@@ -553,4 +664,5 @@ __all__ = [
     "JSONFormatter",
     "ColoredFormatter",
     "SensitiveDataFilter",
+    "RingBufferHandler",
 ]
@@ -17,10 +17,11 @@ Author: Personal Password Manager
 Version: 2.2.0
 """
 
+import functools
+import logging
 import threading
 import time
-from collections import OrderedDict
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Optional, Sequence
 
 from .logging_config import get_logger
 from .types import PasswordEntry
@@ -54,8 +55,13 @@ class PasswordCache:
         self.ttl_seconds = ttl_seconds
         self.enable_metrics = enable_metrics
 
-        # Cache storage: {user_id: OrderedDict[cache_key: CacheEntry]}
-        self._cache: Dict[int, OrderedDict] = {}
+        # Cache storage: {user_id: {cache_key: CacheEntry}}
+        # Plain dicts keep insertion order, so the first key is always the
+        # least recently used one (hits are re-inserted at the end).
+        self._cache: Dict[int, Dict[str, Dict[str, Any]]] = {}
+
+        # Running entry count across all users, so metrics don't rescan the cache
+        self._total_entries = 0
 
         # Thread lock for thread safety
         self._lock = threading.RLock()
@@ -71,7 +77,7 @@ class PasswordCache:
 
         logger.info(f"Password cache initialized (max_size={max_size}, ttl={ttl_seconds}s)")
 
-    def get(self, user_id: int, cache_key: str) -> Optional[List[PasswordEntry]]:
+    def get(self, user_id: int, cache_key: str) -> Optional[Sequence[PasswordEntry]]:
         """
         Get cached password entries
 
@@ -97,27 +103,28 @@ class PasswordCache:
                 self._metrics["misses"] += 1
                 return None
 
-            # Get entry
-            entry = user_cache[cache_key]
+            # Pop entry; it is re-inserted below on a hit
+            entry = user_cache.pop(cache_key)
 
             # Check if expired
             if self._is_expired(entry):
-                # Remove expired entry
-                del user_cache[cache_key]
+                self._total_entries -= 1
                 self._metrics["misses"] += 1
-                logger.debug(f"Cache expired for user {user_id}, key: {cache_key}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Cache expired for user {user_id}, key: {cache_key}")
                 return None
 
-            # Move to end (most recently used)
-            user_cache.move_to_end(cache_key)
+            # Re-insert at the end (most recently used)
+            user_cache[cache_key] = entry
 
             # Cache hit
             self._metrics["hits"] += 1
-            logger.debug(f"Cache hit for user {user_id}, key: {cache_key}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Cache hit for user {user_id}, key: {cache_key}")
 
             return entry["data"]
 
-    def set(self, user_id: int, cache_key: str, data: List[PasswordEntry]) -> None:
+    def set(self, user_id: int, cache_key: str, data: Sequence[PasswordEntry]) -> None:
         """
         Store password entries in cache
 
@@ -129,7 +136,7 @@ class PasswordCache:
         with self._lock:
             # Ensure user cache exists
             if user_id not in self._cache:
-                self._cache[user_id] = OrderedDict()
+                self._cache[user_id] = {}
 
             user_cache = self._cache[user_id]
 
@@ -138,13 +145,20 @@ class PasswordCache:
                 # Remove least recently used (first item)
                 evicted_key = next(iter(user_cache))
                 del user_cache[evicted_key]
+                self._total_entries -= 1
                 self._metrics["evictions"] += 1
-                logger.debug(f"Evicted cache entry for user {user_id}, key: {evicted_key}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Evicted cache entry for user {user_id}, key: {evicted_key}")
 
             # Add entry
+            if cache_key not in user_cache:
+                self._total_entries += 1
             user_cache[cache_key] = {"data": data, "timestamp": time.time(), "access_count": 0}
 
-            logger.debug(f"Cache set for user {user_id}, key: {cache_key}, entries: {len(data)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Cache set for user {user_id}, key: {cache_key}, entries: {len(data)}"
+                )
 
     def invalidate_user(self, user_id: int) -> None:
         """
@@ -154,11 +168,15 @@ class PasswordCache:
             user_id: User ID to invalidate
         """
         with self._lock:
-            if user_id in self._cache:
-                count = len(self._cache[user_id])
-                del self._cache[user_id]
+            # The per-user dict doubles as the user -> keys index, so dropping
+            # it is O(1) regardless of how many other users are cached
+            user_cache = self._cache.pop(user_id, None)
+            if user_cache is not None:
+                count = len(user_cache)
+                self._total_entries -= count
                 self._metrics["invalidations"] += count
-                logger.debug(f"Invalidated {count} cache entries for user {user_id}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Invalidated {count} cache entries for user {user_id}")
 
     def invalidate_key(self, user_id: int, cache_key: str) -> None:
         """
@@ -169,16 +187,19 @@ class PasswordCache:
             cache_key: Cache key to invalidate
         """
         with self._lock:
-            if user_id in self._cache and cache_key in self._cache[user_id]:
-                del self._cache[user_id][cache_key]
+            user_cache = self._cache.get(user_id)
+            if user_cache is not None and user_cache.pop(cache_key, None) is not None:
+                self._total_entries -= 1
                 self._metrics["invalidations"] += 1
-                logger.debug(f"Invalidated cache entry for user {user_id}, key: {cache_key}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(f"Invalidated cache entry for user {user_id}, key: {cache_key}")
 
     def invalidate_all(self) -> None:
         """Invalidate all cache entries"""
         with self._lock:
-            total = sum(len(user_cache) for user_cache in self._cache.values())
+            total = self._total_entries
             self._cache.clear()
+            self._total_entries = 0
             self._metrics["invalidations"] += total
             logger.info(f"Invalidated all cache entries ({total} total)")
 
@@ -191,12 +212,15 @@ class PasswordCache:
         """
         with self._lock:
             removed = 0
+            now = time.time()
 
             for user_id in list(self._cache.keys()):
                 user_cache = self._cache[user_id]
 
                 # Find expired entries
-                expired_keys = [key for key, entry in user_cache.items() if self._is_expired(entry)]
+                expired_keys = [
+                    key for key, entry in user_cache.items() if self._is_expired(entry, now)
+                ]
 
                 # Remove expired entries
                 for key in expired_keys:
@@ -207,6 +231,8 @@ class PasswordCache:
                 if not user_cache:
                     del self._cache[user_id]
 
+            self._total_entries -= removed
+
             if removed > 0:
                 logger.debug(f"Cleaned up {removed} expired cache entries")
 
@@ -219,25 +245,28 @@ class PasswordCache:
         Returns:
             Dictionary with performance statistics
         """
+        # Take a constant-time snapshot under the lock; derive the rest outside it
         with self._lock:
-            total_entries = sum(len(user_cache) for user_cache in self._cache.values())
-
-            hit_rate = 0.0
-            if self._metrics["total_requests"] > 0:
-                hit_rate = (self._metrics["hits"] / self._metrics["total_requests"]) * 100
-
-            return {
-                "total_entries": total_entries,
-                "users_cached": len(self._cache),
-                "max_size": self.max_size,
-                "ttl_seconds": self.ttl_seconds,
-                "hits": self._metrics["hits"],
-                "misses": self._metrics["misses"],
-                "hit_rate": hit_rate,
-                "evictions": self._metrics["evictions"],
-                "invalidations": self._metrics["invalidations"],
-                "total_requests": self._metrics["total_requests"],
-            }
+            metrics = dict(self._metrics)
+            total_entries = self._total_entries
+            users_cached = len(self._cache)
+
+        hit_rate = 0.0
+        if metrics["total_requests"] > 0:
+            hit_rate = (metrics["hits"] / metrics["total_requests"]) * 100
+
+        return {
+            "total_entries": total_entries,
+            "users_cached": users_cached,
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl_seconds,
+            "hits": metrics["hits"],
+            "misses": metrics["misses"],
+            "hit_rate": hit_rate,
+            "evictions": metrics["evictions"],
+            "invalidations": metrics["invalidations"],
+            "total_requests": metrics["total_requests"],
+        }
 
     def reset_metrics(self) -> None:
         """Reset performance metrics"""
@@ -251,17 +280,20 @@ class PasswordCache:
             }
             logger.debug("Cache metrics reset")
 
-    def _is_expired(self, entry: Dict[str, Any]) -> bool:
+    def _is_expired(self, entry: Dict[str, Any], now: Optional[float] = None) -> bool:
         """
         Check if a cache entry is expired
 
         Args:
             entry: Cache entry to check
+            now: Current time, if already sampled by the caller
 
         Returns:
             True if expired, False otherwise
         """
-        age = time.time() - entry["timestamp"]
+        if now is None:
+            now = time.time()
+        age = now - entry["timestamp"]
         return age > self.ttl_seconds
 
     def get_cache_info(self, user_id: Optional[int] = None) -> Dict[str, Any]:
@@ -294,7 +326,7 @@ class PasswordCache:
             else:
                 # Global cache info
                 return {
-                    "total_entries": sum(len(uc) for uc in self._cache.values()),
+                    "total_entries": self._total_entries,
                     "users": len(self._cache),
                     "user_ids": list(self._cache.keys()),
                 }
@@ -305,9 +337,11 @@ class CacheKeyBuilder:
     Helper class to build consistent cache keys
 
     Provides standardized cache key generation for different query types.
+    Keys that depend only on small integer inputs are memoized.
     """
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def all_passwords(user_id: int) -> str:
         """Cache key for all passwords query"""
         return f"all_{user_id}"
@@ -315,22 +349,25 @@ class CacheKeyBuilder:
     @staticmethod
     def search_query(user_id: int, query: str) -> str:
         """Cache key for search query"""
-        # Normalize query for consistent caching
-        normalized_query = query.lower().strip()
+        # Normalize query for consistent caching. Keys built from free-form
+        # text are not interned, an interned string lives as long as the process
+        normalized_query = query.strip().lower()
         return f"search_{user_id}_{normalized_query}"
 
     @staticmethod
     def website_filter(user_id: int, website: str) -> str:
         """Cache key for website filter"""
-        normalized_website = website.lower().strip()
+        normalized_website = website.strip().lower()
         return f"website_{user_id}_{normalized_website}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def favorites(user_id: int) -> str:
         """Cache key for favorites query"""
         return f"favorites_{user_id}"
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def recent(user_id: int, limit: int = 10) -> str:
         """Cache key for recent passwords query"""
         return f"recent_{user_id}_{limit}"
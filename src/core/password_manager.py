@@ -30,14 +30,21 @@ Author: Personal Password Manager
 Version: 2.2.0
 """
 
+import ctypes
 import hashlib
+import heapq
+import hmac
 import logging
 import re
+import secrets
 import threading
+import time
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from operator import itemgetter
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
+from urllib.parse import urlparse
 
 from .auth import (
     AuthenticationError,
@@ -55,6 +62,25 @@ from .performance_monitor import PerformanceMonitor, PerformanceTracker
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Number of lock stripes for the master password cache (must be a power of two)
+MASTER_PASSWORD_CACHE_SHARDS = 16
+
+# Cached master passwords kept per shard before Clock (second-chance) eviction
+MASTER_PASSWORD_CACHE_SHARD_CAPACITY = 64
+
+# Longest website URL validate_website_url will parse; bounds the work done on
+# untrusted input such as imported files
+MAX_WEBSITE_URL_LENGTH = 2048
+
+# Website URL pieces checked by validate_website_url after urlparse has split
+# the URL; every pattern is anchored and free of nested quantifiers, so matching
+# stays linear in the input length
+_NETLOC_RE = re.compile(r"([A-Za-z0-9.-]{1,253})(?::\d{1,5})?")
+_HOST_LABEL_RE = re.compile(r"[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?", re.IGNORECASE)
+_TLD_RE = re.compile(r"[A-Z]{2,6}", re.IGNORECASE)
+_IPV4_RE = re.compile(r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}")
+_WHITESPACE_RE = re.compile(r"\s")
+
 
 class PasswordManagerError(Exception):
     """Base exception for password manager operations"""
@@ -81,7 +107,7 @@ class PasswordCacheMode(Enum):
     OPERATION = "operation"  # Cache for single operation chain
 
 
-@dataclass
+@dataclass(slots=True)
 class PasswordEntry:
     """
     Represents a password entry with metadata
@@ -109,6 +135,66 @@ class PasswordEntry:
         if self.modified_at is None:
             self.modified_at = self.created_at
 
+    @classmethod
+    def from_db_row(cls, row: Dict[str, Any], password: str = "") -> "PasswordEntry":
+        """
+        Build an entry from a password entry row returned by the database layer
+
+        Skips the generated __init__ and __post_init__, and applies the same
+        timestamp defaults inline: created_at and modified_at are nullable, so
+        legacy or imported rows may lack them.
+
+        Args:
+            row (Dict[str, Any]): Database row with datetime timestamps
+            password (str): Decrypted password, or empty when not requested
+
+        Returns:
+            PasswordEntry: Entry populated from the row
+        """
+        entry = object.__new__(cls)
+        entry.entry_id = row["entry_id"]
+        entry.entry_name = row["entry_name"]
+        entry.website = row["website"]
+        entry.username = row["username"]
+        entry.password = password
+        entry.remarks = row["remarks"]
+        entry.created_at = row["created_at"] or datetime.now()
+        entry.modified_at = row["modified_at"] or entry.created_at
+        entry.is_favorite = bool(row["is_favorite"])
+        entry.password_strength = {}
+        entry.tags = []
+        return entry
+
+
+def _zero_bytearray(buffer: bytearray) -> None:
+    """
+    Overwrite a bytearray's memory with zeros and empty it
+
+    Uses ctypes.memset on the underlying buffer so the secret bytes are
+    cleared in place before the bytearray releases its storage.
+
+    Args:
+        buffer (bytearray): Buffer holding secret data
+    """
+    length = len(buffer)
+    if length:
+        view = (ctypes.c_char * length).from_buffer(buffer)
+        ctypes.memset(view, 0, length)
+        # Release the exported buffer before resizing
+        del view
+    buffer.clear()
+
+
+class PasswordEntrySummary(NamedTuple):
+    """
+    Lightweight password entry metadata for listings that need no password or dates
+    """
+
+    entry_id: int
+    website: str
+    username: str
+    is_favorite: bool  # SQLite 0/1 integer, use truthiness
+
 
 @dataclass
 class SearchCriteria:
@@ -148,8 +234,8 @@ class PasswordManagerCore:
         auth_manager (AuthenticationManager): Authentication system
         cache_mode (PasswordCacheMode): Master password caching strategy
         cache_timeout_minutes (int): Cache timeout for temporary mode
-        _master_password_cache (Dict): Temporary password cache
-        _cache_lock (threading.Lock): Thread synchronization for cache
+        _shards (List[Tuple]): Lock-striped master password cache; each shard holds
+            (cached master passwords, shard lock, expiry heap)
     """
 
     def __init__(
@@ -181,9 +267,22 @@ class PasswordManagerCore:
         self.cache_mode = cache_mode
         self.cache_timeout_minutes = cache_timeout_minutes
 
-        # Master password caching system
-        self._master_password_cache: Dict[str, Dict] = {}
-        self._cache_lock = threading.Lock()
+        # Master password caching system, striped by session so concurrent
+        # sessions don't contend on one lock. Each shard holds
+        # ({session_id: cache_entry}, lock, [(expires_at_monotonic, session_id)] min-heap);
+        # a cache entry also keeps the fingerprint of its verified master password, so
+        # repeat verifications skip the key derivation function only while the entry
+        # lives, and the heap lets expired entries be wiped without scanning the shard
+        self._shards: List[Tuple[Dict[str, Dict], threading.Lock, List[Tuple]]] = [
+            ({}, threading.Lock(), []) for _ in range(MASTER_PASSWORD_CACHE_SHARDS)
+        ]
+        self._fingerprint_salt = secrets.token_bytes(32)
+
+        # Per-user master password generation, bumped whenever a user's cached master
+        # passwords are cleared; a verification that started under an older generation
+        # must not leave its fingerprint behind
+        self._master_password_generations: Dict[int, int] = {}
+        self._generation_lock = threading.Lock()
 
         # Password entry caching system for performance
         self._password_cache = None
@@ -241,8 +340,8 @@ class PasswordManagerCore:
             # Validate session
             session = self.auth_manager.validate_session(session_id)
 
-            # Validate input data
-            self._validate_password_entry_data(website, username, password)
+            # Validate input data; the stripped values are used from here on
+            website, username = self._validate_password_entry_data(website, username, password)
 
             # Get master password from cache if not provided
             if master_password is None:
@@ -256,7 +355,7 @@ class PasswordManagerCore:
             if not self._verify_master_password(session_id, master_password):
                 raise MasterPasswordRequiredError("Invalid master password")
 
-            # Check for duplicate entries
+            # Check for duplicate entries before paying for the key derivation
             if self._check_duplicate_entry(session.user_id, website, username):
                 raise DuplicateEntryError(f"Entry already exists for {website} - {username}")
 
@@ -265,24 +364,22 @@ class PasswordManagerCore:
                 password, master_password
             )
 
-            # Add to database
+            # Add to database; the INSERT re-checks for a duplicate added in the meantime
             entry_id = self.auth_manager.db_manager.add_password_entry(
                 user_id=session.user_id,
-                website=website.strip(),
-                username=username.strip(),
+                website=website,
+                username=username,
                 encrypted_password=encrypted_password,
                 remarks=remarks.strip(),
                 entry_name=entry_name,
+                is_favorite=is_favorite,
+                reject_duplicates=True,
             )
-
-            # Update favorite status if needed
-            if is_favorite:
-                self.auth_manager.db_manager.update_password_entry(
-                    entry_id, session.user_id, is_favorite=True
-                )
+            if entry_id is None:
+                raise DuplicateEntryError(f"Entry already exists for {website} - {username}")
 
             # Cache master password if enabled
-            self._cache_master_password(session_id, master_password)
+            self._cache_master_password(session_id, master_password, session.user_id)
 
             # Invalidate password cache for this user
             if self._password_cache:
@@ -331,14 +428,10 @@ class PasswordManagerCore:
             # Validate session
             session = self.auth_manager.validate_session(session_id)
 
-            # Get entry from database
-            entries = self.auth_manager.db_manager.get_password_entries(session.user_id)
-            target_entry = None
-
-            for entry in entries:
-                if entry["entry_id"] == entry_id:
-                    target_entry = entry
-                    break
+            # Get entry from database (scoped to the session's user)
+            target_entry = self.auth_manager.db_manager.get_password_entry_by_id(
+                session.user_id, entry_id
+            )
 
             if not target_entry:
                 raise PasswordManagerError("Password entry not found or access denied")
@@ -364,24 +457,10 @@ class PasswordManagerCore:
                 )
 
                 # Cache master password if enabled
-                self._cache_master_password(session_id, mp)
+                self._cache_master_password(session_id, mp, session.user_id)
 
             # Create PasswordEntry object
-            entry = PasswordEntry(
-                entry_id=target_entry["entry_id"],
-                entry_name=target_entry.get("entry_name"),
-                website=target_entry["website"],
-                username=target_entry["username"],
-                password=decrypted_password,
-                remarks=target_entry.get("remarks", ""),
-                created_at=datetime.fromisoformat(target_entry["created_at"])
-                if target_entry.get("created_at")
-                else None,
-                modified_at=datetime.fromisoformat(target_entry["modified_at"])
-                if target_entry.get("modified_at")
-                else None,
-                is_favorite=bool(target_entry.get("is_favorite", False)),
-            )
+            entry = PasswordEntry.from_db_row(target_entry, decrypted_password)
 
             logger.debug(f"Retrieved password entry: {entry.website} - {entry.username}")
             return entry
@@ -398,7 +477,8 @@ class PasswordManagerCore:
         criteria: SearchCriteria = None,
         master_password: str = None,
         include_passwords: bool = False,
-    ) -> List[PasswordEntry]:
+        metadata_only: bool = False,
+    ) -> Union[List[PasswordEntry], List[PasswordEntrySummary]]:
         """
         Search password entries with advanced filtering
 
@@ -407,9 +487,11 @@ class PasswordManagerCore:
             criteria (SearchCriteria, optional): Search and filter criteria
             master_password (str, optional): Master password for password decryption
             include_passwords (bool): Whether to include decrypted passwords
+            metadata_only (bool): Return PasswordEntrySummary tuples (ID, website,
+                username, favorite) instead of full entries; include_passwords is ignored
 
         Returns:
-            List[PasswordEntry]: List of matching password entries
+            Union[List[PasswordEntry], List[PasswordEntrySummary]]: Matching entries
 
         Raises:
             InvalidSessionError: If session is invalid
@@ -423,154 +505,83 @@ class PasswordManagerCore:
                 if criteria is None:
                     criteria = SearchCriteria()
 
-                # Try to get from cache (only for non-password queries)
-                cached_data = None
+                if metadata_only:
+                    include_passwords = False
+
+                # Try to get from cache (only for non-password queries). Results are
+                # cached as tuples and handed out as fresh lists, so a caller that
+                # sorts or edits its result cannot change what later searches see
                 cache_key = None
                 if self._password_cache and not include_passwords:
-                    # Build cache key based on criteria
-                    if criteria.website:
-                        cache_key = CacheKeyBuilder.website_filter(
-                            session.user_id, criteria.website
-                        )
-                    elif criteria.is_favorite:
-                        cache_key = CacheKeyBuilder.favorites(session.user_id)
-                    else:
-                        cache_key = CacheKeyBuilder.all_passwords(session.user_id)
-
-                    # Try to get from cache
+                    cache_key = self._search_cache_key(session.user_id, criteria)
+                    if metadata_only:
+                        cache_key += "|metadata"
                     cached_data = self._password_cache.get(session.user_id, cache_key)
 
-                if cached_data is not None:
-                    logger.debug("Retrieved password entries from cache")
-                    # Apply additional in-memory filtering for cached data
-                    password_entries = cached_data
-
-                    # Apply filters
-                    if criteria.username:
-                        password_entries = [
-                            e
-                            for e in password_entries
-                            if criteria.username.lower() in e.username.lower()
-                        ]
-                    if criteria.remarks:
-                        password_entries = [
-                            e
-                            for e in password_entries
-                            if criteria.remarks.lower() in e.remarks.lower()
-                        ]
-                    if criteria.date_from or criteria.date_to:
-                        filtered = []
-                        for e in password_entries:
-                            created_at = e.created_at or datetime.min
-                            if criteria.date_from and created_at < criteria.date_from:
-                                continue
-                            if criteria.date_to and created_at > criteria.date_to:
-                                continue
-                            filtered.append(e)
-                        password_entries = filtered
-
-                    # Apply sorting
-                    password_entries = self._sort_entries(
-                        password_entries, criteria.sort_by, criteria.sort_order
-                    )
-
-                    # Apply limit
-                    if criteria.limit and criteria.limit > 0:
-                        password_entries = password_entries[: criteria.limit]
-
-                    tracker.add_metadata({"cached": True, "result_count": len(password_entries)})
-                    return password_entries
+                    if cached_data is not None:
+                        logger.debug("Retrieved password entries from cache")
+                        tracker.add_metadata({"cached": True, "result_count": len(cached_data)})
+                        return list(cached_data)
+
+                # Filtering, sorting and limiting are all done by SQLite
+                db_entries, _ = self.auth_manager.db_manager.get_password_entries_advanced(
+                    user_id=session.user_id,
+                    website=criteria.website,
+                    username=criteria.username,
+                    remarks=criteria.remarks,
+                    is_favorite=criteria.is_favorite,
+                    date_from=criteria.date_from.isoformat() if criteria.date_from else None,
+                    date_to=criteria.date_to.isoformat() if criteria.date_to else None,
+                    limit=criteria.limit if criteria.limit and criteria.limit > 0 else None,
+                    order_by=criteria.sort_by or "website",
+                    sort_order=criteria.sort_order or "asc",
+                    count_total=False,
+                    metadata_only=metadata_only,
+                )
 
-                # Get all entries from database
-                db_entries = self.auth_manager.db_manager.get_password_entries(
-                    session.user_id, website=criteria.website
+                if metadata_only:
+                    summaries = [PasswordEntrySummary._make(row) for row in db_entries]
+                    if cache_key:
+                        self._password_cache.set(session.user_id, cache_key, tuple(summaries))
+                    tracker.add_metadata({"cached": False, "result_count": len(summaries)})
+                    logger.debug(f"Found {len(summaries)} matching password entry summaries")
+                    return summaries
+
+                # Resolve and verify the master password once for the whole result set
+                mp = self._resolve_master_password_for_search(
+                    session_id, master_password, include_passwords
                 )
+                derived_keys: Dict[bytes, bytes] = {}
 
-                # Convert to PasswordEntry objects and apply filters
+                # Convert to PasswordEntry objects
                 password_entries = []
 
                 for db_entry in db_entries:
-                    # Apply additional filters
-                    if (
-                        criteria.username
-                        and criteria.username.lower() not in db_entry["username"].lower()
-                    ):
-                        continue
-
-                    if (
-                        criteria.remarks
-                        and criteria.remarks.lower() not in db_entry.get("remarks", "").lower()
-                    ):
-                        continue
-
-                    if (
-                        criteria.is_favorite is not None
-                        and bool(db_entry.get("is_favorite", False)) != criteria.is_favorite
-                    ):
-                        continue
-
-                    # Date filters
-                    if criteria.date_from or criteria.date_to:
-                        created_at = (
-                            datetime.fromisoformat(db_entry["created_at"])
-                            if db_entry.get("created_at")
-                            else datetime.min
-                        )
-
-                        if criteria.date_from and created_at < criteria.date_from:
-                            continue
-
-                        if criteria.date_to and created_at > criteria.date_to:
-                            continue
-
                     # Decrypt password if requested and master password available
                     decrypted_password = ""
-                    if include_passwords:
-                        mp = master_password or self._get_cached_master_password(session_id)
-                        if mp and self._verify_master_password(session_id, mp):
-                            try:
-                                decrypted_password = session.encryption_system.decrypt_password(
-                                    db_entry["password_encrypted"], mp
-                                )
-                                # Cache master password if successful
-                                self._cache_master_password(session_id, mp)
-                            except (DecryptionError, EncryptionError):
-                                logger.warning(
-                                    f"Failed to decrypt password for entry {db_entry['entry_id']}"
-                                )
-                                decrypted_password = "[Decryption Failed]"
+                    if mp:
+                        try:
+                            decrypted_password = self._decrypt_with_derived_keys(
+                                session, db_entry["password_encrypted"], mp, derived_keys
+                            )
+                        except (DecryptionError, EncryptionError):
+                            logger.warning(
+                                f"Failed to decrypt password for entry {db_entry['entry_id']}"
+                            )
+                            decrypted_password = "[Decryption Failed]"
 
                     # Create PasswordEntry object
-                    entry = PasswordEntry(
-                        entry_id=db_entry["entry_id"],
-                        entry_name=db_entry.get("entry_name"),
-                        website=db_entry["website"],
-                        username=db_entry["username"],
-                        password=decrypted_password,
-                        remarks=db_entry.get("remarks", ""),
-                        created_at=datetime.fromisoformat(db_entry["created_at"])
-                        if db_entry.get("created_at")
-                        else None,
-                        modified_at=datetime.fromisoformat(db_entry["modified_at"])
-                        if db_entry.get("modified_at")
-                        else None,
-                        is_favorite=bool(db_entry.get("is_favorite", False)),
-                    )
+                    entry = PasswordEntry.from_db_row(db_entry, decrypted_password)
 
                     password_entries.append(entry)
 
-                # Apply sorting
-                password_entries = self._sort_entries(
-                    password_entries, criteria.sort_by, criteria.sort_order
-                )
-
-                # Apply limit
-                if criteria.limit and criteria.limit > 0:
-                    password_entries = password_entries[: criteria.limit]
+                # Cache master password after a verified decryption pass
+                if mp:
+                    self._cache_master_password(session_id, mp, session.user_id)
 
                 # Cache results (only if not including passwords)
-                if self._password_cache and not include_passwords and cache_key:
-                    self._password_cache.set(session.user_id, cache_key, password_entries)
+                if cache_key:
+                    self._password_cache.set(session.user_id, cache_key, tuple(password_entries))
 
                 tracker.add_metadata({"cached": False, "result_count": len(password_entries)})
                 logger.debug(f"Found {len(password_entries)} matching password entries")
@@ -666,48 +677,41 @@ class PasswordManagerCore:
                 limit=per_page,
                 offset=offset,
                 order_by=criteria.sort_by or "website",
+                sort_order=criteria.sort_order or "asc",
             )
 
+            # Resolve and verify the master password once for the whole page
+            mp = self._resolve_master_password_for_search(
+                session_id, master_password, include_passwords
+            )
+            derived_keys: Dict[bytes, bytes] = {}
+
             # Convert to PasswordEntry objects
             password_entries = []
 
             for db_entry in db_entries:
                 # Decrypt password if requested and master password available
                 decrypted_password = ""
-                if include_passwords:
-                    mp = master_password or self._get_cached_master_password(session_id)
-                    if mp and self._verify_master_password(session_id, mp):
-                        try:
-                            decrypted_password = session.encryption_system.decrypt_password(
-                                db_entry["password_encrypted"], mp
-                            )
-                            # Cache master password if successful
-                            self._cache_master_password(session_id, mp)
-                        except (DecryptionError, EncryptionError):
-                            logger.warning(
-                                f"Failed to decrypt password for entry {db_entry['entry_id']}"
-                            )
-                            decrypted_password = "[Decryption Failed]"
+                if mp:
+                    try:
+                        decrypted_password = self._decrypt_with_derived_keys(
+                            session, db_entry["password_encrypted"], mp, derived_keys
+                        )
+                    except (DecryptionError, EncryptionError):
+                        logger.warning(
+                            f"Failed to decrypt password for entry {db_entry['entry_id']}"
+                        )
+                        decrypted_password = "[Decryption Failed]"
 
                 # Create PasswordEntry object
-                entry = PasswordEntry(
-                    entry_id=db_entry["entry_id"],
-                    entry_name=db_entry.get("entry_name"),
-                    website=db_entry["website"],
-                    username=db_entry["username"],
-                    password=decrypted_password,
-                    remarks=db_entry.get("remarks", ""),
-                    created_at=datetime.fromisoformat(db_entry["created_at"])
-                    if db_entry.get("created_at")
-                    else None,
-                    modified_at=datetime.fromisoformat(db_entry["modified_at"])
-                    if db_entry.get("modified_at")
-                    else None,
-                    is_favorite=bool(db_entry.get("is_favorite", False)),
-                )
+                entry = PasswordEntry.from_db_row(db_entry, decrypted_password)
 
                 password_entries.append(entry)
 
+            # Cache master password after a verified decryption pass
+            if mp:
+                self._cache_master_password(session_id, mp, session.user_id)
+
             # Calculate pagination info
             total_pages = (total_count + per_page - 1) // per_page  # Ceiling division
             pagination_info = {
@@ -811,7 +815,7 @@ class PasswordManagerCore:
                 update_params["encrypted_password"] = encrypted_password
 
                 # Cache master password if successful
-                self._cache_master_password(session_id, mp)
+                self._cache_master_password(session_id, mp, session.user_id)
 
             # Perform update
             success = self.auth_manager.db_manager.update_password_entry(
@@ -897,25 +901,27 @@ class PasswordManagerCore:
             if not self._verify_master_password(session_id, master_password):
                 raise MasterPasswordRequiredError("Invalid master password")
 
-            # Get all entries for the user
-            all_entries = self.auth_manager.db_manager.get_password_entries(session.user_id)
+            # Fetch only the requested entries owned by this user
+            entries = self.auth_manager.db_manager.get_password_entries_by_ids(
+                session.user_id, entry_ids
+            )
 
-            # Filter requested entries and decrypt passwords
+            # Decrypt passwords, deriving each key once
             decrypted_passwords = {}
+            derived_keys: Dict[bytes, bytes] = {}
 
-            for entry in all_entries:
-                if entry["entry_id"] in entry_ids:
-                    try:
-                        decrypted_password = session.encryption_system.decrypt_password(
-                            entry["password_encrypted"], master_password
-                        )
-                        decrypted_passwords[entry["entry_id"]] = decrypted_password
-                    except (DecryptionError, EncryptionError) as e:
-                        logger.error(f"Failed to decrypt entry {entry['entry_id']}: {e}")
-                        decrypted_passwords[entry["entry_id"]] = "[Decryption Failed]"
+            for entry in entries:
+                try:
+                    decrypted_password = self._decrypt_with_derived_keys(
+                        session, entry["password_encrypted"], master_password, derived_keys
+                    )
+                    decrypted_passwords[entry["entry_id"]] = decrypted_password
+                except (DecryptionError, EncryptionError) as e:
+                    logger.error(f"Failed to decrypt entry {entry['entry_id']}: {e}")
+                    decrypted_passwords[entry["entry_id"]] = "[Decryption Failed]"
 
             # Cache master password after successful operations
-            self._cache_master_password(session_id, master_password)
+            self._cache_master_password(session_id, master_password, session.user_id)
 
             logger.debug(f"Bulk decrypted {len(decrypted_passwords)} passwords")
             return decrypted_passwords
@@ -926,6 +932,102 @@ class PasswordManagerCore:
             logger.error(f"Bulk decryption failed: {e}")
             raise PasswordManagerError(f"Bulk decryption failed: {e}")
 
+    def bulk_add_password_entries(
+        self,
+        session_id: str,
+        entries: List[Dict[str, Any]],
+        master_password: str = None,
+    ) -> int:
+        """
+        Add many password entries in a single operation for imports
+
+        The encryption key is derived once for the whole batch and all rows are
+        inserted in one transaction. Entries that duplicate an existing entry (or an
+        earlier one in the batch) by website and username are skipped.
+
+        Args:
+            session_id (str): Valid session token
+            entries (List[Dict[str, Any]]): Entries with "website", "username" and
+                "password", and optionally "remarks", "entry_name" and "is_favorite"
+            master_password (str, optional): Master password for encryption (uses cached if omitted)
+
+        Returns:
+            int: Number of entries added
+
+        Raises:
+            InvalidSessionError: If session is invalid
+            MasterPasswordRequiredError: If master password is invalid
+            InvalidPasswordEntryError: If any entry's data is invalid (nothing is added)
+        """
+        try:
+            # Validate session
+            session = self.auth_manager.validate_session(session_id)
+
+            # Validate every entry before doing any work, keeping the stripped values
+            cleaned = [
+                self._validate_password_entry_data(
+                    entry.get("website"), entry.get("username"), entry.get("password")
+                )
+                for entry in entries
+            ]
+
+            if not entries:
+                return 0
+
+            # Get master password from cache if not provided
+            if master_password is None:
+                master_password = self._get_cached_master_password(session_id)
+                if master_password is None:
+                    raise MasterPasswordRequiredError(
+                        "Master password required for encryption. Please provide master password."
+                    )
+
+            # Verify master password
+            if not self._verify_master_password(session_id, master_password):
+                raise MasterPasswordRequiredError("Invalid master password")
+
+            # Derive one key for the batch; each entry still gets its own IV
+            encryption = session.encryption_system
+            salt = encryption.generate_salt()
+            encryption_key = encryption.derive_key(master_password, salt)
+
+            rows = [
+                (
+                    entry.get("entry_name"),
+                    website,
+                    username,
+                    encryption.encrypt_password_with_key(entry["password"], encryption_key, salt),
+                    (entry.get("remarks") or "").strip(),
+                    bool(entry.get("is_favorite", False)),
+                )
+                for entry, (website, username) in zip(entries, cleaned)
+            ]
+
+            added = self.auth_manager.db_manager.add_password_entries(
+                session.user_id, rows, reject_duplicates=True
+            )
+
+            # Cache master password if enabled
+            self._cache_master_password(session_id, master_password, session.user_id)
+
+            # Invalidate password cache for this user
+            if self._password_cache:
+                self._password_cache.invalidate_user(session.user_id)
+
+            logger.info(f"Bulk added {added} of {len(entries)} password entries")
+            return added
+
+        except (
+            InvalidSessionError,
+            SessionExpiredError,
+            MasterPasswordRequiredError,
+            InvalidPasswordEntryError,
+        ):
+            raise
+        except Exception as e:
+            logger.error(f"Bulk add failed: {e}")
+            raise PasswordManagerError(f"Bulk add failed: {e}")
+
     def get_password_statistics(self, session_id: str) -> Dict[str, Any]:
         """
         Get comprehensive statistics about user's password entries
@@ -946,31 +1048,11 @@ class PasswordManagerCore:
             # Get basic statistics from database
             db_stats = self.auth_manager.db_manager.get_user_statistics(session.user_id)
 
-            # Get all entries for additional analysis
-            entries = self.auth_manager.db_manager.get_password_entries(session.user_id)
-
-            # Analyze entries
-            website_counts = {}
-            username_counts = {}
-            recent_entries = []
-
-            for entry in entries:
-                # Count websites
-                website = entry["website"].lower()
-                website_counts[website] = website_counts.get(website, 0) + 1
-
-                # Count usernames
-                username = entry["username"].lower()
-                username_counts[username] = username_counts.get(username, 0) + 1
-
-                # Recent entries (last 30 days)
-                created_at = (
-                    datetime.fromisoformat(entry["created_at"])
-                    if entry.get("created_at")
-                    else datetime.min
-                )
-                if (datetime.now() - created_at).days <= 30:
-                    recent_entries.append(entry)
+            # Website/username analysis is aggregated by SQLite
+            aggregates = self.auth_manager.db_manager.get_password_entry_aggregates(
+                session.user_id, recent_days=30
+            )
+            website_counts = aggregates["website_counts"]
 
             # Compile comprehensive statistics
             statistics = {
@@ -978,15 +1060,11 @@ class PasswordManagerCore:
                 "favorites": db_stats["favorites"],
                 "unique_websites": db_stats["unique_websites"],
                 "last_entry_date": db_stats["last_entry_date"],
-                "recent_entries_30_days": len(recent_entries),
-                "most_used_websites": sorted(
-                    website_counts.items(), key=lambda x: x[1], reverse=True
-                )[:5],
-                "most_used_usernames": sorted(
-                    username_counts.items(), key=lambda x: x[1], reverse=True
-                )[:5],
-                "duplicate_usernames": sum(1 for count in username_counts.values() if count > 1),
-                "entries_per_website": {site: count for site, count in website_counts.items()},
+                "recent_entries_30_days": aggregates["recent_entries"],
+                "most_used_websites": heapq.nlargest(5, website_counts, key=itemgetter(1)),
+                "most_used_usernames": aggregates["top_usernames"],
+                "duplicate_usernames": aggregates["duplicate_usernames"],
+                "entries_per_website": dict(website_counts),
             }
 
             logger.debug(f"Compiled statistics for user {session.username}")
@@ -1026,6 +1104,9 @@ class PasswordManagerCore:
             )
 
             if success:
+                # Other sessions of this user may have cached or verified the old password
+                session = self.auth_manager.validate_session(session_id)
+                self._clear_user_master_passwords(session.user_id)
                 logger.info("Master password changed successfully")
 
             return success
@@ -1036,7 +1117,9 @@ class PasswordManagerCore:
             logger.error(f"Master password change failed: {e}")
             raise PasswordManagerError(f"Master password change failed: {e}")
 
-    def _validate_password_entry_data(self, website: str, username: str, password: str):
+    def _validate_password_entry_data(
+        self, website: str, username: str, password: str
+    ) -> Tuple[str, str]:
         """
         Validate password entry input data
 
@@ -1045,30 +1128,37 @@ class PasswordManagerCore:
             username (str): Username to validate
             password (str): Password to validate
 
+        Returns:
+            Tuple[str, str]: Stripped website and username, for use downstream
+
         Raises:
             InvalidPasswordEntryError: If any data is invalid
         """
-        if not website or not website.strip():
+        website = website.strip() if website else ""
+        if not website:
             raise InvalidPasswordEntryError("Website cannot be empty")
 
-        if not username or not username.strip():
+        username = username.strip() if username else ""
+        if not username:
             raise InvalidPasswordEntryError("Username cannot be empty")
 
         if not password:
             raise InvalidPasswordEntryError("Password cannot be empty")
 
         # Validate website format (basic check)
-        if len(website.strip()) > 255:
+        if len(website) > 255:
             raise InvalidPasswordEntryError("Website name too long (max 255 characters)")
 
         # Validate username format
-        if len(username.strip()) > 255:
+        if len(username) > 255:
             raise InvalidPasswordEntryError("Username too long (max 255 characters)")
 
         # Validate password length
         if len(password) > 1000:
             raise InvalidPasswordEntryError("Password too long (max 1000 characters)")
 
+        return website, username
+
     def _check_duplicate_entry(self, user_id: int, website: str, username: str) -> bool:
         """
         Check if a password entry already exists for the same website/username combination
@@ -1082,16 +1172,8 @@ class PasswordManagerCore:
             bool: True if duplicate exists, False otherwise
         """
         try:
-            entries = self.auth_manager.db_manager.get_password_entries(user_id, website=website)
-
-            for entry in entries:
-                if (
-                    entry["website"].lower() == website.strip().lower()
-                    and entry["username"].lower() == username.strip().lower()
-                ):
-                    return True
-
-            return False
+            # Indexed case-insensitive lookup, no entries are loaded
+            return self.auth_manager.db_manager.exists_password_entry(user_id, website, username)
 
         except Exception as e:
             logger.error(f"Error checking duplicate entry: {e}")
@@ -1101,6 +1183,12 @@ class PasswordManagerCore:
         """
         Verify master password by testing decryption of an existing entry
 
+        Once a password has been verified for a session, a salted fingerprint is
+        kept in the session's master password cache entry, so later verifications
+        are a constant-time hash compare instead of a full key derivation. The
+        fingerprint expires, is evicted and is wiped together with that entry, and
+        is not stored if the user's cached passwords were cleared during the check.
+
         Args:
             session_id (str): Session ID to get user context
             master_password (str): Master password to verify
@@ -1112,69 +1200,292 @@ class PasswordManagerCore:
             # Get session to access user context
             session = self.auth_manager.validate_session(session_id)
 
-            # Get any existing password entry to test decryption
-            entries = self.auth_manager.db_manager.get_password_entries(session.user_id)
+            if self.cache_mode == PasswordCacheMode.NO_CACHE:
+                return self._verify_master_password_slow(session, master_password)
 
-            if not entries:
-                # No entries exist yet, so we can't verify the master password this way
-                # We need to check against the user's account in a different way
-                # For now, we'll attempt to authenticate the user again
-                user_info = self.auth_manager.db_manager.authenticate_user(
-                    session.username, master_password
-                )
-                return user_info is not None
+            # Captured before the slow check, which a concurrent clear may overtake
+            generation = self._master_password_generations.get(session.user_id, 0)
+            fingerprint = self._master_password_fingerprint(master_password)
 
-            # Try to decrypt the first password entry
-            test_entry = entries[0]
-            try:
-                session.encryption_system.decrypt_password(
-                    test_entry["password_encrypted"], master_password
-                )
-                return True
-            except (DecryptionError, EncryptionError):
-                return False
+            password_cache, shard_lock, _ = self._shard(session_id)
+            with shard_lock:
+                cache_entry = password_cache.get(session_id)
+                if cache_entry is not None and (
+                    "expires_at_monotonic" not in cache_entry
+                    or time.monotonic() <= cache_entry["expires_at_monotonic"]
+                ):
+                    known = cache_entry.get("verified_fingerprint")
+                    if known is not None and hmac.compare_digest(known, fingerprint):
+                        return True
+                else:
+                    cache_entry = None
+
+            verified = self._verify_master_password_slow(session, master_password)
+
+            if verified and cache_entry is not None:
+                with shard_lock:
+                    # Only remember it if the entry is still the session's live entry and
+                    # the user's cached passwords were not cleared in the meantime
+                    if (
+                        password_cache.get(session_id) is cache_entry
+                        and self._master_password_generations.get(session.user_id, 0) == generation
+                    ):
+                        cache_entry["verified_fingerprint"] = bytearray(fingerprint)
+
+            return verified
 
         except Exception as e:
             logger.error(f"Master password verification failed: {e}")
             return False
 
-    def _cache_master_password(self, session_id: str, master_password: str):
+    def _verify_master_password_slow(self, session, master_password: str) -> bool:
+        """
+        Verify master password against stored data (runs the key derivation)
+
+        Args:
+            session (UserSession): Validated session for the user
+            master_password (str): Master password to verify
+
+        Returns:
+            bool: True if master password is correct, False otherwise
+        """
+        # Get any existing password entry to test decryption
+        test_entry = self.auth_manager.db_manager.get_one_password_entry(session.user_id)
+
+        if not test_entry:
+            # No entries exist yet, so we can't verify the master password this way
+            # We need to check against the user's account in a different way
+            # For now, we'll attempt to authenticate the user again
+            user_info = self.auth_manager.db_manager.authenticate_user(
+                session.username, master_password
+            )
+            return user_info is not None
+
+        # Try to decrypt the password entry
+        try:
+            session.encryption_system.decrypt_password(
+                test_entry["password_encrypted"], master_password
+            )
+            return True
+        except (DecryptionError, EncryptionError):
+            return False
+
+    def _master_password_fingerprint(self, master_password: str) -> bytes:
+        """
+        Compute the salted fingerprint used to remember verified master passwords
+
+        Args:
+            master_password (str): Master password to fingerprint
+
+        Returns:
+            bytes: SHA-256 digest of the per-instance salt and the password
+        """
+        return hashlib.sha256(self._fingerprint_salt + master_password.encode("utf-8")).digest()
+
+    def _clear_user_master_passwords(self, user_id: int):
+        """
+        Wipe the cached master passwords and fingerprints of every session of a user
+
+        The user's generation is bumped before the shards are walked, so a
+        verification still running against the old password cannot store its
+        fingerprint afterwards.
+
+        Args:
+            user_id (int): User whose cached master passwords should be cleared
+        """
+        with self._generation_lock:
+            self._master_password_generations[user_id] = (
+                self._master_password_generations.get(user_id, 0) + 1
+            )
+
+        for password_cache, shard_lock, _ in self._shards:
+            with shard_lock:
+                stale = [
+                    cached_session_id
+                    for cached_session_id, entry in password_cache.items()
+                    if entry.get("user_id") == user_id
+                ]
+                for cached_session_id in stale:
+                    self._wipe_cache_entry(password_cache.pop(cached_session_id))
+
+    def _shard(self, session_id: str):
+        """
+        Get the master password cache shard that owns a session
+
+        Every read or write of a shard's entries takes the shard lock.
+
+        Args:
+            session_id (str): Session ID
+
+        Returns:
+            Tuple[Dict, threading.Lock, List]: (password cache, shard lock, expiry heap)
+        """
+        return self._shards[hash(session_id) & (MASTER_PASSWORD_CACHE_SHARDS - 1)]
+
+    def _cache_master_password(self, session_id: str, master_password: str, user_id: int):
         """
         Cache master password based on configured caching mode
 
         Args:
             session_id (str): Session ID for cache key
             master_password (str): Master password to cache
+            user_id (int): User owning the session
         """
         if self.cache_mode == PasswordCacheMode.NO_CACHE:
             return
 
         try:
-            with self._cache_lock:
+            password_cache, shard_lock, expiry_heap = self._shard(session_id)
+            with shard_lock:
                 # Store master password securely in memory for session duration
                 # Note: This is stored in memory only and cleared when session ends
                 cache_entry = {
-                    "master_password": master_password,  # Store actual password for encryption operations
-                    "password_hash": hashlib.sha256(
-                        master_password.encode("utf-8")
-                    ).hexdigest(),  # Keep hash for verification
-                    "cached_at": datetime.now(),
+                    # Kept as a bytearray so it can be zeroed in place when removed
+                    "master_password": bytearray(master_password.encode("utf-8")),
                     "session_id": session_id,
+                    "user_id": user_id,
+                    "referenced": True,  # Clock bit, set again by every cache hit
                 }
 
+                # Re-caching the same password keeps its verification with the new entry
+                previous = password_cache.get(session_id)
+                if (
+                    previous is not None
+                    and "verified_fingerprint" in previous
+                    and hmac.compare_digest(
+                        previous.get("master_password", b""), cache_entry["master_password"]
+                    )
+                ):
+                    cache_entry["verified_fingerprint"] = previous.pop("verified_fingerprint")
+
                 if self.cache_mode == PasswordCacheMode.TEMPORARY:
-                    cache_entry["expires_at"] = datetime.now() + timedelta(
-                        minutes=self.cache_timeout_minutes
+                    cache_entry["expires_at_monotonic"] = (
+                        time.monotonic() + self.cache_timeout_minutes * 60
                     )
                 elif self.cache_mode == PasswordCacheMode.SESSION:
                     # Cache until session expires (handled by session cleanup)
-                    cache_entry["expires_at"] = datetime.now() + timedelta(hours=8)
+                    cache_entry["expires_at_monotonic"] = time.monotonic() + 8 * 60 * 60
 
-                self._master_password_cache[session_id] = cache_entry
+                self._expire_from_shard(password_cache, expiry_heap)
+
+                if (
+                    session_id not in password_cache
+                    and len(password_cache) >= MASTER_PASSWORD_CACHE_SHARD_CAPACITY
+                ):
+                    self._evict_from_shard(password_cache)
+
+                password_cache[session_id] = cache_entry
+                if "expires_at_monotonic" in cache_entry:
+                    heapq.heappush(expiry_heap, (cache_entry["expires_at_monotonic"], session_id))
 
         except Exception as e:
             logger.error(f"Failed to cache master password: {e}")
 
+    def _evict_from_shard(self, password_cache: Dict[str, Dict]):
+        """
+        Make room in a full master password cache shard (Clock / second chance)
+
+        Walks the shard in insertion order: expired entries are dropped,
+        recently referenced entries lose their reference bit and survive, and the
+        first unreferenced entry is evicted. Must be called with the shard lock held.
+
+        Args:
+            password_cache (Dict[str, Dict]): Shard cache to evict from
+        """
+        now = time.monotonic()
+        victims = []
+
+        for cached_session_id, entry in password_cache.items():
+            if "expires_at_monotonic" in entry and now > entry["expires_at_monotonic"]:
+                victims.append(cached_session_id)
+            elif entry.get("referenced"):
+                entry["referenced"] = False
+            else:
+                victims.append(cached_session_id)
+                break
+        else:
+            # Every live entry had a second chance; evict the oldest one
+            if not victims and password_cache:
+                victims.append(next(iter(password_cache)))
+
+        for cached_session_id in victims:
+            self._wipe_cache_entry(password_cache.pop(cached_session_id))
+
+    def _expire_from_shard(self, password_cache: Dict[str, Dict], expiry_heap: List[Tuple]) -> int:
+        """
+        Wipe the expired master passwords of a shard using its expiry heap
+
+        Heap items whose session was replaced or removed since are discarded.
+        Must be called with the shard lock held.
+
+        Args:
+            password_cache (Dict[str, Dict]): Shard cache to expire from
+            expiry_heap (List[Tuple]): Shard heap of (expires_at_monotonic, session_id)
+
+        Returns:
+            int: Number of cached master passwords removed
+        """
+        now = time.monotonic()
+        removed = 0
+
+        while expiry_heap and expiry_heap[0][0] < now:
+            expires_at, cached_session_id = heapq.heappop(expiry_heap)
+            entry = password_cache.get(cached_session_id)
+            if entry is not None and entry.get("expires_at_monotonic") == expires_at:
+                self._wipe_cache_entry(password_cache.pop(cached_session_id))
+                removed += 1
+
+        # Re-caching a session leaves stale heap items behind; rebuild once they
+        # clearly outnumber the live entries
+        if len(expiry_heap) > 2 * max(len(password_cache), MASTER_PASSWORD_CACHE_SHARD_CAPACITY):
+            expiry_heap[:] = [
+                (entry["expires_at_monotonic"], cached_session_id)
+                for cached_session_id, entry in password_cache.items()
+                if "expires_at_monotonic" in entry
+            ]
+            heapq.heapify(expiry_heap)
+
+        return removed
+
+    def _wipe_cache_entry(self, cache_entry: Dict):
+        """
+        Overwrite and drop the master password held by a removed cache entry
+
+        Args:
+            cache_entry (Dict): Entry already removed from its shard
+        """
+        if cache_entry and "master_password" in cache_entry:
+            secret = cache_entry.pop("master_password")
+            _zero_bytearray(secret)
+        if cache_entry:
+            self._wipe_fingerprint(cache_entry)
+
+    def _wipe_fingerprint(self, cache_entry: Dict):
+        """
+        Overwrite and drop the verified master password fingerprint of a cache entry
+
+        Args:
+            cache_entry (Dict): Entry whose fingerprint should be forgotten
+        """
+        fingerprint = cache_entry.pop("verified_fingerprint", None)
+        if fingerprint is not None:
+            _zero_bytearray(fingerprint)
+
+    def _sweep_master_password_cache(self) -> int:
+        """
+        Remove expired master passwords from every shard
+
+        Returns:
+            int: Number of cached master passwords removed
+        """
+        removed = 0
+
+        for password_cache, shard_lock, expiry_heap in self._shards:
+            with shard_lock:
+                removed += self._expire_from_shard(password_cache, expiry_heap)
+
+        return removed
+
     def _get_cached_master_password(self, session_id: str) -> Optional[str]:
         """
         Get cached master password if available and valid
@@ -1189,20 +1500,39 @@ class PasswordManagerCore:
             return None
 
         try:
-            with self._cache_lock:
-                cache_entry = self._master_password_cache.get(session_id)
+            # Expiry, eviction and clearing zero an entry's secret in place under the
+            # shard lock, so the lookup and the copy of the secret take it as well
+            password_cache, shard_lock, expiry_heap = self._shard(session_id)
+            with shard_lock:
+                now = time.monotonic()
+
+                # Wipe whatever has expired in this shard once the earliest deadline passes
+                if expiry_heap and expiry_heap[0][0] < now:
+                    self._expire_from_shard(password_cache, expiry_heap)
+
+                cache_entry = password_cache.get(session_id)
 
                 if not cache_entry:
                     return None
 
                 # Check expiration
-                if "expires_at" in cache_entry and datetime.now() > cache_entry["expires_at"]:
-                    # Remove expired entry
-                    self._master_password_cache.pop(session_id, None)
+                if (
+                    "expires_at_monotonic" in cache_entry
+                    and now > cache_entry["expires_at_monotonic"]
+                ):
+                    self._wipe_cache_entry(password_cache.pop(session_id))
+                    return None
+
+                # Mark as recently used for Clock eviction
+                cache_entry["referenced"] = True
+
+                secret = cache_entry.get("master_password")
+                if secret is None:
                     return None
+                secret = bytes(secret)
 
-                # Return the cached master password (stored securely in memory)
-                return cache_entry.get("master_password")
+            # Return the cached master password (stored securely in memory)
+            return secret.decode("utf-8")
 
         except Exception as e:
             logger.error(f"Failed to get cached master password: {e}")
@@ -1216,60 +1546,123 @@ class PasswordManagerCore:
             session_id (str, optional): Specific session to clear, or None for all
         """
         try:
-            with self._cache_lock:
-                if session_id:
-                    cache_entry = self._master_password_cache.pop(session_id, None)
-                    if cache_entry and "master_password" in cache_entry:
-                        # Securely clear the password from memory
-                        cache_entry["master_password"] = "0" * len(cache_entry["master_password"])
-                        del cache_entry["master_password"]
-                else:
-                    # Clear all cached passwords securely
-                    for entry in self._master_password_cache.values():
-                        if "master_password" in entry:
-                            entry["master_password"] = "0" * len(entry["master_password"])
-                            del entry["master_password"]
-                    self._master_password_cache.clear()
+            if session_id:
+                password_cache, shard_lock, _ = self._shard(session_id)
+                with shard_lock:
+                    # Securely clear the password (and its fingerprint) from memory
+                    self._wipe_cache_entry(password_cache.pop(session_id, None))
+            else:
+                # Clear all cached passwords securely, one shard at a time
+                for password_cache, shard_lock, expiry_heap in self._shards:
+                    with shard_lock:
+                        for entry in password_cache.values():
+                            self._wipe_cache_entry(entry)
+                        password_cache.clear()
+                        expiry_heap.clear()
 
         except Exception as e:
             logger.error(f"Failed to clear master password cache: {e}")
 
-    def _sort_entries(
-        self, entries: List[PasswordEntry], sort_by: str, sort_order: str
-    ) -> List[PasswordEntry]:
+    def _search_cache_key(self, user_id: int, criteria: SearchCriteria) -> str:
         """
-        Sort password entries by specified criteria
+        Build the password cache key for a set of search criteria
+
+        Results are cached already filtered, sorted and limited, so every
+        criterion that shapes the result has to be part of the key.
 
         Args:
-            entries (List[PasswordEntry]): Entries to sort
-            sort_by (str): Field to sort by
-            sort_order (str): "asc" or "desc"
+            user_id (int): User ID
+            criteria (SearchCriteria): Search criteria
 
         Returns:
-            List[PasswordEntry]: Sorted entries
+            str: Cache key
         """
-        try:
-            reverse = sort_order.lower() == "desc"
-
-            if sort_by == "website":
-                return sorted(entries, key=lambda e: e.website.lower(), reverse=reverse)
-            elif sort_by == "username":
-                return sorted(entries, key=lambda e: e.username.lower(), reverse=reverse)
-            elif sort_by == "created_at":
-                return sorted(entries, key=lambda e: e.created_at or datetime.min, reverse=reverse)
-            elif sort_by == "modified_at":
-                return sorted(entries, key=lambda e: e.modified_at or datetime.min, reverse=reverse)
-            elif sort_by == "favorite":
-                return sorted(
-                    entries, key=lambda e: (e.is_favorite, e.website.lower()), reverse=reverse
-                )
-            else:
-                # Default to website sorting
-                return sorted(entries, key=lambda e: e.website.lower(), reverse=reverse)
+        default_order = (criteria.sort_by or "website") == "website" and (
+            criteria.sort_order or "asc"
+        ).lower() == "asc"
+        only_base_filters = (
+            default_order
+            and not criteria.username
+            and not criteria.remarks
+            and not criteria.date_from
+            and not criteria.date_to
+            and not criteria.limit
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to sort entries: {e}")
-            return entries
+        if only_base_filters:
+            if criteria.website and criteria.is_favorite is None:
+                return CacheKeyBuilder.website_filter(user_id, criteria.website)
+            if not criteria.website and criteria.is_favorite is True:
+                return CacheKeyBuilder.favorites(user_id)
+            if not criteria.website and criteria.is_favorite is None:
+                return CacheKeyBuilder.all_passwords(user_id)
+
+        query = "|".join(
+            str(part)
+            for part in (
+                criteria.website,
+                criteria.username,
+                criteria.remarks,
+                criteria.is_favorite,
+                criteria.date_from.isoformat() if criteria.date_from else None,
+                criteria.date_to.isoformat() if criteria.date_to else None,
+                criteria.sort_by,
+                criteria.sort_order,
+                criteria.limit,
+            )
+        )
+        return CacheKeyBuilder.search_query(user_id, query)
+
+    def _resolve_master_password_for_search(
+        self, session_id: str, master_password: Optional[str], include_passwords: bool
+    ) -> Optional[str]:
+        """
+        Get a verified master password for decrypting search results
+
+        Args:
+            session_id (str): Session ID for cache lookup and verification
+            master_password (str, optional): Explicitly provided master password
+            include_passwords (bool): Whether passwords are being decrypted at all
+
+        Returns:
+            Optional[str]: Verified master password, or None if unavailable or invalid
+        """
+        if not include_passwords:
+            return None
+
+        mp = master_password or self._get_cached_master_password(session_id)
+        if mp and self._verify_master_password(session_id, mp):
+            return mp
+        return None
+
+    def _decrypt_with_derived_keys(
+        self,
+        session,
+        encrypted_blob: bytes,
+        master_password: str,
+        derived_keys: Dict[bytes, bytes],
+    ) -> str:
+        """
+        Decrypt a password, reusing keys already derived for the same salt
+
+        Args:
+            session (UserSession): Session providing the encryption system
+            encrypted_blob (bytes): Encrypted password blob
+            master_password (str): Master password for key derivation
+            derived_keys (Dict[bytes, bytes]): Salt -> key memo shared across a batch
+
+        Returns:
+            str: Decrypted password
+        """
+        encryption = session.encryption_system
+        salt = encryption.get_salt(encrypted_blob)
+
+        key = derived_keys.get(salt)
+        if key is None:
+            key = encryption.derive_key(master_password, salt)
+            derived_keys[salt] = key
+
+        return encryption.decrypt_password_with_key(encrypted_blob, key)
 
     def get_cache_metrics(self) -> Optional[Dict[str, Any]]:
         """
@@ -1291,21 +1684,22 @@ class PasswordManagerCore:
         """
         metrics = {
             "operations": self._performance_monitor.get_performance_summary(),
-            "operation_details": self._performance_monitor.get_operation_stats(),
+            "operation_details": self._performance_monitor.snapshot_operation_stats(),
             "cache": self.get_cache_metrics(),
         }
         return metrics
 
     def cleanup_expired_cache(self) -> int:
         """
-        Clean up expired cache entries
+        Clean up expired cache entries, including expired cached master passwords
 
         Returns:
             int: Number of entries removed
         """
+        removed = self._sweep_master_password_cache()
         if self._password_cache:
-            return self._password_cache.cleanup_expired()
-        return 0
+            removed += self._password_cache.cleanup_expired()
+        return removed
 
     def shutdown(self):
         """
@@ -1348,6 +1742,44 @@ def create_password_manager(
     return PasswordManagerCore(db_path, cache_mode)
 
 
+def _is_valid_parsed_url(url: str, parsed) -> bool:
+    """
+    Check a parsed URL against the accepted website format
+
+    Accepts http(s) URLs whose host is a domain name, localhost or an IPv4
+    address, with an optional port and a whitespace-free path or query.
+
+    Args:
+        url (str): Original URL
+        parsed: Result of urlparse(url)
+
+    Returns:
+        bool: True if the URL is acceptable
+    """
+    if parsed.scheme.lower() not in ("http", "https") or _WHITESPACE_RE.search(url):
+        return False
+
+    netloc_match = _NETLOC_RE.fullmatch(parsed.netloc)
+    if not netloc_match:
+        return False
+
+    # Anything after the authority must be "/" or a non-empty path or query
+    rest = url[len(parsed.scheme) + 3 + len(parsed.netloc) :]
+    if rest and rest != "/" and (rest[0] not in "/?" or len(rest) == 1):
+        return False
+
+    host = netloc_match.group(1)
+    if host.lower() == "localhost" or _IPV4_RE.fullmatch(host):
+        return True
+
+    labels = host[:-1].split(".") if host.endswith(".") else host.split(".")
+    return (
+        len(labels) >= 2
+        and _TLD_RE.fullmatch(labels[-1]) is not None
+        and all(_HOST_LABEL_RE.fullmatch(label) for label in labels[:-1])
+    )
+
+
 def validate_website_url(url: str) -> Dict[str, Any]:
     """
     Validate and normalize website URL for storage
@@ -1358,7 +1790,8 @@ def validate_website_url(url: str) -> Dict[str, Any]:
     Returns:
         Dict[str, Any]: Validation results and normalized URL
     """
-    if not url or not url.strip():
+    url = url.strip() if url else ""
+    if not url:
         return {
             "is_valid": False,
             "normalized_url": "",
@@ -1366,7 +1799,14 @@ def validate_website_url(url: str) -> Dict[str, Any]:
             "suggestions": ["Enter a website URL"],
         }
 
-    url = url.strip()
+    if len(url) > MAX_WEBSITE_URL_LENGTH:
+        return {
+            "is_valid": False,
+            "normalized_url": url,
+            "issues": ["URL is too long"],
+            "suggestions": [f"Enter a URL of at most {MAX_WEBSITE_URL_LENGTH} characters"],
+        }
+
     issues = []
     suggestions = []
 
@@ -1379,31 +1819,19 @@ def validate_website_url(url: str) -> Dict[str, Any]:
             suggestions.append("URLs should start with http:// or https://")
 
     # Basic URL validation
-    url_pattern = re.compile(
-        r"^https?://"  # http:// or https://
-        r"(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|"  # domain...
-        r"localhost|"  # localhost...
-        r"\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})"  # ...or ip
-        r"(?::\d+)?"  # optional port
-        r"(?:/?|[/?]\S+)$",
-        re.IGNORECASE,
-    )
+    try:
+        parsed = urlparse(url)
+    except ValueError:
+        parsed = None
 
-    is_valid = bool(url_pattern.match(url))
+    is_valid = parsed is not None and _is_valid_parsed_url(url, parsed)
 
     if not is_valid:
         issues.append("Invalid URL format")
         suggestions.append("Enter a valid website URL (e.g., https://example.com)")
 
     # Extract domain for display
-    domain = url
-    try:
-        from urllib.parse import urlparse
-
-        parsed = urlparse(url)
-        domain = parsed.netloc or parsed.path
-    except Exception:
-        pass
+    domain = (parsed.netloc or parsed.path) if parsed is not None else url
 
     return {
         "is_valid": is_valid and len(issues) == 0,
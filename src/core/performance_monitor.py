@@ -18,18 +18,31 @@ Author: Personal Password Manager
 Version: 2.2.0
 """
 
+import array
 import functools
+import heapq
+import itertools
+import random
+import sys
 import threading
 import time
-from collections import defaultdict, deque
+from collections import deque
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Optional
+from operator import attrgetter
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
 
 from .logging_config import get_logger
 
 logger = get_logger(__name__)
 
+# Number of lock stripes for per-operation statistics (must be a power of two)
+STATS_LOCK_STRIPES = 16
+
+# Slots of the per-operation statistics record (array.array("d"))
+_COUNT, _TOTAL_MS, _MIN_MS, _MAX_MS, _SUCCESS, _FAILURE, _LAST_EXECUTION = range(7)
+
 
 @dataclass
 class OperationMetrics:
@@ -48,6 +61,15 @@ class OperationMetrics:
         return self.duration_ms / 1000.0
 
 
+class _MonitorSettings(NamedTuple):
+    """Settings read on every monitored call, replaced as a whole when one changes"""
+
+    enabled: bool
+    sample_rate: float
+    detailed: bool
+    record: Callable[..., Optional[OperationMetrics]]
+
+
 class PerformanceMonitor:
     """
     Performance monitoring and profiling system
@@ -56,35 +78,114 @@ class PerformanceMonitor:
     to identify bottlenecks and optimize performance.
     """
 
-    def __init__(self, max_history: int = 1000, enable_detailed_tracking: bool = True):
+    __slots__ = (
+        "max_history",
+        "_settings",
+        "_lock",
+        "_stats_locks",
+        "_operation_history",
+        "_operation_stats",
+        "_stats_recorders",
+        "_tls",
+        "_operation_ids",
+    )
+
+    def __init__(
+        self,
+        max_history: int = 1000,
+        enable_detailed_tracking: bool = True,
+        enabled: bool = True,
+        sample_rate: float = 1.0,
+    ):
         """
         Initialize performance monitor
 
         Args:
             max_history: Maximum number of operations to keep in history
             enable_detailed_tracking: Enable detailed per-operation tracking
+            enabled: Whether monitor() decorated calls are measured at all
+            sample_rate: Fraction (0.0-1.0) of monitor() decorated calls to measure
         """
         self.max_history = max_history
-        self.enable_detailed_tracking = enable_detailed_tracking
 
-        # Thread safety
-        self._lock = threading.RLock()
+        # Thread safety: _lock guards history reads and resets, per-operation
+        # statistics are striped by operation name
+        self._lock = threading.Lock()
+        self._stats_locks = [threading.Lock() for _ in range(STATS_LOCK_STRIPES)]
 
         # Operation metrics
         self._operation_history: deque = deque(maxlen=max_history)
-        self._operation_stats: Dict[str, Dict[str, Any]] = defaultdict(self._default_stats)
+        self._operation_stats: Dict[str, array.array] = {}
+        self._stats_recorders: Dict[str, Callable[[float, bool], None]] = {}
+
+        # Current operations (for nested timing), one in-flight map per thread
+        # keyed by operation ID (insertion order preserves nesting)
+        self._tls = threading.local()
+        self._operation_ids = itertools.count(1)
 
-        # Current operations (for nested timing)
-        self._current_operations: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
+        # Immutable settings snapshot, swapped by a single assignment so monitor()
+        # wrappers read all of them with one attribute lookup per call
+        self._settings = self._make_settings(enabled, sample_rate, enable_detailed_tracking)
 
         logger.info(f"Performance monitor initialized (max_history={max_history})")
 
+    def _make_settings(self, enabled: bool, sample_rate: float, detailed: bool) -> _MonitorSettings:
+        """
+        Build a settings snapshot
+
+        The recording strategy for end_operation is resolved here instead of per
+        call, so already decorated functions follow later changes of the flag.
+
+        Args:
+            enabled: Whether monitor() decorated calls are measured at all
+            sample_rate: Fraction (0.0-1.0) of monitor() decorated calls to measure
+            detailed: Whether detailed per-operation tracking is enabled
+
+        Returns:
+            _MonitorSettings: New settings snapshot
+        """
+        record = self._record_detailed if detailed else self._record_counters_only
+        return _MonitorSettings(enabled, sample_rate, detailed, record)
+
+    @property
+    def enabled(self) -> bool:
+        """Whether monitor() decorated calls are measured at all"""
+        return self._settings.enabled
+
+    @enabled.setter
+    def enabled(self, enabled: bool) -> None:
+        with self._lock:
+            settings = self._settings
+            self._settings = self._make_settings(enabled, settings.sample_rate, settings.detailed)
+
+    @property
+    def sample_rate(self) -> float:
+        """Fraction (0.0-1.0) of monitor() decorated calls to measure"""
+        return self._settings.sample_rate
+
+    @sample_rate.setter
+    def sample_rate(self, sample_rate: float) -> None:
+        with self._lock:
+            settings = self._settings
+            self._settings = self._make_settings(settings.enabled, sample_rate, settings.detailed)
+
+    @property
+    def enable_detailed_tracking(self) -> bool:
+        """Whether finished operations are kept in the history as OperationMetrics"""
+        return self._settings.detailed
+
+    @enable_detailed_tracking.setter
+    def enable_detailed_tracking(self, enabled: bool) -> None:
+        with self._lock:
+            settings = self._settings
+            self._settings = self._make_settings(settings.enabled, settings.sample_rate, enabled)
+
     def _default_stats(self) -> Dict[str, Any]:
         """Get default statistics structure"""
         return {
             "count": 0,
             "total_time_ms": 0.0,
-            "min_time_ms": float("in"),
+            "min_time_ms": float("inf"),
             "max_time_ms": 0.0,
             "avg_time_ms": 0.0,
             "success_count": 0,
@@ -92,6 +193,33 @@ class PerformanceMonitor:
             "last_execution": None,
         }
 
+    @staticmethod
+    def _new_stats_record() -> array.array:
+        """Get an empty fixed-shape statistics record"""
+        return array.array("d", (0.0, 0.0, float("inf"), 0.0, 0.0, 0.0, 0.0))
+
+    def _stats_from_record(self, record: array.array) -> Dict[str, Any]:
+        """
+        Convert a statistics record into the public statistics dictionary
+
+        Args:
+            record: Copy of an operation's statistics record
+
+        Returns:
+            Dict[str, Any]: Statistics in the _default_stats() layout
+        """
+        count = int(record[_COUNT])
+        return {
+            "count": count,
+            "total_time_ms": record[_TOTAL_MS],
+            "min_time_ms": record[_MIN_MS],
+            "max_time_ms": record[_MAX_MS],
+            "avg_time_ms": record[_TOTAL_MS] / count if count else 0.0,
+            "success_count": int(record[_SUCCESS]),
+            "failure_count": int(record[_FAILURE]),
+            "last_execution": datetime.fromtimestamp(record[_LAST_EXECUTION]) if count else None,
+        }
+
     def start_operation(
         self, operation_name: str, metadata: Optional[Dict[str, Any]] = None
     ) -> int:
@@ -105,20 +233,23 @@ class PerformanceMonitor:
         Returns:
             int: Operation ID for use with end_operation
         """
-        with self._lock:
-            thread_id = threading.get_ident()
-            operation_id = id((thread_id, time.time()))
-
-            operation = {
-                "id": operation_id,
-                "name": operation_name,
-                "start_time": time.time(),
-                "metadata": metadata or {},
-            }
+        # Unique for the monitor's lifetime (id() of a temporary could be reused);
+        # next() on itertools.count is atomic, so no lock is needed
+        operation_id = next(self._operation_ids)
+
+        operation = {
+            "id": operation_id,
+            "name": operation_name,
+            "start_ns": time.perf_counter_ns(),
+            "metadata": metadata or {},
+        }
 
-            self._current_operations[thread_id].append(operation)
+        in_flight = getattr(self._tls, "operations", None)
+        if in_flight is None:
+            in_flight = self._tls.operations = {}
+        in_flight[operation_id] = operation
 
-            return operation_id
+        return operation_id
 
     def end_operation(
         self, operation_id: int, success: bool = True, metadata: Optional[Dict[str, Any]] = None
@@ -131,88 +262,197 @@ class PerformanceMonitor:
             success: Whether the operation succeeded
             metadata: Additional metadata to add
 
+        Returns:
+            Optional[OperationMetrics]: Metrics for the completed operation, or None
+            when detailed tracking is disabled or the operation is unknown
+        """
+        end_ns = time.perf_counter_ns()
+
+        in_flight = getattr(self._tls, "operations", None)
+        operation = in_flight.pop(operation_id, None) if in_flight else None
+
+        if not operation:
+            logger.warning(f"Operation {operation_id} not found in current operations")
+            return None
+
+        # Duration from the monotonic clock
+        duration_ms = (end_ns - operation["start_ns"]) / 1_000_000
+
+        return self._settings.record(operation, duration_ms, success, metadata)
+
+    def _record_detailed(
+        self,
+        operation: Dict[str, Any],
+        duration_ms: float,
+        success: bool,
+        metadata: Optional[Dict[str, Any]],
+    ) -> OperationMetrics:
+        """
+        Record a finished operation in the history and the statistics
+
+        Args:
+            operation: In-flight operation record from start_operation
+            duration_ms: Measured duration in milliseconds
+            success: Whether the operation succeeded
+            metadata: Additional metadata to merge
+
         Returns:
             OperationMetrics: Metrics for the completed operation
         """
-        with self._lock:
-            thread_id = threading.get_ident()
-            operations = self._current_operations[thread_id]
-
-            # Find and remove the operation
-            operation = None
-            for i, op in enumerate(operations):
-                if op["id"] == operation_id:
-                    operation = operations.pop(i)
-                    break
-
-            if not operation:
-                logger.warning(f"Operation {operation_id} not found in current operations")
-                return None
-
-            # Calculate metrics
-            end_time = time.time()
-            duration_ms = (end_time - operation["start_time"]) * 1000
-
-            # Merge metadata
-            full_metadata = operation["metadata"].copy()
-            if metadata:
-                full_metadata.update(metadata)
-
-            metrics = OperationMetrics(
-                operation_name=operation["name"],
-                start_time=operation["start_time"],
-                end_time=end_time,
-                duration_ms=duration_ms,
-                success=success,
-                metadata=full_metadata,
-            )
+        # Wall-clock times are derived from a single time.time() call
+        end_time = time.time()
+
+        # Merge metadata
+        full_metadata = operation["metadata"].copy()
+        if metadata:
+            full_metadata.update(metadata)
+
+        metrics = OperationMetrics(
+            operation_name=operation["name"],
+            start_time=end_time - duration_ms / 1000,
+            end_time=end_time,
+            duration_ms=duration_ms,
+            success=success,
+            metadata=full_metadata,
+        )
 
-            # Record metrics
-            self._record_metrics(metrics)
+        # Add to history (deque.append is atomic, bounded by maxlen)
+        self._operation_history.append(metrics)
+        self._update_stats(operation["name"], duration_ms, success)
 
-            return metrics
+        return metrics
 
-    def _record_metrics(self, metrics: OperationMetrics) -> None:
+    def _record_counters_only(
+        self,
+        operation: Dict[str, Any],
+        duration_ms: float,
+        success: bool,
+        metadata: Optional[Dict[str, Any]],
+    ) -> None:
         """
-        Record operation metrics
+        Record a finished operation in the statistics only (no metrics object)
 
         Args:
-            metrics: Operation metrics to record
+            operation: In-flight operation record from start_operation
+            duration_ms: Measured duration in milliseconds
+            success: Whether the operation succeeded
+            metadata: Ignored without detailed tracking
         """
-        with self._lock:
-            # Add to history
-            if self.enable_detailed_tracking:
-                self._operation_history.append(metrics)
-
-            # Update statistics
-            stats = self._operation_stats[metrics.operation_name]
-            stats["count"] += 1
-            stats["total_time_ms"] += metrics.duration_ms
-            stats["min_time_ms"] = min(stats["min_time_ms"], metrics.duration_ms)
-            stats["max_time_ms"] = max(stats["max_time_ms"], metrics.duration_ms)
-            stats["avg_time_ms"] = stats["total_time_ms"] / stats["count"]
-            stats["last_execution"] = datetime.now()
-
-            if metrics.success:
-                stats["success_count"] += 1
-            else:
-                stats["failure_count"] += 1
-
-    def get_operation_stats(self, operation_name: Optional[str] = None) -> Dict[str, Any]:
+        self._update_stats(operation["name"], duration_ms, success)
+
+    def _stats_lock(self, operation_name: str) -> threading.Lock:
+        """
+        Get the lock stripe guarding an operation's statistics
+
+        Args:
+            operation_name: Name of the operation
+
+        Returns:
+            threading.Lock: Stripe lock for the operation
+        """
+        return self._stats_locks[hash(operation_name) & (STATS_LOCK_STRIPES - 1)]
+
+    def _update_stats(self, operation_name: str, duration_ms: float, success: bool) -> None:
+        """
+        Fold one measurement into an operation's statistics
+
+        Args:
+            operation_name: Name of the operation
+            duration_ms: Measured duration in milliseconds
+            success: Whether the operation succeeded
+        """
+        self._stats_recorder(operation_name)(duration_ms, success)
+
+    def _stats_recorder(self, operation_name: str) -> Callable[[float, bool], None]:
+        """
+        Get the statistics updater for an operation, built once per name
+
+        Args:
+            operation_name: Name of the operation
+
+        Returns:
+            Callable[[float, bool], None]: Updater taking (duration_ms, success)
+        """
+        recorder = self._stats_recorders.get(operation_name)
+        if recorder is None:
+            recorder = self._stats_recorders.setdefault(
+                operation_name, self._build_stats_recorder(operation_name)
+            )
+        return recorder
+
+    def _build_stats_recorder(self, operation_name: str) -> Callable[[float, bool], None]:
+        """
+        Build a statistics updater with its lock stripe and containers bound as locals
+
+        The updater is the whole per-call statistics path, so everything it
+        needs is resolved here instead of through attribute lookups per call.
+
+        Args:
+            operation_name: Name of the operation
+
+        Returns:
+            Callable[[float, bool], None]: Updater taking (duration_ms, success)
+        """
+        stats_lock = self._stats_lock(operation_name)
+        operation_stats = self._operation_stats
+        new_stats_record = self._new_stats_record
+        wall_clock = time.time
+
+        def record(duration_ms: float, success: bool) -> None:
+            with stats_lock:
+                stats = operation_stats.get(operation_name)
+                if stats is None:
+                    stats = operation_stats[operation_name] = new_stats_record()
+                stats[_COUNT] += 1
+                stats[_TOTAL_MS] += duration_ms
+                if duration_ms < stats[_MIN_MS]:
+                    stats[_MIN_MS] = duration_ms
+                if duration_ms > stats[_MAX_MS]:
+                    stats[_MAX_MS] = duration_ms
+                stats[_LAST_EXECUTION] = wall_clock()
+
+                if success:
+                    stats[_SUCCESS] += 1
+                else:
+                    stats[_FAILURE] += 1
+
+        return record
+
+    def get_operation_stats(self, operation_name: Optional[str] = None) -> Mapping:
         """
         Get statistics for operations
 
+        Without an operation name this returns a live read-only view: only the
+        operations actually looked up are converted. Use snapshot_operation_stats()
+        for a consistent copy of everything.
+
         Args:
             operation_name: Specific operation name, or None for all
 
         Returns:
-            Dict with operation statistics
+            Mapping with operation statistics
         """
-        with self._lock:
-            if operation_name:
-                return self._operation_stats.get(operation_name, self._default_stats()).copy()
-            else:
-                return {name: stats.copy() for name, stats in self._operation_stats.items()}
+        if operation_name:
+            with self._stats_lock(operation_name):
+                stats = self._operation_stats.get(operation_name)
+                record = stats[:] if stats is not None else None
+            return self._stats_from_record(record) if record else self._default_stats()
+
+        return _OperationStatsView(self)
+
+    def snapshot_operation_stats(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Copy the statistics of every operation
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Statistics per operation name
+        """
+        # list() snapshots the items atomically; each record is copied under its stripe
+        records = {}
+        for name, stats in list(self._operation_stats.items()):
+            with self._stats_lock(name):
+                records[name] = stats[:]
+        return {name: self._stats_from_record(record) for name, record in records.items()}
 
     def get_recent_operations(
         self, count: int = 100, operation_name: Optional[str] = None
@@ -249,9 +489,14 @@ class PerformanceMonitor:
             List of slow operations, sorted by duration
         """
         with self._lock:
-            slow_ops = [op for op in self._operation_history if op.duration_ms >= threshold_ms]
-            slow_ops.sort(key=lambda op: op.duration_ms, reverse=True)
-            return slow_ops[:count]
+            history = list(self._operation_history)
+
+        # Partial selection outside the lock: O(n log count) instead of a full sort
+        return heapq.nlargest(
+            count,
+            (op for op in history if op.duration_ms >= threshold_ms),
+            key=attrgetter("duration_ms"),
+        )
 
     def get_performance_summary(self) -> Dict[str, Any]:
         """
@@ -260,37 +505,38 @@ class PerformanceMonitor:
         Returns:
             Dict with performance summary
         """
-        with self._lock:
-            total_operations = sum(stats["count"] for stats in self._operation_stats.values())
-            total_time_ms = sum(stats["total_time_ms"] for stats in self._operation_stats.values())
-
-            # Find slowest operations
-            slowest_ops = []
-            for name, stats in self._operation_stats.items():
-                if stats["count"] > 0:
-                    slowest_ops.append(
-                        {
-                            "operation": name,
-                            "avg_time_ms": stats["avg_time_ms"],
-                            "max_time_ms": stats["max_time_ms"],
-                            "count": stats["count"],
-                        }
-                    )
-            slowest_ops.sort(key=lambda x: x["avg_time_ms"], reverse=True)
-
-            # Calculate failure rate
-            total_failures = sum(stats["failure_count"] for stats in self._operation_stats.values())
-            failure_rate = (total_failures / total_operations * 100) if total_operations > 0 else 0
-
-            return {
-                "total_operations": total_operations,
-                "total_time_ms": total_time_ms,
-                "avg_time_ms": total_time_ms / total_operations if total_operations > 0 else 0,
-                "failure_rate": failure_rate,
-                "operations_tracked": len(self._operation_stats),
-                "history_size": len(self._operation_history),
-                "slowest_operations": slowest_ops[:10],
-            }
+        operation_stats = self.snapshot_operation_stats()
+
+        total_operations = sum(stats["count"] for stats in operation_stats.values())
+        total_time_ms = sum(stats["total_time_ms"] for stats in operation_stats.values())
+
+        # Find slowest operations
+        slowest_ops = []
+        for name, stats in operation_stats.items():
+            if stats["count"] > 0:
+                slowest_ops.append(
+                    {
+                        "operation": name,
+                        "avg_time_ms": stats["avg_time_ms"],
+                        "max_time_ms": stats["max_time_ms"],
+                        "count": stats["count"],
+                    }
+                )
+        slowest_ops.sort(key=lambda x: x["avg_time_ms"], reverse=True)
+
+        # Calculate failure rate
+        total_failures = sum(stats["failure_count"] for stats in operation_stats.values())
+        failure_rate = (total_failures / total_operations * 100) if total_operations > 0 else 0
+
+        return {
+            "total_operations": total_operations,
+            "total_time_ms": total_time_ms,
+            "avg_time_ms": total_time_ms / total_operations if total_operations > 0 else 0,
+            "failure_rate": failure_rate,
+            "operations_tracked": len(operation_stats),
+            "history_size": len(self._operation_history),
+            "slowest_operations": slowest_ops[:10],
+        }
 
     def reset_metrics(self) -> None:
         """Reset all performance metrics"""
@@ -313,30 +559,82 @@ class PerformanceMonitor:
         """
 
         def decorator(func: Callable) -> Callable:
-            op_name = operation_name or f"{func.__module__}.{func.__name__}"
+            # Interned once per decorated function so stats lookups compare by identity
+            op_name = sys.intern(operation_name or f"{func.__module__}.{func.__name__}")
+            # Bound once so the wrapper avoids attribute lookups per call
+            record_stats = self._stats_recorder(op_name)
+            start_operation = self.start_operation
+            end_operation = self.end_operation
+            perf_counter_ns = time.perf_counter_ns
+            sample = random.random
 
             @functools.wraps(func)
             def wrapper(*args, **kwargs):
+                # One snapshot per call: a consistent set of settings for one lookup
+                enabled, sample_rate, detailed, _ = self._settings
+
+                # Fast path: monitoring disabled or call not sampled
+                if not enabled or (sample_rate < 1.0 and sample() >= sample_rate):
+                    return func(*args, **kwargs)
+
+                # Without detailed tracking only the statistics are updated, so skip
+                # the in-flight bookkeeping and the metrics object
+                if not detailed:
+                    start_ns = perf_counter_ns()
+                    success = True
+                    try:
+                        return func(*args, **kwargs)
+                    except Exception:
+                        success = False
+                        raise
+                    finally:
+                        record_stats((perf_counter_ns() - start_ns) / 1_000_000, success)
+
                 # Start monitoring
-                op_id = self.start_operation(op_name)
+                op_id = start_operation(op_name)
 
                 success = True
-                result = None
                 try:
-                    result = func(*args, **kwargs)
-                    return result
-                except Exception as e:
+                    return func(*args, **kwargs)
+                except Exception:
                     success = False
                     raise
                 finally:
                     # End monitoring
-                    self.end_operation(op_id, success=success)
+                    end_operation(op_id, success=success)
 
             return wrapper
 
         return decorator
 
 
+class _OperationStatsView(Mapping):
+    """
+    Read-only live view of a monitor's per-operation statistics
+
+    Statistics dictionaries are built on access from the current counters.
+    """
+
+    __slots__ = ("_monitor",)
+
+    def __init__(self, monitor: PerformanceMonitor):
+        self._monitor = monitor
+
+    def __getitem__(self, operation_name: str) -> Dict[str, Any]:
+        if operation_name not in self._monitor._operation_stats:
+            raise KeyError(operation_name)
+        return self._monitor.get_operation_stats(operation_name)
+
+    def __iter__(self):
+        return iter(list(self._monitor._operation_stats))
+
+    def __len__(self) -> int:
+        return len(self._monitor._operation_stats)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._monitor.snapshot_operation_stats()!r})"
+
+
 class PerformanceTracker:
     """
     Context manager for tracking operation performance
@@ -347,6 +645,8 @@ class PerformanceTracker:
             tracker.add_metadata({"rows": 100})
     """
 
+    __slots__ = ("monitor", "operation_name", "metadata", "operation_id", "success")
+
     def __init__(
         self,
         monitor: PerformanceMonitor,
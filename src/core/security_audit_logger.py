@@ -35,22 +35,113 @@ Version: 2.2.0
 Date: September 21, 2025
 """
 
-import hashlib
+import itertools
 import logging
 import os
 import platform
+import queue
+import sys
 import threading
 import time
-from collections import defaultdict, deque
-from datetime import datetime, timedelta
+from collections import Counter, OrderedDict, defaultdict, deque
+from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple
 
 import psutil
 
 # Configure logging for security audit operations
 logger = logging.getLogger(__name__)
 
+# Background persistence: events are written to the database in batches of up to
+# AUDIT_WRITE_BATCH_SIZE, waiting at most AUDIT_WRITE_BATCH_WAIT_SECONDS for a batch
+# to fill. Producers block once AUDIT_WRITE_QUEUE_SIZE events are pending.
+AUDIT_WRITE_BATCH_SIZE = 256
+AUDIT_WRITE_BATCH_WAIT_SECONDS = 0.005
+AUDIT_WRITE_QUEUE_SIZE = 10000
+
+# Alerts waiting for the dispatcher thread; further alerts are dropped (and counted)
+ALERT_QUEUE_SIZE = 10000
+
+# Timings kept per operation in the performance tracking ring buffers
+PERFORMANCE_SAMPLE_SIZE = 1024
+
+# Users whose activity is tracked for anomaly detection; beyond this the least
+# recently active user is forgotten
+USER_ACTIVITY_MAX_USERS = 10000
+
+# Weight of the newest event in the running average risk score (an EWMA, so the
+# average keeps tracking recent activity however many events have been logged)
+RISK_SCORE_EWMA_ALPHA = 0.01
+
+# Queue sentinel that stops the ingest worker and database writer threads
+_STOP_WORKER = object()
+
+# Event IDs: a random per-process tag keeps IDs from concurrent processes apart and
+# the counter keeps them unique within this one (next() on a count is atomic)
+_EVENT_ID_PROCESS_TAG = os.urandom(4).hex()
+_event_id_counter = itertools.count()
+
+# System context that cannot change while the process runs, captured once
+_STATIC_SYSTEM_CONTEXT = {
+    'os_platform': platform.system(),
+    'os_version': platform.version(),
+    'python_version': platform.python_version(),
+    'process_id': os.getpid()
+}
+
+# Per-event context defaults, one string object shared by every event. The user
+# agent is built at runtime, so it is interned explicitly.
+_CLIENT_IP = "127.0.0.1"  # Default for desktop app
+_USER_AGENT = sys.intern(f"Desktop-App-v2.0-{_STATIC_SYSTEM_CONTEXT['os_platform']}")
+_CLIENT_VERSION = "2.2.0"
+_REQUEST_SOURCE = "GUI"
+
+# Process resource usage is sampled by a background thread every
+# RESOURCE_SAMPLE_INTERVAL_SECONDS; events copy the latest snapshot
+RESOURCE_SAMPLE_INTERVAL_SECONDS = 1.0
+_resource_snapshot: Dict[str, Any] = {}
+
+try:
+    _process = psutil.Process(os.getpid())
+    # The first cpu_percent() call only primes the counter and always returns 0.0
+    _process.cpu_percent()
+except psutil.Error:
+    _process = None
+
+
+def _sample_process_resources():
+    """Replace the shared process resource snapshot with a fresh sample"""
+    global _resource_snapshot
+
+    if _process is None:
+        return
+
+    try:
+        # Rebinding the module global is atomic; readers see the old or new snapshot
+        _resource_snapshot = {
+            'memory_usage_mb': round(_process.memory_info().rss / 1024 / 1024, 2),
+            'cpu_percent': _process.cpu_percent(),
+            'num_threads': _process.num_threads()
+        }
+    except psutil.Error:
+        # Keep serving the previous snapshot
+        pass
+
+
+_sample_process_resources()
+
+
+def _datetime_to_ns(value: datetime) -> int:
+    """Convert a datetime (naive values are local time) to nanoseconds since the epoch"""
+    return round(value.timestamp() * 1_000_000) * 1000
+
+
+def _ns_to_datetime(timestamp_ns: int) -> datetime:
+    """Convert nanoseconds since the epoch to a naive local datetime (microsecond precision)"""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    return datetime.fromtimestamp(seconds).replace(microsecond=nanoseconds // 1000)
+
 
 class SecurityEventType(Enum):
     """Types of security events that can be logged"""
@@ -96,6 +187,11 @@ class SecurityEventType(Enum):
     SYSTEM_LOCK_DETECTED = "SYSTEM_LOCK_DETECTED"
     SUSPICIOUS_ACTIVITY = "SUSPICIOUS_ACTIVITY"
 
+    # Members are singletons compared by identity, so the identity hash agrees with
+    # equality; it replaces Enum.__hash__ (which hashes the name in Python) for the
+    # scoring tables and indexes keyed by these enums
+    __hash__ = object.__hash__
+
 
 class SecurityLevel(Enum):
     """Security risk levels for events"""
@@ -104,6 +200,8 @@ class SecurityLevel(Enum):
     HIGH = "HIGH"           # High risk, requires attention
     CRITICAL = "CRITICAL"   # Critical risk, immediate action needed
 
+    __hash__ = object.__hash__  # identity hash, see SecurityEventType
+
 
 class EventResult(Enum):
     """Possible outcomes of security events"""
@@ -113,6 +211,76 @@ class EventResult(Enum):
     DENIED = "DENIED"       # Event was denied by security policy
     ERROR = "ERROR"         # Event resulted in an error
 
+    __hash__ = object.__hash__  # identity hash, see SecurityEventType
+
+
+# Risk distribution bucket for every possible risk score (0-100)
+_RISK_SCORE_BUCKETS = tuple(
+    'low' if score <= 25 else 'medium' if score <= 50 else 'high' if score <= 75 else 'critical'
+    for score in range(101)
+)
+
+# Event types counted individually by get_security_statistics
+_EVENT_TYPE_STAT_KEYS = {
+    'failed_authentications': (SecurityEventType.LOGIN_FAILURE,),
+    'successful_authentications': (SecurityEventType.LOGIN_SUCCESS,),
+    'password_views': (SecurityEventType.PASSWORD_VIEWED,),
+    'password_deletions': (SecurityEventType.PASSWORD_DELETED,),
+    'settings_changes': (SecurityEventType.SETTINGS_CHANGED,
+                         SecurityEventType.SECURITY_SETTINGS_CHANGED),
+}
+
+# Groups of enum members are frozensets; with the identity hash above a membership
+# test is a single hash lookup
+_HIGH_RISK_LEVELS = frozenset((SecurityLevel.HIGH, SecurityLevel.CRITICAL))
+
+# Event types that raise a real-time alert whatever their risk assessment
+_ALERT_EVENT_TYPES = frozenset((
+    SecurityEventType.ACCOUNT_LOCKED,
+    SecurityEventType.SUSPICIOUS_ACTIVITY,
+    SecurityEventType.ENCRYPTION_ERROR
+))
+
+# Event types tracked as login attempts
+_LOGIN_EVENT_TYPES = frozenset((SecurityEventType.LOGIN_SUCCESS,
+                                SecurityEventType.LOGIN_FAILURE))
+
+# Risk added to an event's base score by its result
+_RESULT_RISK_ADJUSTMENTS = {EventResult.FAILURE: 20, EventResult.ERROR: 30}
+
+# System logger level and message label for each security level
+_SYSTEM_LOG_LEVELS = {
+    SecurityLevel.CRITICAL: (logging.CRITICAL, "CRITICAL SECURITY EVENT"),
+    SecurityLevel.HIGH: (logging.WARNING, "HIGH RISK EVENT"),
+    SecurityLevel.MEDIUM: (logging.INFO, "SECURITY EVENT"),
+    SecurityLevel.LOW: (logging.DEBUG, "Security event"),
+}
+
+# Action results counted as errors by anomaly detection
+_ERROR_RESULTS = frozenset((EventResult.FAILURE.value, EventResult.ERROR.value))
+
+# Base risk score for every event type; types not listed score 10
+_BASE_RISK_SCORES = dict.fromkeys(SecurityEventType, 10)
+_BASE_RISK_SCORES.update({
+    SecurityEventType.LOGIN_FAILURE: 30,
+    SecurityEventType.ACCOUNT_LOCKED: 70,
+    SecurityEventType.PASSWORD_VIEWED: 20,
+    SecurityEventType.PASSWORD_DELETED: 40,
+    SecurityEventType.SECURITY_SETTINGS_CHANGED: 60,
+    SecurityEventType.DATA_EXPORT: 50,
+    SecurityEventType.SUSPICIOUS_ACTIVITY: 90,
+    SecurityEventType.ENCRYPTION_ERROR: 80,
+})
+
+# Security level for every possible risk score (0-100)
+_SECURITY_LEVEL_FOR_SCORE = tuple(
+    SecurityLevel.CRITICAL if score >= 80 else
+    SecurityLevel.HIGH if score >= 60 else
+    SecurityLevel.MEDIUM if score >= 30 else
+    SecurityLevel.LOW
+    for score in range(101)
+)
+
 
 class SecurityEvent:
     """
@@ -122,6 +290,15 @@ class SecurityEvent:
     timing, context, risk assessment, and performance metrics.
     """
 
+    __slots__ = (
+        'event_id', 'event_type', 'user_id', 'session_id', 'display_session_id',
+        'result', 'target_entry_id',
+        'timestamp_ns', 'monotonic_ns', 'execution_time_ms',
+        'client_ip', 'user_agent', 'client_version', 'request_source',
+        'error_message', 'affected_fields', 'old_values', 'new_values', 'event_details',
+        'security_level', 'risk_score', 'anomaly_score'
+    )
+
     def __init__(self, event_type: SecurityEventType, user_id: int, session_id: str,
                  result: EventResult = EventResult.SUCCESS,
                  target_entry_id: Optional[int] = None):
@@ -139,18 +316,23 @@ class SecurityEvent:
         self.event_type = event_type
         self.user_id = user_id
         self.session_id = session_id
+        # Truncated form used when the event is serialized
+        self.display_session_id = (session_id[:16] + "..." if len(session_id) > 16
+                                   else session_id)
         self.result = result
         self.target_entry_id = target_entry_id
 
         # Timing information
-        self.timestamp = datetime.now()
+        self.timestamp_ns = time.time_ns()
+        # Monotonic creation time for windows that must survive wall-clock changes
+        self.monotonic_ns = time.monotonic_ns()
         self.execution_time_ms = 0
 
         # Context and metadata
-        self.client_ip = "127.0.0.1"  # Default for desktop app
-        self.user_agent = f"Desktop-App-v2.0-{platform.system()}"
-        self.client_version = "2.2.0"
-        self.request_source = "GUI"
+        self.client_ip = _CLIENT_IP
+        self.user_agent = _USER_AGENT
+        self.client_version = _CLIENT_VERSION
+        self.request_source = _REQUEST_SOURCE
 
         # Event details
         self.error_message: Optional[str] = None
@@ -169,35 +351,22 @@ class SecurityEvent:
 
     def _generate_event_id(self) -> str:
         """Generate unique event ID"""
-        timestamp = str(int(time.time() * 1000))
-        random_part = hashlib.md5(f"{time.time()}{os.getpid()}".encode()).hexdigest()[:8]
-        return f"evt_{timestamp}_{random_part}"
+        return (f"evt_{time.time_ns() // 1_000_000}_"
+                f"{_EVENT_ID_PROCESS_TAG}{next(_event_id_counter):08x}")
 
     def _capture_system_context(self):
         """Capture system context for the event"""
-        try:
-            # Basic system information
-            self.event_details.update({
-                'os_platform': platform.system(),
-                'os_version': platform.version(),
-                'python_version': platform.python_version(),
-                'process_id': os.getpid()
-            })
+        self.event_details.update(_STATIC_SYSTEM_CONTEXT)
+        self.event_details.update(_resource_snapshot)
 
-            # Performance metrics (if available)
-            try:
-                process = psutil.Process(os.getpid())
-                self.event_details.update({
-                    'memory_usage_mb': round(process.memory_info().rss / 1024 / 1024, 2),
-                    'cpu_percent': process.cpu_percent(),
-                    'num_threads': process.num_threads()
-                })
-            except (psutil.Error, ImportError):
-                # psutil not available or error occurred
-                pass
+    @property
+    def timestamp(self) -> datetime:
+        """Local time the event was created, materialized from timestamp_ns"""
+        return _ns_to_datetime(self.timestamp_ns)
 
-        except Exception as e:
-            logger.warning(f"Error capturing system context: {e}")
+    @timestamp.setter
+    def timestamp(self, value: datetime):
+        self.timestamp_ns = _datetime_to_ns(value)
 
     def set_execution_time(self, start_time: float):
         """Set execution time from start timestamp"""
@@ -227,7 +396,7 @@ class SecurityEvent:
             'event_id': self.event_id,
             'event_type': self.event_type.value,
             'user_id': self.user_id,
-            'session_id': self.session_id[:16] + "..." if len(self.session_id) > 16 else self.session_id,
+            'session_id': self.display_session_id,
             'result': self.result.value,
             'target_entry_id': self.target_entry_id,
             'timestamp': self.timestamp.isoformat(),
@@ -247,6 +416,50 @@ class SecurityEvent:
         }
 
 
+class RecentAction:
+    """
+    Compact record of one action in a user's recent_actions window
+
+    Holds the same four fields as the dicts it replaces in a fraction of the memory,
+    and can still be read like one (action['result'], action.get('timestamp')) so
+    custom anomaly detectors keep working. event_type and result reference the enum
+    members' own value strings, so records share them and their hashes are cached.
+    """
+
+    __slots__ = ('timestamp_ns', 'event_type', 'result', 'risk_score')
+
+    _FIELDS = frozenset(('timestamp', 'event_type', 'result', 'risk_score'))
+
+    def __init__(self, timestamp_ns: int, event_type: str, result: str, risk_score: int):
+        """
+        Initialize a recent action record
+
+        Args:
+            timestamp_ns (int): When the action happened, in nanoseconds since the epoch
+            event_type (str): SecurityEventType value of the action
+            result (str): EventResult value of the action
+            risk_score (int): Risk score assessed for the action
+        """
+        self.timestamp_ns = timestamp_ns
+        self.event_type = event_type
+        self.result = result
+        self.risk_score = risk_score
+
+    @property
+    def timestamp(self) -> datetime:
+        """Local time of the action, materialized from timestamp_ns"""
+        return _ns_to_datetime(self.timestamp_ns)
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Read a field by name, like dict.get()"""
+        return getattr(self, key) if key in self._FIELDS else default
+
+
 class SecurityAuditLogger:
     """
     Comprehensive security audit logging and monitoring system
@@ -284,30 +497,40 @@ class SecurityAuditLogger:
         # In-memory event buffer for high-performance logging
         self._event_buffer: deque = deque(maxlen=1000)
 
+        # Search indexes over the buffer: every buffered event gets an ordinal, and
+        # user_id / event type map to the ordinals of their events
+        self._event_ordinals = itertools.count()
+        self._buffer_ordinals: deque = deque()
+        self._events_by_ordinal: Dict[int, SecurityEvent] = {}
+        self._ordinals_by_user: Dict[int, Set[int]] = defaultdict(set)
+        self._ordinals_by_type: Dict[str, Set[int]] = defaultdict(set)
+
         # Real-time monitoring
         self._alert_callbacks: Set[Callable] = set()
         self._anomaly_detectors: Dict[str, Callable] = {}
 
-        # Performance tracking
-        self._performance_stats: Dict[str, List[float]] = defaultdict(list)
+        # Performance tracking (the most recent PERFORMANCE_SAMPLE_SIZE timings per operation)
+        self._performance_stats: Dict[str, deque] = defaultdict(
+            lambda: deque(maxlen=PERFORMANCE_SAMPLE_SIZE))
 
-        # User activity tracking for anomaly detection
-        self._user_activity: Dict[int, Dict[str, Any]] = defaultdict(lambda: {
-            'last_login': None,
-            'login_attempts': deque(maxlen=10),
-            'recent_actions': deque(maxlen=50),
-            'risk_profile': {'baseline_score': 10, 'current_score': 10},
-            'locations': set(),
-            'devices': set()
-        })
+        # User activity tracking for anomaly detection, least recently active first
+        # (entries are created and evicted by _get_user_activity)
+        self._user_activity: Dict[int, Dict[str, Any]] = OrderedDict()
 
         # Event rate limiting and thresholds
         self._rate_limits: Dict[str, Dict[str, Any]] = {
-            'failed_logins': {'threshold': 5, 'window_minutes': 15, 'events': deque()},
-            'password_views': {'threshold': 20, 'window_minutes': 30, 'events': deque()},
-            'settings_changes': {'threshold': 10, 'window_minutes': 60, 'events': deque()}
+            'failed_logins': {'threshold': 5, 'window_minutes': 15},
+            'password_views': {'threshold': 20, 'window_minutes': 30},
+            'settings_changes': {'threshold': 10, 'window_minutes': 60}
         }
 
+        # Each window is a ring of per-minute buckets with a running total: buckets are
+        # cleared in place as the window advances, so a check never rescans the window
+        for rate_limit in self._rate_limits.values():
+            rate_limit['counts'] = [0] * rate_limit['window_minutes']
+            rate_limit['latest_minute'] = -1
+            rate_limit['total'] = 0
+
         # Statistics and metrics
         self._statistics = {
             'total_events': 0,
@@ -317,6 +540,43 @@ class SecurityAuditLogger:
             'high_risk_events_today': 0,
             'anomalies_detected': 0
         }
+        self._today_start_ns = 0
+        self._today_refresh_ts = float('-inf')
+
+        # Local hour of the last scored event and the [start, end) ns range it covers
+        self._hour = 0
+        self._hour_start_ns = 0
+        self._hour_end_ns = 0
+
+        # Background database writer (batched persistence)
+        self._persist_events = bool(self.database_manager and (
+            hasattr(self.database_manager, 'log_security_events') or
+            hasattr(self.database_manager, 'log_security_event')))
+        self._write_queue: queue.Queue = queue.Queue(maxsize=AUDIT_WRITE_QUEUE_SIZE)
+        self._writer_thread = None
+        self._start_database_writer()
+
+        # Background alert dispatcher (runs alert callbacks off the ingest path)
+        self._alert_queue: queue.Queue = queue.Queue(maxsize=ALERT_QUEUE_SIZE)
+        self._alert_thread = None
+        self._alerts_dropped = 0
+        if self.enable_real_time_alerts:
+            self._alert_thread = threading.Thread(
+                target=self._alert_dispatcher_loop, daemon=True, name="SecurityAuditAlerts"
+            )
+            self._alert_thread.start()
+
+        # Background ingest worker (risk assessment and bookkeeping for logged events)
+        self._ingest_queue: queue.Queue = queue.Queue()
+        self._ingest_thread = None
+        self._start_ingest_worker()
+
+        # Background process resource sampler (feeds SecurityEvent system context)
+        self._sampler_stop = threading.Event()
+        self._sampler_thread = threading.Thread(
+            target=self._resource_sampler_loop, daemon=True, name="SecurityAuditSampler"
+        )
+        self._sampler_thread.start()
 
         # Background monitoring thread
         self._monitoring_thread = None
@@ -344,43 +604,76 @@ class SecurityAuditLogger:
             execution_time_ms (int): How long the operation took
 
         Returns:
-            SecurityEvent: The logged event object
+            SecurityEvent: The logged event object. Risk assessment runs on the ingest
+            worker, so its risk fields are filled in shortly after return (see flush())
         """
-        with self._lock:
-            # Create security event
-            event = SecurityEvent(event_type, user_id, session_id, result, target_entry_id)
+        # Create security event
+        event = SecurityEvent(event_type, user_id, session_id, result, target_entry_id)
 
-            # Set additional details
-            if error_message:
-                event.error_message = error_message
+        # Set additional details
+        if error_message:
+            event.error_message = error_message
 
-            if event_details:
-                event.event_details.update(event_details)
+        if event_details:
+            event.event_details.update(event_details)
 
-            if execution_time_ms > 0:
-                event.execution_time_ms = execution_time_ms
+        if execution_time_ms > 0:
+            event.execution_time_ms = execution_time_ms
 
-            # Perform risk assessment
-            self._assess_event_risk(event)
+        self._submit_events((event,))
 
-            # Check for anomalies
-            self._detect_anomalies(event)
+        return event
 
-            # Update user activity tracking
-            self._update_user_activity(event)
+    def log_events_bulk(self, event_specs: Iterable[Tuple]) -> List[SecurityEvent]:
+        """
+        Log many security events as one batch
 
-            # Check rate limits and thresholds
-            self._check_rate_limits(event)
+        The whole batch is queued and processed under a single lock acquisition,
+        which makes this much cheaper than calling log_event in a loop.
 
-            # Add to buffer
-            self._event_buffer.append(event)
+        Args:
+            event_specs (Iterable[Tuple]): One (event_type, user_id, session_id[, result
+                [, target_entry_id]]) tuple per event, as accepted by SecurityEvent
+
+        Returns:
+            List[SecurityEvent]: The logged events, in order. As with log_event, risk
+            fields are filled in once the ingest worker has processed them
+        """
+        events = [SecurityEvent(*spec) for spec in event_specs]
+        if events:
+            self._submit_events(events)
+        return events
+
+    def _submit_events(self, events: Sequence[SecurityEvent]):
+        """Hand events to the ingest worker, or process them inline after shutdown"""
+        if self._ingest_thread is not None:
+            self._ingest_queue.put(events)
+        else:
+            self._process_events(events)
+
+    def _process_events(self, events: Sequence[SecurityEvent]):
+        """Run risk assessment and bookkeeping for a batch of logged events"""
+        with self._lock:
+            for event in events:
+                # Perform risk assessment
+                self._assess_event_risk(event)
+
+                # Check for anomalies
+                self._detect_anomalies(event)
+
+                # Update user activity tracking
+                self._update_user_activity(event)
+
+                # Check rate limits and thresholds
+                self._check_rate_limits(event)
 
             # Update statistics
-            self._update_statistics(event)
+            self._update_statistics(events)
 
-            # Store in database (async to avoid blocking)
-            self._store_event_async(event)
+            # Add to buffer
+            self._add_to_buffer(events)
 
+        for event in events:
             # Check for real-time alerts
             if self.enable_real_time_alerts:
                 self._check_for_alerts(event)
@@ -388,7 +681,10 @@ class SecurityAuditLogger:
             # Log to system logger based on severity
             self._log_to_system(event)
 
-            return event
+        # Store in database last: queuing blocks while the writer thread is backed up,
+        # and alerts for the whole batch should not wait behind database I/O
+        for event in events:
+            self._store_event_async(event)
 
     def log_password_view(self, user_id: int, session_id: str, entry_id: int,
                           view_duration_seconds: Optional[int] = None,
@@ -527,15 +823,14 @@ class SecurityAuditLogger:
             'affects_security': affects_security
         }
 
-        event = self.log_event(
-            event_type, user_id, session_id,
-            EventResult.SUCCESS,
-            event_details=event_details
-        )
+        event = SecurityEvent(event_type, user_id, session_id, EventResult.SUCCESS)
+        event.event_details.update(event_details)
 
-        # Set change context
+        # Set change context before queuing, the ingest worker may process the event at once
         event.set_change_context([key], {key: old_value}, {key: new_value})
 
+        self._submit_events((event,))
+
         return event
 
     def get_security_statistics(self, user_id: Optional[int] = None,
@@ -550,108 +845,104 @@ class SecurityAuditLogger:
         Returns:
             Dict[str, Any]: Security statistics and metrics
         """
+        # Get events from database if available
+        recent_events = []
+        if self.database_manager and hasattr(self.database_manager, 'get_security_audit_log'):
+            try:
+                recent_events = self.database_manager.get_security_audit_log(
+                    user_id=user_id, limit=1000, offset=0
+                )
+            except Exception as e:
+                logger.error(f"Error getting security statistics from database: {e}")
+
+        # Snapshot the buffer (and user profile) under the lock and aggregate outside
+        # it, so a slow statistics read never stalls the ingest worker
         with self._lock:
-            # Get events from database if available
-            recent_events = []
-            if self.database_manager and hasattr(self.database_manager, 'get_security_audit_log'):
-                try:
-                    recent_events = self.database_manager.get_security_audit_log(
-                        user_id=user_id, limit=1000, offset=0
-                    )
-                except Exception as e:
-                    logger.error(f"Error getting security statistics from database: {e}")
-
-            # Combine with buffer events
-            cutoff_time = datetime.now() - timedelta(hours=hours)
-            buffer_events = [e for e in self._event_buffer if e.timestamp >=
-                             cutoff_time and (user_id is None or e.user_id == user_id)]
-
-            # Calculate statistics
-            all_events = buffer_events  # In a full implementation, combine with DB events
-
-            stats = {
-                'time_window_hours': hours,
-                'total_events': len(all_events),
-                'events_by_type': defaultdict(int),
-                'events_by_level': defaultdict(int),
-                'events_by_result': defaultdict(int),
-                'risk_distribution': {'low': 0, 'medium': 0, 'high': 0, 'critical': 0},
-                'average_risk_score': 0.0,
-                'anomalies_detected': 0,
-                'failed_authentications': 0,
-                'successful_authentications': 0,
-                'password_views': 0,
-                'password_deletions': 0,
-                'settings_changes': 0,
-                'high_risk_events': []
-            }
-
-            total_risk_score = 0
-
-            for event in all_events:
-                # Event type distribution
-                stats['events_by_type'][event.event_type.value] += 1
-
-                # Security level distribution
-                stats['events_by_level'][event.security_level.value] += 1
-
-                # Result distribution
-                stats['events_by_result'][event.result.value] += 1
-
-                # Risk score calculation
-                total_risk_score += event.risk_score
-
-                # Risk level distribution
-                if event.risk_score <= 25:
-                    stats['risk_distribution']['low'] += 1
-                elif event.risk_score <= 50:
-                    stats['risk_distribution']['medium'] += 1
-                elif event.risk_score <= 75:
-                    stats['risk_distribution']['high'] += 1
-                else:
-                    stats['risk_distribution']['critical'] += 1
-
-                # Anomaly detection
-                if event.anomaly_score > 0.7:
-                    stats['anomalies_detected'] += 1
-
-                # Specific event counts
-                if event.event_type == SecurityEventType.LOGIN_FAILURE:
-                    stats['failed_authentications'] += 1
-                elif event.event_type == SecurityEventType.LOGIN_SUCCESS:
-                    stats['successful_authentications'] += 1
-                elif event.event_type == SecurityEventType.PASSWORD_VIEWED:
-                    stats['password_views'] += 1
-                elif event.event_type == SecurityEventType.PASSWORD_DELETED:
-                    stats['password_deletions'] += 1
-                elif event.event_type in [SecurityEventType.SETTINGS_CHANGED,
-                                          SecurityEventType.SECURITY_SETTINGS_CHANGED]:
-                    stats['settings_changes'] += 1
-
-                # High risk events (for detailed review)
-                if event.security_level in [SecurityLevel.HIGH, SecurityLevel.CRITICAL]:
-                    stats['high_risk_events'].append({
-                        'event_type': event.event_type.value,
-                        'timestamp': event.timestamp.isoformat(),
-                        'risk_score': event.risk_score,
-                        'details': event.event_details.get('summary', 'High risk event detected')
-                    })
-
-            # Calculate averages
-            if all_events:
-                stats['average_risk_score'] = round(total_risk_score / len(all_events), 2)
-
-            # Add user-specific statistics
+            buffered_events = list(self._event_buffer)
+            user_profile = None
             if user_id and user_id in self._user_activity:
-                user_profile = self._user_activity[user_id]
-                stats['user_profile'] = {
-                    'current_risk_score': user_profile['risk_profile']['current_score'],
-                    'baseline_risk_score': user_profile['risk_profile']['baseline_score'],
-                    'recent_activity_count': len(
-                        user_profile['recent_actions']),
-                    'last_login': user_profile['last_login'].isoformat() if user_profile['last_login'] else None}
+                activity = self._user_activity[user_id]
+                user_profile = {
+                    'current_risk_score': activity['risk_profile']['current_score'],
+                    'baseline_risk_score': activity['risk_profile']['baseline_score'],
+                    'recent_activity_count': len(activity['recent_actions']),
+                    'last_login': (activity['last_login'].isoformat()
+                                   if activity['last_login'] else None)
+                }
+
+        # Combine with buffer events
+        cutoff_ns = time.time_ns() - hours * 3600 * 1_000_000_000
+        buffer_events = [e for e in buffered_events if e.timestamp_ns >=
+                         cutoff_ns and (user_id is None or e.user_id == user_id)]
+
+        # Calculate statistics
+        all_events = buffer_events  # In a full implementation, combine with DB events
+
+        stats = {
+            'time_window_hours': hours,
+            'total_events': len(all_events),
+            'events_by_type': defaultdict(int),
+            'events_by_level': defaultdict(int),
+            'events_by_result': defaultdict(int),
+            'risk_distribution': {'low': 0, 'medium': 0, 'high': 0, 'critical': 0},
+            'average_risk_score': 0.0,
+            'anomalies_detected': 0,
+            'failed_authentications': 0,
+            'successful_authentications': 0,
+            'password_views': 0,
+            'password_deletions': 0,
+            'settings_changes': 0,
+            'high_risk_events': []
+        }
 
-            return dict(stats)
+        events_by_type = stats['events_by_type']
+        events_by_level = stats['events_by_level']
+        events_by_result = stats['events_by_result']
+        risk_distribution = stats['risk_distribution']
+        high_risk_events = stats['high_risk_events']
+        total_risk_score = 0
+        anomalies_detected = 0
+
+        # Single pass: every per-event decision is a table lookup
+        for event in all_events:
+            risk_score = event.risk_score
+            security_level = event.security_level
+
+            events_by_type[event.event_type.value] += 1
+            events_by_level[security_level.value] += 1
+            events_by_result[event.result.value] += 1
+
+            total_risk_score += risk_score
+            risk_distribution[_RISK_SCORE_BUCKETS[risk_score]] += 1
+
+            if event.anomaly_score > 0.7:
+                anomalies_detected += 1
+
+            # High risk events (for detailed review)
+            if security_level in _HIGH_RISK_LEVELS:
+                high_risk_events.append({
+                    'event_type': event.event_type.value,
+                    'timestamp': event.timestamp.isoformat(),
+                    'risk_score': risk_score,
+                    'details': event.event_details.get('summary', 'High risk event detected')
+                })
+
+        stats['anomalies_detected'] = anomalies_detected
+
+        # Specific event counts fall out of the per-type histogram
+        for stat_key, event_types in _EVENT_TYPE_STAT_KEYS.items():
+            stats[stat_key] = sum(events_by_type.get(event_type.value, 0)
+                                  for event_type in event_types)
+
+        # Calculate averages
+        if all_events:
+            stats['average_risk_score'] = round(total_risk_score / len(all_events), 2)
+
+        # Add user-specific statistics
+        if user_profile is not None:
+            stats['user_profile'] = user_profile
+
+        return dict(stats)
 
     def search_security_events(
             self, filters: Dict[str, Any], limit: int = 100) -> List[Dict[str, Any]]:
@@ -679,11 +970,26 @@ class SecurityAuditLogger:
             except Exception as e:
                 logger.error(f"Error searching database events: {e}")
 
-        # Search buffer events
-        buffer_results = []
-        for event in self._event_buffer:
-            if self._event_matches_filters(event, filters):
-                buffer_results.append(event.to_dict())
+        # Search buffer events, narrowed through the indexes where the filters allow
+        with self._lock:
+            candidates = None
+            if 'user_id' in filters:
+                candidates = self._ordinals_by_user.get(filters['user_id'], set())
+            if 'event_type' in filters:
+                type_ordinals = self._ordinals_by_type.get(filters['event_type'], set())
+                candidates = type_ordinals if candidates is None else candidates & type_ordinals
+
+            if candidates is None:
+                buffered_events = list(self._event_buffer)
+            else:
+                events_by_ordinal = self._events_by_ordinal
+                buffered_events = [events_by_ordinal[ordinal] for ordinal in sorted(candidates)]
+
+        # Only the filters the indexes did not already apply are checked per event
+        indexed_filters = ('user_id', 'event_type') if candidates is not None else ()
+        matches = self._compile_event_filter(
+            {key: value for key, value in filters.items() if key not in indexed_filters})
+        buffer_results = [event.to_dict() for event in filter(matches, buffered_events)]
 
         # Combine and sort results
         all_results = results + buffer_results
@@ -720,17 +1026,14 @@ class SecurityAuditLogger:
 
         # Clean up buffer (keep only recent events)
         with self._lock:
-            cutoff_time = datetime.now() - timedelta(days=days_to_keep)
-            original_count = len(self._event_buffer)
-
-            # Create new deque with only recent events
-            new_buffer = deque(maxlen=1000)
-            for event in self._event_buffer:
-                if event.timestamp >= cutoff_time:
-                    new_buffer.append(event)
+            cutoff_ns = time.time_ns() - days_to_keep * 86400 * 1_000_000_000
 
-            cleaned_count += original_count - len(new_buffer)
-            self._event_buffer = new_buffer
+            # Events are buffered in arrival order, so the expired ones form a prefix
+            event_buffer = self._event_buffer
+            while event_buffer and event_buffer[0].timestamp_ns < cutoff_ns:
+                event_buffer.popleft()
+                self._unindex_event(self._buffer_ordinals.popleft())
+                cleaned_count += 1
 
         if cleaned_count > 0:
             logger.info(f"Cleaned up {cleaned_count} old security audit events")
@@ -743,32 +1046,17 @@ class SecurityAuditLogger:
 
     def _assess_event_risk(self, event: SecurityEvent):
         """Assess risk level and score for an event"""
-        base_risk_scores = {
-            SecurityEventType.LOGIN_FAILURE: 30,
-            SecurityEventType.ACCOUNT_LOCKED: 70,
-            SecurityEventType.PASSWORD_VIEWED: 20,
-            SecurityEventType.PASSWORD_DELETED: 40,
-            SecurityEventType.SECURITY_SETTINGS_CHANGED: 60,
-            SecurityEventType.DATA_EXPORT: 50,
-            SecurityEventType.SUSPICIOUS_ACTIVITY: 90,
-            SecurityEventType.ENCRYPTION_ERROR: 80,
-        }
-
-        base_score = base_risk_scores.get(event.event_type, 10)
-
-        # Adjust based on result
-        if event.result == EventResult.FAILURE:
-            base_score += 20
-        elif event.result == EventResult.ERROR:
-            base_score += 30
+        # Base score for the event type, adjusted based on result
+        base_score = (_BASE_RISK_SCORES[event.event_type] +
+                      _RESULT_RISK_ADJUSTMENTS.get(event.result, 0))
 
         # Adjust based on user activity
-        user_activity = self._user_activity.get(event.user_id, {})
-        current_user_risk = user_activity.get('risk_profile', {}).get('current_score', 10)
-        base_score += max(0, current_user_risk - 10)
+        user_activity = self._user_activity.get(event.user_id)
+        if user_activity is not None:
+            base_score += max(0, user_activity['risk_profile']['current_score'] - 10)
 
         # Adjust based on timing (e.g., after hours access)
-        current_hour = datetime.now().hour
+        current_hour = self._local_hour(event.timestamp_ns)
         if current_hour < 6 or current_hour > 22:  # After hours
             base_score += 15
 
@@ -776,44 +1064,55 @@ class SecurityAuditLogger:
         final_score = min(100, max(0, base_score))
 
         # Determine security level
-        if final_score >= 80:
-            security_level = SecurityLevel.CRITICAL
-        elif final_score >= 60:
-            security_level = SecurityLevel.HIGH
-        elif final_score >= 30:
-            security_level = SecurityLevel.MEDIUM
-        else:
-            security_level = SecurityLevel.LOW
+        event.set_risk_assessment(_SECURITY_LEVEL_FOR_SCORE[final_score], final_score)
+
+    def _local_hour(self, timestamp_ns: int) -> int:
+        """
+        Get the local hour of a timestamp, reusing the last result within the same hour
 
-        event.set_risk_assessment(security_level, final_score)
+        Args:
+            timestamp_ns (int): Nanoseconds since the epoch
+
+        Returns:
+            int: Local hour (0-23)
+        """
+        if not self._hour_start_ns <= timestamp_ns < self._hour_end_ns:
+            moment = datetime.fromtimestamp(timestamp_ns / 1_000_000_000)
+            self._hour = moment.hour
+            self._hour_start_ns = _datetime_to_ns(moment.replace(minute=0, second=0, microsecond=0))
+            self._hour_end_ns = self._hour_start_ns + 3_600_000_000_000
+        return self._hour
 
     def _detect_anomalies(self, event: SecurityEvent):
         """Detect anomalies in user behavior"""
-        user_activity = self._user_activity.get(event.user_id, {})
-        recent_actions = user_activity.get('recent_actions', deque())
-
         anomaly_score = 0.0
 
-        # Check for unusual activity patterns
-        if len(recent_actions) >= 10:
-            # Check for rapid repeated actions
-            recent_times = [action.get('timestamp', datetime.now()) for action in recent_actions]
-            time_diffs = [(recent_times[i] - recent_times[i - 1]).total_seconds()
-                          for i in range(1, min(6, len(recent_times)))]
-
-            if time_diffs and sum(time_diffs) / len(time_diffs) < 2:  # Very rapid actions
-                anomaly_score += 0.3
-
-        # Check for unusual event types for this user
-        user_event_types = set(action.get('event_type') for action in recent_actions)
-        if event.event_type.value not in user_event_types and len(recent_actions) > 5:
-            anomaly_score += 0.2
-
-        # Check for error patterns
-        recent_errors = sum(1 for action in recent_actions
-                            if action.get('result') in ['FAILURE', 'ERROR'])
-        if recent_errors > 3:
-            anomaly_score += 0.4
+        # The built-in checks read aggregates kept by _record_recent_action, so none of
+        # them walks recent_actions. None can trigger before a user has four prior
+        # actions (the error check needs four errors), so cold users skip them all
+        user_activity = self._user_activity.get(event.user_id)
+        if user_activity is None:
+            user_activity = {}
+        elif len(user_activity['recent_actions']) > 3:
+            recent_actions = user_activity['recent_actions']
+            action_count = len(recent_actions)
+
+            # Check for unusual activity patterns
+            if action_count >= 10:
+                # Check for rapid repeated actions: the gaps between the first six actions
+                # sum to the span from the first to the sixth, so their mean needs two reads
+                span_ns = recent_actions[5].timestamp_ns - recent_actions[0].timestamp_ns
+                if span_ns / 5 < 2_000_000_000:  # Very rapid actions (under 2s apart)
+                    anomaly_score += 0.3
+
+            # Check for unusual event types for this user
+            if action_count > 5:
+                if event.event_type.value not in user_activity['event_type_counts']:
+                    anomaly_score += 0.2
+
+            # Check for error patterns
+            if user_activity['error_count'] > 3:
+                anomaly_score += 0.4
 
         # Apply custom anomaly detectors
         for name, detector in self._anomaly_detectors.items():
@@ -835,109 +1134,336 @@ class SecurityAuditLogger:
             if anomaly_score > 0.9:
                 self._log_suspicious_activity(event, anomaly_score)
 
+    def _get_user_activity(self, user_id: int) -> Dict[str, Any]:
+        """
+        Get a user's activity entry, creating it if needed, and mark the user as most
+        recently active (caller holds self._lock)
+
+        Args:
+            user_id (int): User to look up
+
+        Returns:
+            Dict: The user's activity entry
+        """
+        user_activity = self._user_activity.get(user_id)
+        if user_activity is not None:
+            self._user_activity.move_to_end(user_id)
+            return user_activity
+
+        user_activity = self._user_activity[user_id] = {
+            'last_login': None,
+            'login_attempts': deque(maxlen=10),
+            'recent_actions': deque(maxlen=50),  # RecentAction records, oldest first
+            'error_count': 0,  # failed/errored actions in recent_actions
+            'event_type_counts': Counter(),  # event type -> actions in recent_actions
+            'risk_window': deque(maxlen=10),  # risk scores of the last 10 actions
+            'risk_window_sum': 0,
+            'risk_profile': {'baseline_score': 10, 'current_score': 10},
+            'locations': set(),
+            'devices': set()
+        }
+
+        # Forget the least recently active user once over the cap
+        if len(self._user_activity) > USER_ACTIVITY_MAX_USERS:
+            self._user_activity.popitem(last=False)
+
+        return user_activity
+
     def _update_user_activity(self, event: SecurityEvent):
         """Update user activity tracking for anomaly detection"""
-        user_activity = self._user_activity[event.user_id]
+        user_activity = self._get_user_activity(event.user_id)
 
-        # Update last login
-        if event.event_type == SecurityEventType.LOGIN_SUCCESS:
-            user_activity['last_login'] = event.timestamp
+        # Track login attempts and update last login
+        if event.event_type in _LOGIN_EVENT_TYPES:
+            timestamp = event.timestamp
+            if event.event_type == SecurityEventType.LOGIN_SUCCESS:
+                user_activity['last_login'] = timestamp
 
-        # Track login attempts
-        if event.event_type in [SecurityEventType.LOGIN_SUCCESS, SecurityEventType.LOGIN_FAILURE]:
             user_activity['login_attempts'].append({
-                'timestamp': event.timestamp,
+                'timestamp': timestamp,
                 'result': event.result.value,
                 'ip': event.client_ip
             })
 
         # Track recent actions
-        user_activity['recent_actions'].append({
-            'timestamp': event.timestamp,
-            'event_type': event.event_type.value,
-            'result': event.result.value,
-            'risk_score': event.risk_score
-        })
-
-        # Update risk profile
-        risk_profile = user_activity['risk_profile']
-        recent_risk_scores = [action.get('risk_score', 0)
-                              for action in list(user_activity['recent_actions'])[-10:]]
-        if recent_risk_scores:
-            current_avg = sum(recent_risk_scores) / len(recent_risk_scores)
-            risk_profile['current_score'] = int(current_avg)
+        self._record_recent_action(user_activity, RecentAction(
+            event.timestamp_ns, event.event_type.value, event.result.value, event.risk_score
+        ))
+
+        # Update risk profile from the running sum of the last 10 risk scores
+        risk_window = user_activity['risk_window']
+        if len(risk_window) == risk_window.maxlen:
+            user_activity['risk_window_sum'] -= risk_window[0]
+        risk_window.append(event.risk_score)
+        user_activity['risk_window_sum'] += event.risk_score
+        user_activity['risk_profile']['current_score'] = (
+            user_activity['risk_window_sum'] // len(risk_window))
+
+    def _record_recent_action(self, user_activity: Dict[str, Any], action: RecentAction):
+        """
+        Append an action to a user's recent_actions and keep its aggregates in step
 
-    def _check_rate_limits(self, event: SecurityEvent):
-        """Check if event triggers rate limiting thresholds"""
-        now = datetime.now()
+        Args:
+            user_activity (Dict): Activity entry from self._user_activity
+            action (RecentAction): Action to record
+        """
+        recent_actions = user_activity['recent_actions']
+
+        # Evict the oldest action ourselves so its contribution can be taken back out
+        event_type_counts = user_activity['event_type_counts']
+        if len(recent_actions) == recent_actions.maxlen:
+            evicted = recent_actions.popleft()
+            if evicted.result in _ERROR_RESULTS:
+                user_activity['error_count'] -= 1
+            evicted_type = evicted.event_type
+            event_type_counts[evicted_type] -= 1
+            if not event_type_counts[evicted_type]:
+                del event_type_counts[evicted_type]
+
+        recent_actions.append(action)
+        if action.result in _ERROR_RESULTS:
+            user_activity['error_count'] += 1
+        event_type_counts[action.event_type] += 1
 
+    def _check_rate_limits(self, event: SecurityEvent):
+        """Check if event triggers rate limiting thresholds (caller holds self._lock)"""
         # Check failed login rate
         if event.event_type == SecurityEventType.LOGIN_FAILURE:
             rate_limit = self._rate_limits['failed_logins']
-            rate_limit['events'].append(now)
 
-            # Clean old events
-            cutoff = now - timedelta(minutes=rate_limit['window_minutes'])
-            rate_limit['events'] = deque([t for t in rate_limit['events'] if t > cutoff])
-
-            # Check threshold
-            if len(rate_limit['events']) >= rate_limit['threshold']:
+            # Check threshold (bucketed by the monotonic minute the event was created in)
+            minute = event.monotonic_ns // 60_000_000_000
+            if self._count_rate_limited_event(rate_limit, minute) >= rate_limit['threshold']:
                 event.add_detail('rate_limit_triggered', 'failed_logins')
                 event.risk_score = min(100, event.risk_score + 40)
 
         # Similar checks for other rate limits...
 
+    def _count_rate_limited_event(self, rate_limit: Dict[str, Any], minute: int) -> int:
+        """
+        Record an event against a rate limit and count the events in its window
+
+        The bucket ring and running total are updated in several steps, so the caller
+        must hold self._lock (as _process_events does) for the whole call.
+
+        State is plain integers, so no timestamps are stored per event. Minutes come
+        from the monotonic clock, so wall-clock changes cannot shift or empty the
+        window; only events queued out of order by more than the window are dropped.
+
+        Args:
+            rate_limit (Dict): Rate limit entry from self._rate_limits
+            minute (int): Monotonic-clock minute the event was created in
+
+        Returns:
+            int: Events recorded during the last window_minutes minutes, this one included
+        """
+        window_minutes = rate_limit['window_minutes']
+        counts = rate_limit['counts']
+        latest_minute = rate_limit['latest_minute']
+
+        if minute > latest_minute:
+            # Clear, in place, the buckets of the minutes the window has moved past
+            for expired in range(max(latest_minute + 1, minute - window_minutes + 1), minute + 1):
+                bucket = expired % window_minutes
+                rate_limit['total'] -= counts[bucket]
+                counts[bucket] = 0
+            rate_limit['latest_minute'] = latest_minute = minute
+
+        if minute > latest_minute - window_minutes:
+            # Events queued from other threads may arrive slightly out of order; one
+            # older than the window has already expired and is not counted
+            counts[minute % window_minutes] += 1
+            rate_limit['total'] += 1
+
+        return rate_limit['total']
+
     def _store_event_async(self, event: SecurityEvent):
-        """Store event in database asynchronously (placeholder)"""
-        if self.database_manager and hasattr(self.database_manager, 'log_security_event'):
+        """Queue event for the background database writer"""
+        if not self._persist_events:
+            return
+
+        row = (
+            event.user_id,
+            event.session_id,
+            event.event_type.value,
+            event.result.value,
+            event.target_entry_id,
+            event.error_message,
+            dict(event.event_details),
+            event.security_level.value,
+            event.risk_score,
+            event.execution_time_ms
+        )
+
+        # After shutdown() has stopped the writer, events are written synchronously
+        if self._writer_thread is None:
+            self._write_event_batch([row])
+            return
+
+        # Blocks when the writer falls AUDIT_WRITE_QUEUE_SIZE events behind
+        self._write_queue.put(row)
+
+    def _start_ingest_worker(self):
+        """Start the background thread that processes logged events"""
+        self._ingest_thread = threading.Thread(
+            target=self._ingest_worker_loop, daemon=True, name="SecurityAuditIngest"
+        )
+        self._ingest_thread.start()
+
+    def _ingest_worker_loop(self):
+        """Process logged events in order until the stop sentinel arrives"""
+        ingest_queue = self._ingest_queue
+
+        while True:
+            events = ingest_queue.get()
             try:
-                self.database_manager.log_security_event(
-                    user_id=event.user_id,
-                    session_id=event.session_id,
-                    action_type=event.event_type.value,
-                    action_result=event.result.value,
-                    target_entry_id=event.target_entry_id,
-                    error_message=event.error_message,
-                    action_details=event.event_details,
-                    security_level=event.security_level.value,
-                    risk_score=event.risk_score,
-                    execution_time_ms=event.execution_time_ms
-                )
+                if events is _STOP_WORKER:
+                    break
+                self._process_events(events)
+            except Exception as e:
+                logger.error(f"Error processing security events: {e}")
+            finally:
+                ingest_queue.task_done()
+
+    def _start_database_writer(self):
+        """Start the background thread that persists queued events in batches"""
+        if not self._persist_events:
+            return
+
+        self._writer_thread = threading.Thread(
+            target=self._database_writer_loop, daemon=True, name="SecurityAuditWriter"
+        )
+        self._writer_thread.start()
+
+    def _database_writer_loop(self):
+        """Drain the write queue, persisting up to AUDIT_WRITE_BATCH_SIZE events per write"""
+        write_queue = self._write_queue
+        stopping = False
+
+        while not stopping:
+            row = write_queue.get()
+            if row is _STOP_WORKER:
+                write_queue.task_done()
+                break
+
+            batch = [row]
+            stopping = self._drain_write_queue(batch)
+
+            # Give a burst that is still arriving one short wait to fill the batch
+            if not stopping and len(batch) < AUDIT_WRITE_BATCH_SIZE:
+                try:
+                    row = write_queue.get(timeout=AUDIT_WRITE_BATCH_WAIT_SECONDS)
+                except queue.Empty:
+                    row = None
+                if row is _STOP_WORKER:
+                    stopping = True
+                    write_queue.task_done()
+                elif row is not None:
+                    batch.append(row)
+                    stopping = self._drain_write_queue(batch)
+
+            self._write_event_batch(batch)
+            for _ in batch:
+                write_queue.task_done()
+
+    def _drain_write_queue(self, batch: List[tuple]) -> bool:
+        """
+        Move already-queued rows into a batch without waiting
+
+        Args:
+            batch (List[tuple]): Batch to extend, up to AUDIT_WRITE_BATCH_SIZE rows
+
+        Returns:
+            bool: True if the stop sentinel was reached
+        """
+        write_queue = self._write_queue
+        while len(batch) < AUDIT_WRITE_BATCH_SIZE:
+            try:
+                row = write_queue.get_nowait()
+            except queue.Empty:
+                return False
+            if row is _STOP_WORKER:
+                write_queue.task_done()
+                return True
+            batch.append(row)
+        return False
+
+    def _write_event_batch(self, batch: List[tuple]):
+        """Persist a batch of queued events"""
+        if hasattr(self.database_manager, 'log_security_events'):
+            try:
+                if self.database_manager.log_security_events(batch) == len(batch):
+                    return
+            except Exception as e:
+                logger.error(f"Error storing security event batch to database: {e}")
+
+        # One bad row fails the whole transaction; retry row by row so it only costs itself
+        for row in batch:
+            try:
+                self.database_manager.log_security_event(*row)
             except Exception as e:
                 logger.error(f"Error storing security event to database: {e}")
 
+    def flush(self):
+        """Block until every logged event has been processed and written to the database"""
+        if self._ingest_thread is not None and self._ingest_thread.is_alive():
+            self._ingest_queue.join()
+        if self._writer_thread is not None and self._writer_thread.is_alive():
+            self._write_queue.join()
+        if self._alert_thread is not None and self._alert_thread.is_alive():
+            self._alert_queue.join()
+
     def _check_for_alerts(self, event: SecurityEvent):
         """Check if event should trigger real-time alerts"""
         should_alert = (
-            event.security_level in [SecurityLevel.HIGH, SecurityLevel.CRITICAL] or
+            event.security_level in _HIGH_RISK_LEVELS or
             event.anomaly_score > 0.8 or
-            event.event_type in [
-                SecurityEventType.ACCOUNT_LOCKED,
-                SecurityEventType.SUSPICIOUS_ACTIVITY,
-                SecurityEventType.ENCRYPTION_ERROR
-            ]
+            event.event_type in _ALERT_EVENT_TYPES
         )
 
-        if should_alert:
-            for callback in self._alert_callbacks:
-                try:
-                    callback(event)
-                except Exception as e:
-                    logger.error(f"Error in security alert callback: {e}")
+        if not should_alert:
+            return
+
+        if self._alert_thread is None:
+            self._dispatch_alert(event)
+            return
+
+        try:
+            self._alert_queue.put_nowait(event)
+        except queue.Full:
+            # A slow callback must not stall event processing; shed the alert instead
+            self._alerts_dropped += 1
+            if self._alerts_dropped == 1 or self._alerts_dropped % 1000 == 0:
+                logger.warning(f"Security alert queue full - {self._alerts_dropped} alerts dropped")
+
+    def _dispatch_alert(self, event: SecurityEvent):
+        """Run every registered alert callback for an event"""
+        for callback in tuple(self._alert_callbacks):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.error(f"Error in security alert callback: {e}")
+
+    def _alert_dispatcher_loop(self):
+        """Deliver queued alerts to the callbacks until the stop sentinel arrives"""
+        alert_queue = self._alert_queue
+
+        while True:
+            event = alert_queue.get()
+            try:
+                if event is _STOP_WORKER:
+                    break
+                self._dispatch_alert(event)
+            finally:
+                alert_queue.task_done()
 
     def _log_to_system(self, event: SecurityEvent):
         """Log event to system logger based on severity"""
-        if event.security_level == SecurityLevel.CRITICAL:
-            logger.critical(
-                f"CRITICAL SECURITY EVENT: {
-                    event.event_type.value} by user {
-                    event.user_id}")
-        elif event.security_level == SecurityLevel.HIGH:
-            logger.warning(f"HIGH RISK EVENT: {event.event_type.value} by user {event.user_id}")
-        elif event.security_level == SecurityLevel.MEDIUM:
-            logger.info(f"SECURITY EVENT: {event.event_type.value} by user {event.user_id}")
-        else:
-            logger.debug(f"Security event: {event.event_type.value} by user {event.user_id}")
+        level, label = _SYSTEM_LOG_LEVELS[event.security_level]
+
+        # Only build the message when the logger would emit it
+        if logger.isEnabledFor(level):
+            logger.log(level, f"{label}: {event.event_type.value} by user {event.user_id}")
 
     def _log_suspicious_activity(self, event: SecurityEvent, anomaly_score: float):
         """Log suspicious activity detection"""
@@ -954,68 +1480,151 @@ class SecurityAuditLogger:
 
         suspicious_event.set_risk_assessment(SecurityLevel.HIGH, 85, anomaly_score)
 
-        self._event_buffer.append(suspicious_event)
+        self._add_to_buffer((suspicious_event,))
 
-    def _update_statistics(self, event: SecurityEvent):
-        """Update real-time statistics"""
-        with self._lock:
-            self._statistics['total_events'] += 1
-            self._statistics['events_by_type'][event.event_type.value] += 1
-            self._statistics['events_by_level'][event.security_level.value] += 1
+    def _add_to_buffer(self, events: Sequence[SecurityEvent]):
+        """Append events to the buffer and its search indexes (caller holds self._lock)"""
+        for event in events:
+            ordinal = next(self._event_ordinals)
+            self._buffer_ordinals.append(ordinal)
+            self._events_by_ordinal[ordinal] = event
+            self._ordinals_by_user[event.user_id].add(ordinal)
+            self._ordinals_by_type[event.event_type.value].add(ordinal)
+
+        self._event_buffer.extend(events)
+
+        # Events pushed out of the bounded buffer leave the indexes too
+        while len(self._buffer_ordinals) > len(self._event_buffer):
+            self._unindex_event(self._buffer_ordinals.popleft())
 
-            # Update rolling average risk score
-            total_risk = (self._statistics['average_risk_score'] *
-                          (self._statistics['total_events'] - 1) + event.risk_score)
-            self._statistics['average_risk_score'] = total_risk / self._statistics['total_events']
+    def _unindex_event(self, ordinal: int):
+        """Remove an evicted event from the search indexes"""
+        event = self._events_by_ordinal.pop(ordinal)
+
+        user_ordinals = self._ordinals_by_user[event.user_id]
+        user_ordinals.discard(ordinal)
+        if not user_ordinals:
+            del self._ordinals_by_user[event.user_id]
+
+        type_ordinals = self._ordinals_by_type[event.event_type.value]
+        type_ordinals.discard(ordinal)
+        if not type_ordinals:
+            del self._ordinals_by_type[event.event_type.value]
+
+    def _update_statistics(self, events: Sequence[SecurityEvent]):
+        """
+        Update real-time statistics for a batch of processed events
+
+        Counters are accumulated in locals and written back once per batch. The caller
+        holds self._lock, which _process_events takes once per batch anyway.
+
+        Args:
+            events (Sequence[SecurityEvent]): Events whose risk assessment is complete
+        """
+        statistics = self._statistics
+        events_by_type = statistics['events_by_type']
+        events_by_level = statistics['events_by_level']
+        total_events = statistics['total_events']
+        average_risk_score = statistics['average_risk_score']
+        high_risk_events = 0
+        anomalies = 0
+
+        # The midnight boundary for "today" is refreshed at most once a minute
+        if time.monotonic() - self._today_refresh_ts > 60:
+            midnight = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+            self._today_start_ns = _datetime_to_ns(midnight)
+            self._today_refresh_ts = time.monotonic()
+        today_start_ns = self._today_start_ns
+
+        for event in events:
+            total_events += 1
+            events_by_type[event.event_type.value] += 1
+            events_by_level[event.security_level.value] += 1
+
+            # Update rolling average risk score (seeded with the first event's score)
+            if total_events == 1:
+                average_risk_score = float(event.risk_score)
+            else:
+                average_risk_score += RISK_SCORE_EWMA_ALPHA * (
+                    event.risk_score - average_risk_score)
 
             # Count high risk events today
-            if event.security_level in [SecurityLevel.HIGH, SecurityLevel.CRITICAL]:
-                if event.timestamp.date() == datetime.now().date():
-                    self._statistics['high_risk_events_today'] += 1
+            if event.security_level in _HIGH_RISK_LEVELS and event.timestamp_ns >= today_start_ns:
+                high_risk_events += 1
 
             # Count anomalies
             if event.anomaly_score > 0.7:
-                self._statistics['anomalies_detected'] += 1
+                anomalies += 1
 
-    def _event_matches_filters(self, event: SecurityEvent, filters: Dict[str, Any]) -> bool:
-        """Check if event matches search filters"""
-        if 'user_id' in filters and event.user_id != filters['user_id']:
-            return False
+        statistics['total_events'] = total_events
+        statistics['average_risk_score'] = average_risk_score
+        statistics['high_risk_events_today'] += high_risk_events
+        statistics['anomalies_detected'] += anomalies
+
+    def _compile_event_filter(self, filters: Dict[str, Any]) -> Callable[[SecurityEvent], bool]:
+        """
+        Build a predicate that checks events against search filters
 
-        if 'event_type' in filters and event.event_type.value != filters['event_type']:
-            return False
+        Filter values are resolved once (dates parsed to nanoseconds, enum values to
+        their members) and only the filters actually present become checks, so the
+        predicate does no per-event dict lookups, date parsing or enum .value reads.
 
-        if 'security_level' in filters and event.security_level.value != filters['security_level']:
-            return False
+        Args:
+            filters (Dict): Search filters (user_id, event_type, security_level,
+                date_from, date_to)
+
+        Returns:
+            Callable[[SecurityEvent], bool]: True for events matching every filter
+        """
+        checks = []
+
+        if 'user_id' in filters:
+            user_id = filters['user_id']
+            checks.append(lambda event: event.user_id == user_id)
+
+        if 'event_type' in filters:
+            try:
+                event_type = SecurityEventType(filters['event_type'])
+            except ValueError:
+                # No event can carry an unknown type
+                return lambda event: False
+            checks.append(lambda event: event.event_type is event_type)
+
+        if 'security_level' in filters:
+            try:
+                security_level = SecurityLevel(filters['security_level'])
+            except ValueError:
+                return lambda event: False
+            checks.append(lambda event: event.security_level is security_level)
 
         if 'date_from' in filters:
-            date_from = datetime.fromisoformat(filters['date_from'])
-            if event.timestamp < date_from:
-                return False
+            date_from_ns = _datetime_to_ns(datetime.fromisoformat(filters['date_from']))
+            checks.append(lambda event: event.timestamp_ns >= date_from_ns)
 
         if 'date_to' in filters:
-            date_to = datetime.fromisoformat(filters['date_to'])
-            if event.timestamp > date_to:
-                return False
+            # Anything within date_to's microsecond still matches
+            date_to_end_ns = _datetime_to_ns(datetime.fromisoformat(filters['date_to'])) + 1000
+            checks.append(lambda event: event.timestamp_ns < date_to_end_ns)
+
+        if not checks:
+            return lambda event: True
+        if len(checks) == 1:
+            return checks[0]
+
+        def matches(event: SecurityEvent) -> bool:
+            for check in checks:
+                if not check(event):
+                    return False
+            return True
 
-        return True
+        return matches
 
     def _start_background_monitoring(self):
         """Start background monitoring thread"""
         def monitoring_worker():
-            while getattr(self, '_should_run_monitoring', True):
+            # Run every 5 minutes; shutdown() sets the event to wake the thread at once
+            while not self._monitoring_stop.wait(300):
                 try:
-                    time.sleep(300)  # Run every 5 minutes
-
-                    # Update statistics
-                    with self._lock:
-                        # Clean up old rate limit events
-                        now = datetime.now()
-                        for rate_limit in self._rate_limits.values():
-                            cutoff = now - timedelta(minutes=rate_limit['window_minutes'])
-                            rate_limit['events'] = deque(
-                                [t for t in rate_limit['events'] if t > cutoff])
-
                     # Perform periodic cleanup
                     if datetime.now().hour == 3:  # 3 AM daily cleanup
                         self.cleanup_old_events(days_to_keep=90)
@@ -1023,27 +1632,75 @@ class SecurityAuditLogger:
                 except Exception as e:
                     logger.error(f"Error in security monitoring thread: {e}")
 
-        self._should_run_monitoring = True
+        self._monitoring_stop = threading.Event()
         self._monitoring_thread = threading.Thread(target=monitoring_worker, daemon=True)
         self._monitoring_thread.start()
 
         logger.debug("Background security monitoring thread started")
 
+    def _resource_sampler_loop(self):
+        """Refresh the process resource snapshot until shutdown"""
+        while not self._sampler_stop.wait(RESOURCE_SAMPLE_INTERVAL_SECONDS):
+            _sample_process_resources()
+
     def shutdown(self):
         """Shutdown the security audit logger"""
         logger.info("Shutting down SecurityAuditLogger...")
 
+        # Stop resource sampler
+        self._sampler_stop.set()
+        self._sampler_thread.join(timeout=10)
+
         # Stop monitoring thread
-        self._should_run_monitoring = False
+        self._monitoring_stop.set()
         if self._monitoring_thread and self._monitoring_thread.is_alive():
             self._monitoring_thread.join(timeout=10)
 
+        # Process queued events and stop the ingest worker
+        if self._ingest_thread and self._ingest_thread.is_alive():
+            self._ingest_queue.put(_STOP_WORKER)
+            self._ingest_thread.join(timeout=10)
+        self._ingest_thread = None
+
+        # Events queued while the worker was stopping are processed here
+        while True:
+            try:
+                events = self._ingest_queue.get_nowait()
+            except queue.Empty:
+                break
+            if events is not _STOP_WORKER:
+                self._process_events(events)
+            self._ingest_queue.task_done()
+
+        # Write out queued events and stop the database writer; later events are written inline
+        if self._writer_thread and self._writer_thread.is_alive():
+            self._write_queue.put(_STOP_WORKER)
+            self._writer_thread.join(timeout=10)
+        self._writer_thread = None
+
+        # Rows queued while the writer was stopping are written here
+        while True:
+            try:
+                row = self._write_queue.get_nowait()
+            except queue.Empty:
+                break
+            if row is not _STOP_WORKER:
+                self._write_event_batch([row])
+            self._write_queue.task_done()
+
+        # Deliver queued alerts and stop the dispatcher; later alerts are delivered inline
+        if self._alert_thread and self._alert_thread.is_alive():
+            self._alert_queue.put(_STOP_WORKER)
+            self._alert_thread.join(timeout=10)
+        self._alert_thread = None
+
         # Final statistics
         final_stats = {
             'total_events_logged': self._statistics['total_events'],
             'events_in_buffer': len(self._event_buffer),
             'high_risk_events': self._statistics['high_risk_events_today'],
-            'anomalies_detected': self._statistics['anomalies_detected']
+            'anomalies_detected': self._statistics['anomalies_detected'],
+            'alerts_dropped': self._alerts_dropped
         }
 
         logger.info(f"SecurityAuditLogger shutdown complete - {final_stats}")
@@ -1102,6 +1759,9 @@ if __name__ == "__main__":
     )
     print(f"Logged settings change: {settings_event.event_id}")
 
+    # Wait for the events to be processed
+    audit_logger.flush()
+
     # Get statistics
     stats = audit_logger.get_security_statistics(user_id=1, hours=1)
     print(f"Security statistics: {stats}")
@@ -34,6 +34,7 @@ import logging
 import math
 import re
 import string
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
@@ -430,9 +431,7 @@ class AdvancedPasswordStrengthChecker:
             return 0.0
 
         # Character frequency analysis
-        char_counts = {}
-        for char in password:
-            char_counts[char] = char_counts.get(char, 0) + 1
+        char_counts = Counter(password)
 
         # Shannon entropy calculation
         entropy = 0.0
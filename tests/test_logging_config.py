@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests for Logging Configuration
+====================================
+
+Tests for the DEBUG ring buffer of the logging configuration including:
+- Buffering DEBUG records without writing them
+- Flushing the buffered context on errors and from log_exception
+- Keeping the buffer on a plain flush, as logging.shutdown() does at exit
+"""
+
+import logging
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Import modules under test
+from core import logging_config  # noqa: E402
+from core.logging_config import RingBufferHandler, log_exception  # noqa: E402
+
+
+class RecordingHandler(logging.Handler):
+    """Handler that keeps the messages of every record it handles"""
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self.messages = []
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+class TestRingBufferHandler(unittest.TestCase):
+    """Test cases for RingBufferHandler"""
+
+    def setUp(self):
+        """Set up a logger routed through a ring buffer and a recording target"""
+        self.target = RecordingHandler()
+        self.ring = RingBufferHandler(3, self.target)
+        self.logger = logging.getLogger(f"test_ring_{id(self)}")
+        self.logger.setLevel(logging.DEBUG)
+        self.logger.propagate = False
+        self.logger.addHandler(self.ring)
+
+    def tearDown(self):
+        """Detach the ring buffer"""
+        self.logger.removeHandler(self.ring)
+
+    def test_debug_records_are_buffered(self):
+        """Test that DEBUG records are kept in memory only"""
+        self.logger.debug("first")
+        self.logger.info("info is not buffered")
+
+        self.assertEqual(self.target.messages, [])
+        self.assertEqual([r.getMessage() for r in self.ring.buffer], ["first"])
+
+    def test_buffer_is_bounded(self):
+        """Test that only the most recent records are kept"""
+        for i in range(5):
+            self.logger.debug(f"debug {i}")
+
+        self.ring.flush_all()
+
+        self.assertEqual(self.target.messages, ["debug 2", "debug 3", "debug 4"])
+
+    def test_error_flushes_buffer(self):
+        """Test that an ERROR record writes the buffered context"""
+        self.logger.debug("context")
+        self.logger.warning("warning does not flush")
+        self.assertEqual(self.target.messages, [])
+
+        self.logger.error("failure")
+
+        self.assertEqual(self.target.messages, ["context"])
+        self.assertEqual(len(self.ring.buffer), 0)
+
+    def test_flush_keeps_buffer(self):
+        """Test that flush(), called by logging.shutdown() at exit, writes nothing"""
+        self.logger.debug("context")
+
+        self.ring.flush()
+
+        self.assertEqual(self.target.messages, [])
+        self.assertEqual(len(self.ring.buffer), 1)
+
+    def test_log_exception_flushes_installed_ring(self):
+        """Test that log_exception writes the buffered context first"""
+        self.logger.debug("context")
+
+        with mock.patch.object(logging_config, "_debug_ring", self.ring):
+            try:
+                raise ValueError("boom")
+            except ValueError as e:
+                log_exception(self.logger, e, "Operation failed")
+
+        self.assertEqual(self.target.messages, ["context"])
+
+
+if __name__ == "__main__":
+    unittest.main()
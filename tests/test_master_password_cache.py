@@ -0,0 +1,178 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests for the Master Password Cache
+========================================
+
+Tests for the per-session master password cache of PasswordManagerCore including:
+- Cached password lookups and wiping
+- Verified master password fingerprints
+- Clearing every session of a user while a verification is running
+"""
+
+import shutil
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Import modules under test
+from core.password_manager import PasswordManagerCore  # noqa: E402
+
+
+class TestMasterPasswordCache(unittest.TestCase):
+    """Test cases for master password caching and verification"""
+
+    master_password = "Test@Password123"
+
+    def setUp(self):
+        """Set up a password manager with two sessions of one user"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.password_manager = PasswordManagerCore(str(Path(self.temp_dir) / "test.db"))
+        auth_manager = self.password_manager.auth_manager
+        auth_manager.create_user_account("test_user", self.master_password)
+        self.session_id = auth_manager.authenticate_user("test_user", self.master_password)
+        self.other_session_id = auth_manager.authenticate_user("test_user", self.master_password)
+        self.user_id = auth_manager.validate_session(self.session_id).user_id
+
+        self.password_manager.add_password_entry(
+            self.session_id, "github.com", "bob", "secret", master_password=self.master_password
+        )
+
+    def tearDown(self):
+        """Shut down the password manager and remove the temporary database"""
+        self.password_manager.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def cache_entry(self, session_id):
+        """Live master password cache entry of a session, or None"""
+        password_cache, _, _ = self.password_manager._shard(session_id)
+        return password_cache.get(session_id)
+
+    def test_cached_master_password_roundtrip(self):
+        """Test that a cached master password is returned until it is cleared"""
+        self.assertEqual(
+            self.password_manager._get_cached_master_password(self.session_id),
+            self.master_password,
+        )
+
+        self.password_manager._clear_master_password_cache(self.session_id)
+
+        self.assertIsNone(self.password_manager._get_cached_master_password(self.session_id))
+
+    def test_verification_stores_fingerprint(self):
+        """Test that a verified password is remembered for the session"""
+        self.assertTrue(
+            self.password_manager._verify_master_password(self.session_id, self.master_password)
+        )
+        self.assertIn("verified_fingerprint", self.cache_entry(self.session_id))
+
+        with mock.patch.object(
+            self.password_manager, "_verify_master_password_slow"
+        ) as slow_verify:
+            self.assertTrue(
+                self.password_manager._verify_master_password(self.session_id, self.master_password)
+            )
+            slow_verify.assert_not_called()
+
+        self.assertFalse(self.password_manager._verify_master_password(self.session_id, "wrong"))
+
+    def test_clear_user_wipes_every_session(self):
+        """Test that clearing a user wipes the cached passwords of all its sessions"""
+        self.password_manager._cache_master_password(
+            self.other_session_id, self.master_password, self.user_id
+        )
+        self.password_manager._verify_master_password(self.other_session_id, self.master_password)
+        entry = self.cache_entry(self.other_session_id)
+        fingerprint = entry["verified_fingerprint"]
+
+        self.password_manager._clear_user_master_passwords(self.user_id)
+
+        self.assertIsNone(self.cache_entry(self.session_id))
+        self.assertIsNone(self.cache_entry(self.other_session_id))
+        self.assertIsNone(self.password_manager._get_cached_master_password(self.other_session_id))
+        self.assertNotIn("master_password", entry)
+        self.assertEqual(fingerprint, bytearray(len(fingerprint)))
+
+    def test_fingerprint_not_stored_after_concurrent_clear(self):
+        """Test that a verification overtaken by a clear does not store its fingerprint"""
+        self.password_manager._clear_master_password_cache(self.session_id)
+        slow_verify = self.password_manager._verify_master_password_slow
+
+        def verify_then_change_password(session, master_password):
+            verified = slow_verify(session, master_password)
+            # The master password changes while this verification is in flight, and
+            # the session caches a password again before the verification finishes
+            self.password_manager._clear_user_master_passwords(self.user_id)
+            self.password_manager._cache_master_password(
+                self.session_id, master_password, self.user_id
+            )
+            return verified
+
+        self.password_manager._cache_master_password(
+            self.session_id, self.master_password, self.user_id
+        )
+        live_entry = self.cache_entry(self.session_id)
+        with mock.patch.object(
+            self.password_manager,
+            "_verify_master_password_slow",
+            side_effect=verify_then_change_password,
+        ):
+            self.password_manager._verify_master_password(self.session_id, self.master_password)
+
+        self.assertNotIn("verified_fingerprint", live_entry)
+        self.assertNotIn("verified_fingerprint", self.cache_entry(self.session_id))
+
+    def test_fingerprint_not_stored_once_generation_changes(self):
+        """Test that a clear that has not reached the session's shard yet still wins"""
+        entry = self.cache_entry(self.session_id)
+        generations = self.password_manager._master_password_generations
+        slow_verify = self.password_manager._verify_master_password_slow
+
+        def verify_while_clear_starts(session, master_password):
+            verified = slow_verify(session, master_password)
+            # A concurrent clear bumps the generation before walking the shards
+            generations[self.user_id] = generations.get(self.user_id, 0) + 1
+            return verified
+
+        with mock.patch.object(
+            self.password_manager,
+            "_verify_master_password_slow",
+            side_effect=verify_while_clear_starts,
+        ):
+            self.assertTrue(
+                self.password_manager._verify_master_password(self.session_id, self.master_password)
+            )
+
+        self.assertIs(self.cache_entry(self.session_id), entry)
+        self.assertNotIn("verified_fingerprint", entry)
+
+    def test_fingerprint_not_stored_for_replaced_entry(self):
+        """Test that a verification does not store a fingerprint in a removed entry"""
+        self.password_manager._clear_master_password_cache(self.session_id)
+        self.password_manager._cache_master_password(
+            self.session_id, self.master_password, self.user_id
+        )
+        entry = self.cache_entry(self.session_id)
+        slow_verify = self.password_manager._verify_master_password_slow
+
+        def verify_then_clear(session, master_password):
+            verified = slow_verify(session, master_password)
+            self.password_manager._clear_master_password_cache(self.session_id)
+            return verified
+
+        with mock.patch.object(
+            self.password_manager, "_verify_master_password_slow", side_effect=verify_then_clear
+        ):
+            self.assertTrue(
+                self.password_manager._verify_master_password(self.session_id, self.master_password)
+            )
+
+        self.assertNotIn("verified_fingerprint", entry)
+
+
+if __name__ == "__main__":
+    unittest.main()
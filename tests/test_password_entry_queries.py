@@ -0,0 +1,406 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests for Batched Password Entry Operations
+================================================
+
+Tests for the batched and aggregated password entry queries including:
+- Bulk insertion with duplicate detection
+- Retrieval of entries by ID across parameter chunks
+- SQL aggregates used by the password statistics
+- Metadata-only search results
+- Literal substring matching of search filters
+- Building entries from database rows
+"""
+
+import shutil
+import sqlite3
+import sys
+import tempfile
+import unittest
+from datetime import datetime
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Import modules under test
+from core.database import DatabaseManager  # noqa: E402
+from core.password_manager import (  # noqa: E402
+    DuplicateEntryError,
+    PasswordEntry,
+    PasswordEntrySummary,
+    PasswordManagerCore,
+    SearchCriteria,
+)
+
+
+def entry_row(website, username, remarks=""):
+    """Build an (entry_name, website, username, encrypted_password, remarks, is_favorite) row"""
+    return (None, website, username, b"encrypted", remarks, False)
+
+
+class TestDatabaseBatchedEntries(unittest.TestCase):
+    """Test cases for the batched DatabaseManager entry methods"""
+
+    def setUp(self):
+        """Set up a temporary database with two users"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_manager = DatabaseManager(str(Path(self.temp_dir) / "test.db"))
+        self.user_id = self.db_manager.create_user("test_user", "Test@Password123")
+        self.other_user_id = self.db_manager.create_user("other_user", "Other@Password123")
+
+    def tearDown(self):
+        """Remove the temporary database"""
+        self.db_manager.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def stored_entries(self, user_id=None):
+        """(website, username) of a user's entries in insertion order"""
+        entries = self.db_manager.get_password_entries(user_id or self.user_id)
+        return [(e["website"], e["username"]) for e in sorted(entries, key=lambda e: e["entry_id"])]
+
+    def test_add_password_entries_skips_duplicates(self):
+        """Test that duplicates against existing rows and within the batch are skipped"""
+        self.db_manager.add_password_entry(self.user_id, "github.com", "bob", b"encrypted")
+
+        added = self.db_manager.add_password_entries(
+            self.user_id,
+            [
+                entry_row("GitHub.com", "BOB"),
+                entry_row("gitlab.com", "carol"),
+                entry_row(" GitLab.com ", "Carol"),
+                entry_row("example.org", "dave"),
+            ],
+            reject_duplicates=True,
+        )
+
+        self.assertEqual(added, 2)
+        self.assertEqual(
+            self.stored_entries(),
+            [("github.com", "bob"), ("gitlab.com", "carol"), ("example.org", "dave")],
+        )
+
+    def test_add_password_entries_without_duplicate_check(self):
+        """Test that every row is inserted when duplicates are allowed"""
+        added = self.db_manager.add_password_entries(
+            self.user_id, [entry_row("github.com", "bob"), entry_row("github.com", "bob")]
+        )
+
+        self.assertEqual(added, 2)
+        self.assertEqual(len(self.stored_entries()), 2)
+
+    def test_add_password_entries_ids_are_retrievable(self):
+        """Test that the inserted entries get distinct IDs owned by the user"""
+        self.db_manager.add_password_entries(
+            self.user_id, [entry_row(f"site{i}.com", "bob") for i in range(5)]
+        )
+
+        entry_ids = [e["entry_id"] for e in self.db_manager.get_password_entries(self.user_id)]
+        self.assertEqual(len(set(entry_ids)), 5)
+
+        fetched = self.db_manager.get_password_entries_by_ids(self.user_id, entry_ids)
+        self.assertEqual(sorted(e["entry_id"] for e in fetched), sorted(entry_ids))
+
+    def test_add_password_entries_empty_batch(self):
+        """Test that an empty batch inserts nothing"""
+        self.assertEqual(self.db_manager.add_password_entries(self.user_id, []), 0)
+
+    def test_add_password_entries_rejects_invalid_rows(self):
+        """Test that an invalid row fails the whole batch"""
+        with self.assertRaises(ValueError):
+            self.db_manager.add_password_entries(
+                self.user_id, [entry_row("github.com", "bob"), entry_row("", "carol")]
+            )
+
+        self.assertEqual(self.stored_entries(), [])
+
+    def test_add_password_entry_returns_none_for_duplicate(self):
+        """Test that a rejected duplicate returns None instead of raising"""
+        entry_id = self.db_manager.add_password_entry(
+            self.user_id, "github.com", "bob", b"encrypted", reject_duplicates=True
+        )
+        duplicate_id = self.db_manager.add_password_entry(
+            self.user_id, "GitHub.com", "Bob", b"encrypted", reject_duplicates=True
+        )
+
+        self.assertIsInstance(entry_id, int)
+        self.assertIsNone(duplicate_id)
+
+    def test_get_password_entries_by_ids_across_chunks(self):
+        """Test retrieval of more IDs than fit in one query"""
+        self.db_manager.add_password_entries(
+            self.user_id, [entry_row(f"site{i}.com", "bob") for i in range(1200)]
+        )
+        self.db_manager.add_password_entry(self.other_user_id, "github.com", "eve", b"encrypted")
+
+        entry_ids = [e["entry_id"] for e in self.db_manager.get_password_entries(self.user_id)]
+        other_ids = [
+            e["entry_id"] for e in self.db_manager.get_password_entries(self.other_user_id)
+        ]
+
+        # Repeated IDs and IDs of another user must not show up in the result
+        requested = entry_ids + entry_ids[:10] + other_ids
+        fetched = self.db_manager.get_password_entries_by_ids(self.user_id, requested)
+
+        self.assertEqual(len(fetched), 1200)
+        self.assertEqual(sorted(e["entry_id"] for e in fetched), sorted(entry_ids))
+        self.assertIn("password_encrypted", fetched[0])
+
+    def test_get_password_entries_by_ids_empty(self):
+        """Test that no IDs returns no entries"""
+        self.assertEqual(self.db_manager.get_password_entries_by_ids(self.user_id, []), [])
+
+    def test_get_password_entry_aggregates(self):
+        """Test website, username and recency aggregates"""
+        self.db_manager.add_password_entries(
+            self.user_id,
+            [
+                entry_row("GitHub.com", "bob"),
+                entry_row("github.com", "Carol"),
+                entry_row("gitlab.com", "BOB"),
+                entry_row("example.org", "carol"),
+                entry_row("example.org", "dave"),
+            ],
+        )
+        self.db_manager.add_password_entry(self.other_user_id, "github.com", "bob", b"encrypted")
+
+        aggregates = self.db_manager.get_password_entry_aggregates(self.user_id)
+
+        self.assertEqual(
+            aggregates["website_counts"],
+            [("example.org", 2), ("github.com", 2), ("gitlab.com", 1)],
+        )
+        self.assertEqual(aggregates["top_usernames"], [("bob", 2), ("carol", 2), ("dave", 1)])
+        self.assertEqual(aggregates["duplicate_usernames"], 2)
+        self.assertEqual(aggregates["recent_entries"], 5)
+
+    def test_get_password_entry_aggregates_without_entries(self):
+        """Test aggregates for a user without entries"""
+        aggregates = self.db_manager.get_password_entry_aggregates(self.user_id)
+
+        self.assertEqual(aggregates["website_counts"], [])
+        self.assertEqual(aggregates["top_usernames"], [])
+        self.assertEqual(aggregates["duplicate_usernames"], 0)
+        self.assertEqual(aggregates["recent_entries"], 0)
+
+    def test_advanced_search_matches_wildcards_literally(self):
+        """Test that %, _ and \\ in username and remarks filters are not LIKE wildcards"""
+        self.db_manager.add_password_entries(
+            self.user_id,
+            [
+                entry_row("a.com", "bob_smith", "100% done"),
+                entry_row("b.com", "bobXsmith", "100 done"),
+                entry_row("c.com", "DOMAIN\\Bob", "path c:\\temp"),
+            ],
+        )
+
+        def usernames(**filters):
+            entries, _ = self.db_manager.get_password_entries_advanced(
+                self.user_id, order_by="website", **filters
+            )
+            return [entry["username"] for entry in entries]
+
+        self.assertEqual(usernames(username="b_s"), ["bob_smith"])
+        self.assertEqual(usernames(remarks="0%"), ["bob_smith"])
+        self.assertEqual(usernames(username="n\\b"), ["DOMAIN\\Bob"])
+        self.assertEqual(usernames(remarks=":\\T"), ["DOMAIN\\Bob"])
+        self.assertEqual(usernames(username="BOB"), ["bob_smith", "bobXsmith", "DOMAIN\\Bob"])
+
+
+class TestPasswordManagerBatchedEntries(unittest.TestCase):
+    """Test cases for bulk adds and metadata-only searches through PasswordManagerCore"""
+
+    master_password = "Test@Password123"
+
+    def setUp(self):
+        """Set up a password manager with a logged-in user"""
+        self.temp_dir = tempfile.mkdtemp()
+        self.password_manager = PasswordManagerCore(str(Path(self.temp_dir) / "test.db"))
+        self.password_manager.auth_manager.create_user_account("test_user", self.master_password)
+        self.session_id = self.password_manager.auth_manager.authenticate_user(
+            "test_user", self.master_password
+        )
+
+    def tearDown(self):
+        """Shut down the password manager and remove the temporary database"""
+        self.password_manager.shutdown()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_bulk_add_password_entries(self):
+        """Test that a bulk add skips duplicates and stores decryptable entries"""
+        self.password_manager.add_password_entry(
+            self.session_id, "github.com", "bob", "first", master_password=self.master_password
+        )
+
+        added = self.password_manager.bulk_add_password_entries(
+            self.session_id,
+            [
+                {"website": "GitHub.com", "username": "Bob", "password": "skipped"},
+                {"website": "gitlab.com", "username": "carol", "password": "second"},
+                {"website": "GITLAB.com", "username": "CAROL", "password": "skipped"},
+                {
+                    "website": "example.org",
+                    "username": "dave",
+                    "password": "third",
+                    "remarks": " note ",
+                    "is_favorite": True,
+                },
+            ],
+            master_password=self.master_password,
+        )
+
+        self.assertEqual(added, 2)
+
+        entries = self.password_manager.search_password_entries(
+            self.session_id,
+            include_passwords=True,
+            master_password=self.master_password,
+        )
+        by_website = {entry.website: entry for entry in entries}
+        self.assertEqual(
+            {website: entry.password for website, entry in by_website.items()},
+            {"github.com": "first", "gitlab.com": "second", "example.org": "third"},
+        )
+        self.assertEqual(by_website["example.org"].remarks, "note")
+        self.assertTrue(by_website["example.org"].is_favorite)
+
+        # Bulk-added entries are retrievable by the IDs the search reported
+        entry = self.password_manager.get_password_entry(
+            self.session_id, by_website["gitlab.com"].entry_id, self.master_password
+        )
+        self.assertEqual(entry.password, "second")
+
+    def test_add_password_entry_duplicate(self):
+        """Test that a duplicate entry raises DuplicateEntryError"""
+        self.password_manager.add_password_entry(
+            self.session_id, "github.com", "bob", "first", master_password=self.master_password
+        )
+
+        with self.assertRaises(DuplicateEntryError):
+            self.password_manager.add_password_entry(
+                self.session_id,
+                " GitHub.com ",
+                "BOB",
+                "second",
+                master_password=self.master_password,
+            )
+
+    def test_search_metadata_only(self):
+        """Test that metadata-only searches return summaries and are cached apart"""
+        for website, username in (("github.com", "bob"), ("gitlab.com", "carol")):
+            self.password_manager.add_password_entry(
+                self.session_id, website, username, "secret", master_password=self.master_password
+            )
+
+        criteria = SearchCriteria(website="git", sort_by="website")
+        summaries = self.password_manager.search_password_entries(
+            self.session_id, criteria, metadata_only=True
+        )
+
+        self.assertTrue(all(isinstance(s, PasswordEntrySummary) for s in summaries))
+        self.assertEqual(
+            [(s.website, s.username, bool(s.is_favorite)) for s in summaries],
+            [("github.com", "bob", False), ("gitlab.com", "carol", False)],
+        )
+
+        # A repeated search is served from the cache, as a list of its own
+        expected = list(summaries)
+        summaries.reverse()
+        hits = self.password_manager.get_cache_metrics()["hits"]
+        cached = self.password_manager.search_password_entries(
+            self.session_id, criteria, metadata_only=True
+        )
+        self.assertEqual(self.password_manager.get_cache_metrics()["hits"], hits + 1)
+        self.assertEqual(cached, expected)
+
+        cached.clear()
+        self.assertEqual(
+            self.password_manager.search_password_entries(
+                self.session_id, criteria, metadata_only=True
+            ),
+            expected,
+        )
+
+        # Full entries for the same criteria use a separate cache key
+        entries = self.password_manager.search_password_entries(self.session_id, criteria)
+        self.assertTrue(all(isinstance(e, PasswordEntry) for e in entries))
+        self.assertEqual([e.entry_id for e in entries], [s.entry_id for s in expected])
+
+    def test_search_metadata_only_ignores_include_passwords(self):
+        """Test that metadata-only searches never decrypt passwords"""
+        self.password_manager.add_password_entry(
+            self.session_id, "github.com", "bob", "secret", master_password=self.master_password
+        )
+
+        summaries = self.password_manager.search_password_entries(
+            self.session_id,
+            include_passwords=True,
+            master_password=self.master_password,
+            metadata_only=True,
+        )
+
+        self.assertEqual(len(summaries), 1)
+        self.assertNotIn("password", PasswordEntrySummary._fields)
+
+
+class TestPasswordEntryFromDbRow(unittest.TestCase):
+    """Test cases for PasswordEntry.from_db_row"""
+
+    def db_row(self, **overrides):
+        """A password entry row as returned by the database layer"""
+        row = {
+            "entry_id": 1,
+            "entry_name": None,
+            "website": "github.com",
+            "username": "bob",
+            "remarks": "",
+            "created_at": datetime(2024, 1, 2, 3, 4, 5),
+            "modified_at": datetime(2024, 2, 3, 4, 5, 6),
+            "is_favorite": 1,
+        }
+        row.update(overrides)
+        return row
+
+    def test_from_db_row_keeps_stored_timestamps(self):
+        """Test that stored timestamps and fields are copied from the row"""
+        entry = PasswordEntry.from_db_row(self.db_row(), "secret")
+
+        self.assertEqual(entry.created_at, datetime(2024, 1, 2, 3, 4, 5))
+        self.assertEqual(entry.modified_at, datetime(2024, 2, 3, 4, 5, 6))
+        self.assertEqual(entry.password, "secret")
+        self.assertIs(entry.is_favorite, True)
+        self.assertEqual(entry.tags, [])
+
+    def test_from_db_row_defaults_missing_timestamps(self):
+        """Test that NULL timestamps get the same defaults as PasswordEntry()"""
+        entry = PasswordEntry.from_db_row(self.db_row(created_at=None, modified_at=None))
+
+        self.assertIsInstance(entry.created_at, datetime)
+        self.assertEqual(entry.modified_at, entry.created_at)
+
+        entry = PasswordEntry.from_db_row(self.db_row(modified_at=None))
+        self.assertEqual(entry.modified_at, datetime(2024, 1, 2, 3, 4, 5))
+
+    def test_search_with_null_timestamps(self):
+        """Test that legacy rows without timestamps are returned with datetimes"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            db_path = str(Path(temp_dir) / "test.db")
+            db_manager = DatabaseManager(db_path)
+            user_id = db_manager.create_user("test_user", "Test@Password123")
+            db_manager.add_password_entry(user_id, "github.com", "bob", b"encrypted")
+
+            with sqlite3.connect(db_path) as conn:
+                conn.execute("UPDATE passwords SET created_at = NULL, modified_at = NULL")
+
+            rows, _ = db_manager.get_password_entries_advanced(user_id, count_total=False)
+            entry = PasswordEntry.from_db_row(rows[0])
+
+            self.assertIsInstance(entry.created_at, datetime)
+            self.assertIsInstance(entry.modified_at, datetime)
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    unittest.main()
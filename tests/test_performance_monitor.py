@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests for Performance Monitor
+==================================
+
+Tests for the monitor() decorator of the performance monitor including:
+- Recording decorated calls with and without detailed tracking
+- Changing the tracking settings after functions were decorated
+- Swapping the settings snapshot read by decorated functions
+"""
+
+import sys
+import unittest
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Import modules under test
+from core.performance_monitor import PerformanceMonitor  # noqa: E402
+
+
+class TestPerformanceMonitorDecorator(unittest.TestCase):
+    """Test cases for monitor() decorated functions"""
+
+    def setUp(self):
+        """Set up a monitor and a function decorated with it"""
+        self.monitor = PerformanceMonitor(max_history=10)
+
+        @self.monitor.monitor("operation")
+        def operation(value):
+            return value * 2
+
+        self.operation = operation
+
+    def call_count(self):
+        """Number of recorded calls of the decorated function"""
+        return self.monitor.get_operation_stats("operation")["count"]
+
+    def test_detailed_tracking_records_history(self):
+        """Test that decorated calls are counted and kept in the history"""
+        self.assertEqual(self.operation(2), 4)
+
+        self.assertEqual(self.call_count(), 1)
+        self.assertEqual(len(self.monitor.get_recent_operations()), 1)
+
+    def test_disabling_detailed_tracking_after_decoration(self):
+        """Test that already decorated functions stop filling the history"""
+        self.monitor.enable_detailed_tracking = False
+
+        self.operation(1)
+        op_id = self.monitor.start_operation("manual")
+
+        self.assertIsNone(self.monitor.end_operation(op_id))
+        self.assertEqual(self.call_count(), 1)
+        self.assertEqual(self.monitor.get_recent_operations(), [])
+
+    def test_enabling_detailed_tracking_after_decoration(self):
+        """Test that end_operation records metrics once detailed tracking is enabled"""
+        monitor = PerformanceMonitor(enable_detailed_tracking=False)
+        monitor.enable_detailed_tracking = True
+
+        op_id = monitor.start_operation("manual")
+        metrics = monitor.end_operation(op_id)
+
+        self.assertIsNotNone(metrics)
+        self.assertEqual(monitor.get_recent_operations(), [metrics])
+
+    def test_disabled_monitor_skips_recording(self):
+        """Test that calls are not measured while the monitor is disabled"""
+        self.monitor.enabled = False
+        self.assertEqual(self.operation(3), 6)
+
+        self.monitor.enabled = True
+        self.operation(3)
+
+        self.assertEqual(self.call_count(), 1)
+
+    def test_sample_rate_after_decoration(self):
+        """Test that a zero sample rate skips recording of already decorated functions"""
+        self.monitor.sample_rate = 0.0
+        self.operation(1)
+
+        self.assertEqual(self.call_count(), 0)
+
+    def test_settings_changes_replace_snapshot(self):
+        """Test that each settings change swaps in a new snapshot keeping the others"""
+        settings = self.monitor._settings
+
+        self.monitor.sample_rate = 0.5
+
+        self.assertIsNot(self.monitor._settings, settings)
+        self.assertEqual(settings.sample_rate, 1.0)
+        self.assertTrue(self.monitor.enabled)
+        self.assertTrue(self.monitor.enable_detailed_tracking)
+        self.assertEqual(self.monitor.sample_rate, 0.5)
+
+
+if __name__ == "__main__":
+    unittest.main()
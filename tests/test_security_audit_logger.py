@@ -0,0 +1,224 @@
+# -*- coding: utf-8 -*-
+"""
+Unit Tests for Security Audit Logger
+====================================
+
+Tests for the queued event pipeline of the security audit logger including:
+- Flushing and ordering of database writes
+- Draining queued events on shutdown and inline processing afterwards
+- Bulk logging parity with single-event logging
+- Shedding alerts when the alert queue is full
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+from unittest import mock
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+# Import modules under test
+from core import security_audit_logger  # noqa: E402
+from core.security_audit_logger import (  # noqa: E402
+    EventResult,
+    SecurityAuditLogger,
+    SecurityEventType,
+)
+
+
+class RecordingDatabase:
+    """Stand-in database manager that records every security event row it is given"""
+
+    def __init__(self):
+        self.rows = []
+
+    def log_security_events(self, rows):
+        self.rows.extend(rows)
+        return len(rows)
+
+
+def build_event_specs():
+    """Event specs mixing users, results and alerting event types"""
+    specs = []
+    for i in range(40):
+        specs.append(
+            (SecurityEventType.PASSWORD_VIEWED, 1, f"session-{i % 3}", EventResult.SUCCESS, i)
+        )
+    for _ in range(6):
+        specs.append((SecurityEventType.LOGIN_FAILURE, 2, "session-b", EventResult.FAILURE))
+    specs.append((SecurityEventType.ENCRYPTION_ERROR, 3, "session-c", EventResult.ERROR))
+    specs.append((SecurityEventType.PASSWORD_DELETED, 1, "session-0", EventResult.SUCCESS, 7))
+    return specs
+
+
+class TestSecurityAuditLoggerPipeline(unittest.TestCase):
+    """Test cases for queuing, flushing and shutdown of the audit logger"""
+
+    def setUp(self):
+        """Set up a logger backed by a recording database"""
+        self.database = RecordingDatabase()
+        self.audit_logger = SecurityAuditLogger(self.database)
+
+    def tearDown(self):
+        """Stop the logger's worker threads"""
+        self.audit_logger.shutdown()
+
+    def test_flush_writes_events_in_logged_order(self):
+        """Test that flush returns only after every event is written, in order"""
+        for entry_id in range(200):
+            self.audit_logger.log_event(
+                SecurityEventType.PASSWORD_VIEWED, 1, "session", target_entry_id=entry_id
+            )
+
+        self.audit_logger.flush()
+
+        self.assertEqual([row[4] for row in self.database.rows], list(range(200)))
+
+    def test_flush_completes_risk_assessment(self):
+        """Test that events are assessed once flush returns"""
+        event = self.audit_logger.log_event(
+            SecurityEventType.ENCRYPTION_ERROR, 1, "session", EventResult.ERROR
+        )
+
+        self.audit_logger.flush()
+
+        self.assertGreater(event.risk_score, 0)
+        self.assertEqual(self.database.rows[-1][8], event.risk_score)
+
+    def test_shutdown_drains_queued_events(self):
+        """Test that shutdown processes and writes events still in the queues"""
+        events = self.audit_logger.log_events_bulk(
+            (SecurityEventType.PASSWORD_VIEWED, 1, "session", EventResult.SUCCESS, entry_id)
+            for entry_id in range(500)
+        )
+
+        self.audit_logger.shutdown()
+
+        self.assertEqual(len(self.database.rows), 500)
+        self.assertEqual(self.audit_logger.get_security_statistics()["total_events"], 500)
+        self.assertTrue(all(event.risk_score > 0 for event in events))
+
+    def test_events_after_shutdown_are_written_inline(self):
+        """Test that events logged after shutdown are processed and written at once"""
+        self.audit_logger.shutdown()
+
+        event = self.audit_logger.log_event(
+            SecurityEventType.ENCRYPTION_ERROR, 1, "session", EventResult.ERROR
+        )
+
+        self.assertEqual(len(self.database.rows), 1)
+        self.assertEqual(self.database.rows[0][2], SecurityEventType.ENCRYPTION_ERROR.value)
+        self.assertGreater(event.risk_score, 0)
+        self.assertEqual(self.audit_logger._write_queue.qsize(), 0)
+
+    def test_settings_change_context_is_set_before_processing(self):
+        """Test that a settings change carries its change context when written"""
+        event = self.audit_logger.log_settings_change(
+            1, "session", "security", "timeout", 5, 30, affects_security=True
+        )
+
+        self.audit_logger.flush()
+
+        self.assertEqual(event.affected_fields, ["timeout"])
+        self.assertEqual(event.old_values, {"timeout": 5})
+        self.assertEqual(event.new_values, {"timeout": 30})
+        self.assertEqual(event.event_type, SecurityEventType.SECURITY_SETTINGS_CHANGED)
+
+
+class TestSecurityAuditLoggerBulk(unittest.TestCase):
+    """Test cases comparing log_events_bulk against log_event"""
+
+    def setUp(self):
+        """Set up one logger for single events and one for bulk logging"""
+        self.single_logger = SecurityAuditLogger()
+        self.bulk_logger = SecurityAuditLogger()
+
+    def tearDown(self):
+        """Stop both loggers"""
+        self.single_logger.shutdown()
+        self.bulk_logger.shutdown()
+
+    @staticmethod
+    def comparable_statistics(audit_logger, user_id=None):
+        """Statistics with the timestamped high risk event list reduced to its scores"""
+        stats = audit_logger.get_security_statistics(user_id=user_id)
+        stats["high_risk_events"] = [event["risk_score"] for event in stats["high_risk_events"]]
+        return stats
+
+    def test_bulk_matches_single_event_logging(self):
+        """Test that bulk logging yields the same risk and statistics as log_event"""
+        specs = build_event_specs()
+
+        single_events = [self.single_logger.log_event(*spec) for spec in specs]
+        bulk_events = self.bulk_logger.log_events_bulk(specs)
+        self.single_logger.flush()
+        self.bulk_logger.flush()
+
+        def assessment(event):
+            return (event.event_type, event.security_level, event.risk_score, event.anomaly_score)
+
+        self.assertEqual(
+            [assessment(e) for e in bulk_events], [assessment(e) for e in single_events]
+        )
+        for user_id in (None, 1, 2, 3):
+            self.assertEqual(
+                self.comparable_statistics(self.bulk_logger, user_id),
+                self.comparable_statistics(self.single_logger, user_id),
+            )
+
+    def test_bulk_with_no_events(self):
+        """Test that an empty batch logs nothing"""
+        self.assertEqual(self.bulk_logger.log_events_bulk([]), [])
+        self.bulk_logger.flush()
+        self.assertEqual(self.bulk_logger.get_security_statistics()["total_events"], 0)
+
+
+class TestSecurityAuditLoggerAlerts(unittest.TestCase):
+    """Test cases for real-time alert delivery"""
+
+    def test_alerts_dropped_when_queue_full(self):
+        """Test that alerts are shed instead of blocking when the alert queue is full"""
+        release = threading.Event()
+        delivered = []
+
+        def slow_callback(event):
+            release.wait(timeout=10)
+            delivered.append(event)
+
+        with mock.patch.object(security_audit_logger, "ALERT_QUEUE_SIZE", 2):
+            audit_logger = SecurityAuditLogger()
+        try:
+            audit_logger.add_alert_callback(slow_callback)
+            for _ in range(10):
+                audit_logger.log_event(
+                    SecurityEventType.ENCRYPTION_ERROR, 1, "session", EventResult.ERROR
+                )
+
+            # Wait for processing only; the alert queue stays blocked by the callback
+            audit_logger._ingest_queue.join()
+            dropped = audit_logger._alerts_dropped
+            self.assertGreater(dropped, 0)
+
+            release.set()
+            audit_logger.flush()
+            self.assertEqual(len(delivered) + dropped, 10)
+        finally:
+            release.set()
+            audit_logger.shutdown()
+
+    def test_alerts_delivered_inline_after_shutdown(self):
+        """Test that alerts raised after shutdown still reach the callbacks"""
+        delivered = []
+        audit_logger = SecurityAuditLogger()
+        audit_logger.add_alert_callback(delivered.append)
+        audit_logger.shutdown()
+
+        event = audit_logger.log_event(SecurityEventType.ACCOUNT_LOCKED, 1, "session")
+
+        self.assertEqual(delivered, [event])
+
+
+if __name__ == "__main__":
+    unittest.main()